@@ -0,0 +1,98 @@
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List, Sequence
+
+POM_NAMESPACE: str = "http://maven.apache.org/POM/4.0.0"
+
+
+def measure(name: str, action: Callable[[], None], repetitions: int = 5) -> float:
+    durations: List[float] = []
+    for _ in range(repetitions):
+        start: float = time.perf_counter()
+        action()
+        durations.append(time.perf_counter() - start)
+
+    best: float = min(durations)
+    print(f"{name}: best of {repetitions}: {best * 1000:.2f} ms")
+
+    return best
+
+
+def measure_peak_memory(name: str, action: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        action()
+        _, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    print(f"{name}: peak memory: {peak / 1024:.0f} KiB")
+
+    return peak
+
+
+def write_pom(
+    pom: Path,
+    artifact_id: str,
+    dependency_count: int = 0,
+    modules: Sequence[str] = (),
+    parent_artifact_id: str = "parent",
+    reporting_plugin_count: int = 0,
+) -> Path:
+    lines: List[str] = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<project xmlns="{POM_NAMESPACE}">',
+        "    <modelVersion>4.0.0</modelVersion>",
+        "    <parent>",
+        "        <groupId>com.example</groupId>",
+        f"        <artifactId>{parent_artifact_id}</artifactId>",
+        "        <version>1.0.0</version>",
+        "    </parent>",
+        f"    <artifactId>{artifact_id}</artifactId>",
+        "    <properties>",
+        "        <dependency.version>1.0.0</dependency.version>",
+        "    </properties>",
+    ]
+
+    if len(modules) > 0:
+        lines.append("    <modules>")
+        lines.extend([f"        <module>{module}</module>" for module in modules])
+        lines.append("    </modules>")
+
+    lines.append("    <dependencies>")
+    for index in range(dependency_count):
+        lines.extend(
+            [
+                "        <dependency>",
+                "            <groupId>com.example</groupId>",
+                f"            <artifactId>dependency-{index}</artifactId>",
+                "            <version>${dependency.version}</version>",
+                "        </dependency>",
+            ]
+        )
+    lines.append("    </dependencies>")
+
+    if reporting_plugin_count > 0:
+        lines.append("    <reporting>")
+        lines.append("        <plugins>")
+        for index in range(reporting_plugin_count):
+            lines.extend(
+                [
+                    "            <plugin>",
+                    "                <groupId>com.example</groupId>",
+                    f"                <artifactId>reporting-plugin-{index}</artifactId>",
+                    "                <version>1.0.0</version>",
+                    "            </plugin>",
+                ]
+            )
+        lines.append("        </plugins>")
+        lines.append("    </reporting>")
+
+    lines.append("</project>")
+
+    pom.parent.mkdir(parents=True, exist_ok=True)
+    pom.write_text("\n".join(lines) + "\n", encoding="UTF-8")
+
+    return pom
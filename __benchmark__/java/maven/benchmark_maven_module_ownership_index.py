@@ -0,0 +1,56 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List, Set
+
+from __benchmark__.benchmark_utility import measure, write_pom
+from java.maven.maven_module_ownership_index import MavenModuleOwnershipIndex
+from java.maven.xml_maven_module_reader import XmlMavenModuleReader
+from utility.file_cache import FileCache
+
+MODULE_COUNT: int = 200
+FILES_PER_MODULE: int = 100
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory:
+        modules: List[str] = [f"module-{index}" for index in range(MODULE_COUNT)]
+        root_pom: Path = write_pom(
+            Path(directory, "pom.xml"), "parent", modules=modules
+        )
+        for module in modules:
+            write_pom(Path(directory, module, "pom.xml"), module)
+
+        # the changed files are nested a few levels below their module, just like Java sources
+        files: List[Path] = [
+            Path(directory, m, "src", "main", "java", "com", "example", f"C{i}.java")
+            for m in modules
+            for i in range(FILES_PER_MODULE)
+        ]
+        cache: FileCache = FileCache(Path(directory, "cache"))
+        MavenModuleOwnershipIndex.load(root_pom, cache, XmlMavenModuleReader())
+
+        def find_poms() -> None:
+            poms: Set[Path] = set()
+            for file in files:
+                parent: Path = file.parent
+                while parent != Path(directory):
+                    pom: Path = Path(parent, "pom.xml")
+                    if pom.exists() and pom.is_file():
+                        poms.add(pom)
+                        break
+
+                    parent = parent.parent
+
+        def find_owners() -> None:
+            MavenModuleOwnershipIndex.load(root_pom, cache).find_owners(files)
+
+        measure(
+            f"find POMs of {len(files)} files by probing the file system", find_poms
+        )
+        measure(
+            f"find owners of {len(files)} files with the persisted index", find_owners
+        )
+
+
+if __name__ == "__main__":
+    main()
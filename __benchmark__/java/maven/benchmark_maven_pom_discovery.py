@@ -0,0 +1,45 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+
+from __benchmark__.benchmark_utility import measure, write_pom
+from java.maven.maven_pom_discovery import MavenPomDiscovery
+
+MODULE_COUNT: int = 200
+BUILD_OUTPUT_FILE_COUNT: int = 200
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory:
+        # every module has a build output directory with many (nested) files, just like after a build
+        for index in range(MODULE_COUNT):
+            module: Path = Path(directory, f"module-{index}")
+            write_pom(Path(module, "pom.xml"), f"module-{index}")
+            Path(module, "src", "main", "java").mkdir(parents=True)
+            for package in range(BUILD_OUTPUT_FILE_COUNT // 20):
+                classes: Path = Path(module, "target", "classes", f"package{package}")
+                classes.mkdir(parents=True)
+                for file in range(20):
+                    Path(classes, f"C{file}.class").touch()
+
+        def walk() -> List[str]:
+            return [
+                os.path.join(d, "pom.xml")
+                for d, _, files in os.walk(directory)
+                if "pom.xml" in files
+            ]
+
+        measure(f"find POMs of {MODULE_COUNT} modules with os.walk", walk)
+        measure(
+            f"find POMs of {MODULE_COUNT} modules with discovery, sequentially",
+            lambda: MavenPomDiscovery(max_workers=1).find_poms(Path(directory)),
+        )
+        measure(
+            f"find POMs of {MODULE_COUNT} modules with discovery, in parallel",
+            lambda: MavenPomDiscovery().find_poms(Path(directory)),
+        )
+
+
+if __name__ == "__main__":
+    main()
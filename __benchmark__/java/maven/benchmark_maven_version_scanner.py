@@ -0,0 +1,47 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from __benchmark__.benchmark_utility import measure, write_pom
+from java.maven.maven_version_scanner import MavenVersionScanner
+from java.maven.xml_maven_module_reader import XmlMavenModuleReader
+from java.maven.xml_maven_project import XmlMavenProject
+
+DEPENDENCY_COUNT: int = 20000
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory:
+        pom: Path = write_pom(Path(directory, "pom.xml"), "huge", DEPENDENCY_COUNT)
+
+        # most root POMs declare their version next to their artifact id, so the scanner can stop right there
+        versioned_pom: Path = Path(directory, "versioned", "pom.xml")
+        versioned_pom.parent.mkdir()
+        versioned_pom.write_text(
+            pom.read_text(encoding="UTF-8").replace(
+                "<artifactId>huge</artifactId>",
+                "<artifactId>huge</artifactId><version>2.0.0</version>",
+            ),
+            encoding="UTF-8",
+        )
+
+        def read_version() -> None:
+            project: XmlMavenProject = XmlMavenProject()
+            project.add_modules(XmlMavenModuleReader().read(pom))
+            project.get_module_versions()
+
+        measure(
+            f"read version of POM with {DEPENDENCY_COUNT} dependencies, full read",
+            read_version,
+        )
+        measure(
+            f"read version of POM with {DEPENDENCY_COUNT} dependencies, scanner",
+            lambda: MavenVersionScanner().scan(versioned_pom),
+        )
+        measure(
+            f"read inherited version of POM with {DEPENDENCY_COUNT} dependencies, scanner",
+            lambda: MavenVersionScanner().scan(pom),
+        )
+
+
+if __name__ == "__main__":
+    main()
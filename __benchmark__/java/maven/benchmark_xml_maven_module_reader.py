@@ -0,0 +1,56 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+
+from __benchmark__.benchmark_utility import measure, write_pom
+from java.maven.xml_maven_module_reader import XmlMavenModuleReader
+from utility.file_cache import FileCache
+
+MODULE_COUNT: int = 500
+DEPENDENCY_COUNT: int = 50
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory:
+        modules: List[str] = [f"module-{index}" for index in range(MODULE_COUNT)]
+        pom: Path = write_pom(Path(directory, "pom.xml"), "parent", modules=modules)
+        for module in modules:
+            write_pom(Path(directory, module, "pom.xml"), module, DEPENDENCY_COUNT)
+
+        measure(
+            f"read {MODULE_COUNT} modules recursively",
+            lambda: XmlMavenModuleReader().read_recursive(pom),
+        )
+        measure(
+            f"read {MODULE_COUNT} modules recursively, in parallel",
+            lambda: XmlMavenModuleReader(max_workers=None).read_recursive(pom),
+        )
+        measure(
+            f"read {MODULE_COUNT} modules recursively, read-only",
+            lambda: XmlMavenModuleReader(read_only=True).read_recursive(pom),
+        )
+        measure(
+            f"read {MODULE_COUNT} modules recursively, read-only, identifiers only",
+            lambda: XmlMavenModuleReader(read_only=True, sections=[]).read_recursive(
+                pom
+            ),
+        )
+
+        cache_directory: Path = Path(directory, "cache")
+        measure(
+            f"read {MODULE_COUNT} modules recursively, cold cache",
+            lambda: XmlMavenModuleReader(
+                cache=FileCache(cache_directory)
+            ).read_recursive(pom),
+            repetitions=1,
+        )
+        measure(
+            f"read {MODULE_COUNT} modules recursively, warm cache",
+            lambda: XmlMavenModuleReader(
+                cache=FileCache(cache_directory)
+            ).read_recursive(pom),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Iterator, List
+
+import maven_version
+from __benchmark__.benchmark_utility import POM_NAMESPACE, measure
+from java.maven.maven_reactor_graph import MavenReactorGraph
+from java.maven.xml_maven_module import XmlMavenModule
+from java.maven.xml_maven_module_reader import XmlMavenModuleReader
+from java.maven.xml_maven_project import XmlMavenProject
+
+MODULE_COUNT: int = 500
+DEPENDENCY_COUNT: int = 50
+PROPERTY_COUNT: int = 100
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory:
+        modules: List[str] = [f"module-{index}" for index in range(MODULE_COUNT)]
+        pom: Path = _write_root_pom(Path(directory), modules)
+        for index, module in enumerate(modules):
+            # every module depends on the modules before it, with the version inherited from the root
+            dependencies: List[str] = modules[max(0, index - DEPENDENCY_COUNT) : index]
+            _write_module_pom(Path(directory, module), module, dependencies)
+
+        read_modules: List[XmlMavenModule] = XmlMavenModuleReader().read_recursive(pom)
+
+        def bump_version() -> None:
+            project: XmlMavenProject = XmlMavenProject()
+            project.add_all_modules(read_modules)
+            project.bump_version(
+                XmlMavenProject.VersionBumpType.PATCH, write_modules=False
+            )
+
+        measure(
+            f"bump version of {MODULE_COUNT} modules with {DEPENDENCY_COUNT} dependencies",
+            bump_version,
+        )
+
+        project: XmlMavenProject = XmlMavenProject()
+        project.add_all_modules(read_modules)
+        measure(
+            f"build reactor graph of {MODULE_COUNT} modules with {DEPENDENCY_COUNT} dependencies",
+            lambda: MavenReactorGraph.of(project).topological_order(),
+        )
+
+        graph: MavenReactorGraph = MavenReactorGraph.of(project)
+        graph.topological_order()
+        measure(
+            f"find transitive dependents of the first of {MODULE_COUNT} modules",
+            lambda: graph.get_transitive_dependents(read_modules[1]),
+        )
+
+        versions: Iterator[str] = (f"{index}.0.0" for index in range(2, 100))
+        measure(
+            f"read, set and write version of {MODULE_COUNT} modules with {DEPENDENCY_COUNT} dependencies",
+            lambda: maven_version.set_version(
+                [pom], next(versions), github_actions_output=False
+            ),
+        )
+
+
+def _write_root_pom(directory: Path, modules: List[str]) -> Path:
+    properties: List[str] = [
+        f"<property-{index}>{index}</property-{index}>"
+        for index in range(PROPERTY_COUNT)
+    ]
+
+    pom: Path = Path(directory, "pom.xml")
+    pom.write_text(
+        f'<project xmlns="{POM_NAMESPACE}">'
+        "<groupId>com.example</groupId><artifactId>root</artifactId><version>${revision}</version>"
+        f"<properties>{''.join(properties)}<revision>1.0.0</revision></properties>"
+        f"<modules>{''.join([f'<module>{m}</module>' for m in modules])}</modules>"
+        "</project>",
+        encoding="UTF-8",
+    )
+
+    return pom
+
+
+def _write_module_pom(
+    directory: Path, artifact_id: str, dependencies: List[str]
+) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    Path(directory, "pom.xml").write_text(
+        f'<project xmlns="{POM_NAMESPACE}">'
+        "<parent><groupId>com.example</groupId><artifactId>root</artifactId><version>${revision}</version></parent>"
+        f"<artifactId>{artifact_id}</artifactId><dependencies>"
+        + "".join(
+            [
+                "<dependency><groupId>com.example</groupId>"
+                f"<artifactId>{d}</artifactId><version>${{revision}}</version></dependency>"
+                for d in dependencies
+            ]
+        )
+        + "</dependencies></project>",
+        encoding="UTF-8",
+    )
+
+
+if __name__ == "__main__":
+    main()
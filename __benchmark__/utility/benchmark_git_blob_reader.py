@@ -0,0 +1,45 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+
+from __benchmark__.benchmark_utility import measure, write_pom
+from shell.shell import DefaultShell, Shell
+from utility.git_blob_reader import GitBlobReader
+
+FILE_COUNT: int = 500
+
+
+def main() -> None:
+    shell: Shell = DefaultShell.new()
+    with TemporaryDirectory() as directory:
+        files: List[Path] = [
+            write_pom(Path(directory, f"module-{index}", "pom.xml"), f"module-{index}")
+            for index in range(FILE_COUNT)
+        ]
+        shell.run_or_raise("git", ["init", "-q"], Path(directory))
+        shell.run_or_raise("git", ["add", "-A"], Path(directory))
+        shell.run_or_raise(
+            "git",
+            ["-c", "user.name=a", "-c", "user.email=a@b", "commit", "-q", "-m", "a"],
+            Path(directory),
+        )
+
+        def show() -> None:
+            for file in files:
+                shell.run_or_raise(
+                    "git",
+                    ["show", f"HEAD:{file.relative_to(directory).as_posix()}"],
+                    Path(directory),
+                )
+
+        def read() -> None:
+            with GitBlobReader(Path(directory), shell) as blob_reader:
+                for file in files:
+                    blob_reader.read("HEAD", file)
+
+        measure(f"read {FILE_COUNT} files with 'git show'", show, repetitions=1)
+        measure(f"read {FILE_COUNT} files with 'git cat-file --batch'", read)
+
+
+if __name__ == "__main__":
+    main()
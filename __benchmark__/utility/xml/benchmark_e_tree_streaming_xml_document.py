@@ -0,0 +1,45 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from __benchmark__.benchmark_utility import measure, measure_peak_memory, write_pom
+from java.maven.xml_maven_module_reader import XmlMavenModuleReader
+from utility.xml.default_xml_document import DefaultXmlDocument
+from utility.xml.e_tree_streaming_xml_document import ETreeStreamingXmlDocument
+from utility.xml.e_tree_xml_document import ETreeXmlDocument
+
+DEPENDENCY_COUNT: int = 500
+REPORTING_PLUGIN_COUNT: int = 20_000
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory:
+        pom: Path = write_pom(
+            Path(directory, "pom.xml"),
+            "application",
+            DEPENDENCY_COUNT,
+            reporting_plugin_count=REPORTING_PLUGIN_COUNT,
+        )
+        print(f"POM size: {pom.stat().st_size / 1024:.0f} KiB")
+
+        # the streaming parser trades parse time for memory, compared to both whole-document backends
+        for name, parse in [
+            (
+                "parse POM (default, read-only)",
+                lambda: DefaultXmlDocument.parse_read_only(
+                    pom, *XmlMavenModuleReader.READ_ONLY_PATHS
+                ),
+            ),
+            ("parse POM (ETree)", lambda: ETreeXmlDocument.parse(pom)),
+            (
+                "parse POM (ETree, streaming)",
+                lambda: ETreeStreamingXmlDocument.parse(
+                    pom, *XmlMavenModuleReader.READ_ONLY_PATHS
+                ),
+            ),
+        ]:
+            measure(name, parse)
+            measure_peak_memory(name, parse)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+from xml.etree import ElementTree
+
+from __benchmark__.benchmark_utility import measure, write_pom
+from utility.xml.e_tree_xml_document import ETreeXmlDocument
+from utility.xml.e_tree_xml_serializer import ETreeXmlSerializer
+from utility.xml.xml_node import XmlNode
+
+DEPENDENCY_COUNT: int = 20_000
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory:
+        pom: Path = write_pom(
+            Path(directory, "pom.xml"), "application", DEPENDENCY_COUNT
+        )
+        target: Path = Path(directory, "target.xml")
+        print(f"POM size: {pom.stat().st_size / 1024:.0f} KiB")
+
+        tree: ElementTree.ElementTree = ElementTree.parse(pom)
+        measure("save (write, re-read, fix quotes)", lambda: _legacy_save(tree, target))
+        measure(
+            "save (single-pass serializer)",
+            lambda: target.write_bytes(ETreeXmlSerializer(tree.getroot()).serialize()),
+        )
+
+        document: ETreeXmlDocument = ETreeXmlDocument.parse(pom)
+        versions: List[XmlNode] = document.find_all_nodes(
+            "project", "dependencies", "dependency", "version"
+        )
+        measure(
+            "save (patched source, one changed version)",
+            lambda: _change_and_save(document, versions[-1:], target),
+        )
+        measure(
+            f"save (patched source, {len(versions)} changed versions)",
+            lambda: _change_and_save(document, versions, target),
+        )
+
+
+def _change_and_save(
+    document: ETreeXmlDocument, nodes: List[XmlNode], file: Path
+) -> None:
+    for node in nodes:
+        node.text = "2.0.0" if node.text != "2.0.0" else "1.0.0"
+
+    document.save(file)
+
+
+def _legacy_save(tree: ElementTree.ElementTree, file: Path) -> None:
+    # the implementation that was used before the single-pass serializer
+    tree.write(
+        file,
+        encoding="UTF-8",
+        xml_declaration=True,
+        default_namespace=tree.getroot().tag[1:].split("}")[0],
+    )
+
+    content: str = ""
+    with file.open("r") as r:
+        for line in r:
+            if line.strip().startswith("<!--"):
+                content += line
+
+            else:
+                content += line.replace("'", '"')
+
+    with file.open("w") as w:
+        w.write(content)
+
+
+if __name__ == "__main__":
+    main()
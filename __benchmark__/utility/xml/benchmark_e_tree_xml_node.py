@@ -0,0 +1,42 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from __benchmark__.benchmark_utility import measure, write_pom
+from utility.xml.e_tree_xml_document import ETreeXmlDocument
+from utility.xml.xml_path import XmlPath
+
+DEPENDENCY_COUNT: int = 5_000
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory:
+        pom: Path = write_pom(
+            Path(directory, "pom.xml"), "application", DEPENDENCY_COUNT
+        )
+
+        # the document is parsed directly, so that the ETree nodes are measured even if lxml is installed
+        measure(
+            f"parse POM with {DEPENDENCY_COUNT} dependencies",
+            lambda: ETreeXmlDocument.parse(pom),
+        )
+
+        document: ETreeXmlDocument = ETreeXmlDocument.parse(pom)
+        measure(
+            f"find all {DEPENDENCY_COUNT} dependency versions 100 times",
+            lambda: [
+                document.find_all_nodes(
+                    "project", "dependencies", "dependency", "version"
+                )
+                for _ in range(100)
+            ],
+        )
+
+        path: XmlPath = XmlPath.compile("project", "dependencies", "*", "version")
+        measure(
+            f"query all {DEPENDENCY_COUNT} dependency versions 100 times",
+            lambda: [document.query_all_nodes(path) for _ in range(100)],
+        )
+
+
+if __name__ == "__main__":
+    main()
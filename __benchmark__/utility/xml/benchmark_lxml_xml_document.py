@@ -0,0 +1,62 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable, List
+
+from __benchmark__.benchmark_utility import measure, write_pom
+from utility.xml.default_xml_document import DefaultXmlDocument
+from utility.xml.e_tree_xml_document import ETreeXmlDocument
+from utility.xml.xml_document import XmlDocument
+from utility.xml.xml_node import XmlNode
+from utility.xml.xml_path import XmlPath
+
+DEPENDENCY_COUNT: int = 20_000
+VERSIONS: XmlPath = XmlPath.compile("project", "dependencies", "dependency", "version")
+
+
+def main() -> None:
+    if not DefaultXmlDocument.is_lxml_available():
+        print("lxml is not installed, only the ETree backend can be measured")
+
+    backends: List[Callable[[Path], XmlDocument]] = [ETreeXmlDocument.parse]
+    if DefaultXmlDocument.is_lxml_available():
+        from utility.xml.lxml_xml_document import LxmlXmlDocument
+
+        backends.append(LxmlXmlDocument.parse)
+
+    with TemporaryDirectory() as directory:
+        pom: Path = write_pom(
+            Path(directory, "pom.xml"), "application", DEPENDENCY_COUNT
+        )
+        target: Path = Path(directory, "target.xml")
+        print(f"POM size: {pom.stat().st_size / 1024:.0f} KiB")
+
+        for parse in backends:
+            name: str = parse.__qualname__.split(".")[0]
+            measure(f"{name}: parse", lambda: parse(pom))
+
+            document: XmlDocument = parse(pom)
+            measure(
+                f"{name}: query {DEPENDENCY_COUNT} versions",
+                lambda: document.query_all_nodes(VERSIONS),
+            )
+
+            versions: List[XmlNode] = document.query_all_nodes(VERSIONS)
+            measure(
+                f"{name}: save, one changed version",
+                lambda: _change_and_save(document, versions[-1:], target),
+            )
+            measure(
+                f"{name}: save, {len(versions)} changed versions",
+                lambda: _change_and_save(document, versions, target),
+            )
+
+
+def _change_and_save(document: XmlDocument, nodes: List[XmlNode], file: Path) -> None:
+    for node in nodes:
+        node.text = "2.0.0" if node.text != "2.0.0" else "1.0.0"
+
+    document.save(file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import ClassVar, List, Optional, Tuple
+
+
+# builds the POMs of test projects, whose modules all share the same group ID
+@dataclass(frozen=True)
+class PomFixture:
+    GROUP_ID: ClassVar[str] = "com.example"
+    NAMESPACE: ClassVar[str] = "http://maven.apache.org/POM/4.0.0"
+
+    artifact_id: str
+    version: Optional[str] = field(default="1.0.0")
+    parent: Optional[Tuple[str, str]] = field(default=None)
+    modules: Tuple[str, ...] = field(default=())
+    managed_dependencies: Tuple[Tuple[str, str], ...] = field(default=())
+    imported_boms: Tuple[str, ...] = field(default=())
+    dependencies: Tuple[Tuple[str, Optional[str]], ...] = field(default=())
+    plugins: Tuple[str, ...] = field(default=())
+    content: str = field(default="")
+
+    @staticmethod
+    def of(artifact_id: str, version: Optional[str] = "1.0.0") -> "PomFixture":
+        return PomFixture(artifact_id, version)
+
+    def with_parent(
+        self, artifact_id: str = "root", version: str = "1.0.0"
+    ) -> "PomFixture":
+        return replace(self, parent=(artifact_id, version))
+
+    def with_modules(self, *modules: str) -> "PomFixture":
+        return replace(self, modules=self.modules + modules)
+
+    def with_managed_dependencies(
+        self, *artifact_ids: str, version: str = "${project.version}"
+    ) -> "PomFixture":
+        return replace(
+            self,
+            managed_dependencies=self.managed_dependencies
+            + tuple([(a, version) for a in artifact_ids]),
+        )
+
+    def with_imported_boms(self, *artifact_ids: str) -> "PomFixture":
+        return replace(self, imported_boms=self.imported_boms + artifact_ids)
+
+    def with_dependencies(
+        self, *artifact_ids: str, version: Optional[str] = "1.0.0"
+    ) -> "PomFixture":
+        # dependencies without a version are managed by a parent or an imported BOM
+        return replace(
+            self,
+            dependencies=self.dependencies
+            + tuple([(a, version) for a in artifact_ids]),
+        )
+
+    def with_plugins(self, *artifact_ids: str) -> "PomFixture":
+        return replace(self, plugins=self.plugins + artifact_ids)
+
+    def with_content(self, content: str) -> "PomFixture":
+        # raw XML, e.g. properties or broken elements, is written as given after all other elements
+        return replace(self, content=self.content + content)
+
+    def write(self, directory: Path) -> Path:
+        directory.mkdir(parents=True, exist_ok=True)
+
+        pom: Path = Path(directory, "pom.xml")
+        pom.write_text(self.to_xml(), encoding="UTF-8")
+
+        return pom
+
+    def to_xml(self) -> str:
+        parts: List[str] = [f'<project xmlns="{PomFixture.NAMESPACE}">']
+        if self.parent is not None:
+            parts.append(
+                f"<parent>{PomFixture._coordinates(self.parent[0], self.parent[1])}</parent>"
+            )
+
+        parts.append(PomFixture._coordinates(self.artifact_id, self.version))
+
+        if len(self.modules) > 0:
+            parts.append(
+                f"<modules>{''.join([f'<module>{m}</module>' for m in self.modules])}</modules>"
+            )
+
+        if len(self.managed_dependencies) > 0 or len(self.imported_boms) > 0:
+            parts.append("<dependencyManagement><dependencies>")
+            parts.extend(
+                [
+                    f"<dependency>{PomFixture._coordinates(a, v)}</dependency>"
+                    for a, v in self.managed_dependencies
+                ]
+            )
+            parts.extend(
+                [
+                    f"<dependency>{PomFixture._coordinates(b, '1.0.0')}"
+                    "<type>pom</type><scope>import</scope></dependency>"
+                    for b in self.imported_boms
+                ]
+            )
+            parts.append("</dependencies></dependencyManagement>")
+
+        if len(self.dependencies) > 0:
+            parts.append("<dependencies>")
+            parts.extend(
+                [
+                    f"<dependency>{PomFixture._coordinates(a, v)}</dependency>"
+                    for a, v in self.dependencies
+                ]
+            )
+            parts.append("</dependencies>")
+
+        if len(self.plugins) > 0:
+            parts.append("<build><plugins>")
+            parts.extend(
+                [
+                    f"<plugin>{PomFixture._coordinates(p, '1.0.0')}</plugin>"
+                    for p in self.plugins
+                ]
+            )
+            parts.append("</plugins></build>")
+
+        parts.append(self.content)
+        parts.append("</project>")
+
+        return "".join(parts)
+
+    @staticmethod
+    def _coordinates(artifact_id: str, version: Optional[str]) -> str:
+        return (
+            f"<groupId>{PomFixture.GROUP_ID}</groupId><artifactId>{artifact_id}</artifactId>"
+            + (f"<version>{version}</version>" if version is not None else "")
+        )
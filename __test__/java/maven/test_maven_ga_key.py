@@ -0,0 +1,49 @@
+from threading import Thread
+from typing import List, Set
+from unittest import TestCase
+
+from java.maven.maven_ga_key import MavenGaKey
+
+
+class TestMavenGaKey(TestCase):
+    def test_of_interns_keys(self) -> None:
+        sut: MavenGaKey = MavenGaKey.of("com.example", "application")
+
+        self.assertIs(sut, MavenGaKey.of("com.example", "application"))
+        self.assertIsNot(sut, MavenGaKey.of("com.example", "other"))
+        self.assertEqual(sut.group_id, "com.example")
+        self.assertEqual(sut.artifact_id, "application")
+        self.assertEqual(str(sut), "com.example:application")
+
+    def test_of_interns_keys_concurrently(self) -> None:
+        keys: List[MavenGaKey] = []
+
+        def create_keys() -> None:
+            for _ in range(1000):
+                keys.append(MavenGaKey.of("com.example", "concurrent"))
+
+        threads: List[Thread] = [Thread(target=create_keys) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(id(key) for key in keys)), 1)
+
+    def test_equality_and_hash(self) -> None:
+        sut: MavenGaKey = MavenGaKey.of("com.example", "application")
+        copy: MavenGaKey = MavenGaKey("com.example", "application")
+
+        self.assertEqual(sut, copy)
+        self.assertEqual(hash(sut), hash(copy))
+        self.assertNotEqual(sut, "com.example:application")
+
+        keys: Set[MavenGaKey] = {sut, copy, MavenGaKey.of("com.example", "other")}
+
+        self.assertEqual(len(keys), 2)
+
+    def test_slots(self) -> None:
+        sut: MavenGaKey = MavenGaKey.of("com.example", "application")
+
+        self.assertFalse(hasattr(sut, "__dict__"))
@@ -0,0 +1,28 @@
+from unittest import TestCase
+
+from java.maven.maven_ga_key import MavenGaKey
+from java.maven.maven_gav_key import MavenGavKey
+
+
+class TestMavenGavKey(TestCase):
+    def test_of_interns_keys(self) -> None:
+        ga_key: MavenGaKey = MavenGaKey.of("com.example", "application")
+        sut: MavenGavKey = MavenGavKey.of(ga_key, "1.0.0")
+
+        self.assertIs(sut, MavenGavKey.of(ga_key, "1.0.0"))
+        self.assertIsNot(sut, MavenGavKey.of(ga_key, "2.0.0"))
+        self.assertIs(sut.ga_key, ga_key)
+        self.assertEqual(sut.group_id, "com.example")
+        self.assertEqual(sut.artifact_id, "application")
+        self.assertEqual(sut.version, "1.0.0")
+        self.assertEqual(str(sut), "com.example:application:1.0.0")
+
+    def test_equality_and_hash(self) -> None:
+        ga_key: MavenGaKey = MavenGaKey.of("com.example", "application")
+        sut: MavenGavKey = MavenGavKey.of(ga_key, "1.0.0")
+        copy: MavenGavKey = MavenGavKey(ga_key, "1.0.0")
+
+        self.assertEqual(sut, copy)
+        self.assertEqual(hash(sut), hash(copy))
+        self.assertNotEqual(sut, MavenGavKey.of(ga_key, "2.0.0"))
+        self.assertNotEqual(sut, ga_key)
@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from java.maven.maven_ga_key import MavenGaKey
 from java.maven.maven_module_identifier import MavenModuleIdentifier
 
 
@@ -38,3 +39,5 @@ class TestMavenModuleIdentifier(TestCase):
         self.assertEqual(sut.group_id, "com.example")
         self.assertEqual(sut.artifact_id, "application")
         self.assertEqual(sut.version, "1.0.0")
+        self.assertIs(sut.ga_key, MavenGaKey.of("com.example", "application"))
+        self.assertEqual(str(sut.gav_key), "com.example:application:1.0.0")
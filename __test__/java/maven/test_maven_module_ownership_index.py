@@ -0,0 +1,110 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+from unittest import TestCase
+
+from __test__.java.maven.pom_fixture import PomFixture
+from java.maven.maven_ga_key import MavenGaKey
+from java.maven.maven_module_ownership_index import MavenModuleOwnershipIndex
+from java.maven.xml_maven_module_reader import XmlMavenModuleReader
+from utility.file_cache import FileCache
+
+
+class TestMavenModuleOwnershipIndex(TestCase):
+    def test_find_owner(self) -> None:
+        root: Path = Path("/project")
+        sut: MavenModuleOwnershipIndex = MavenModuleOwnershipIndex(
+            [
+                (root, MavenGaKey.of("com.example", "root")),
+                (Path(root, "a"), MavenGaKey.of("com.example", "a")),
+                (Path(root, "a", "nested"), MavenGaKey.of("com.example", "nested")),
+            ]
+        )
+
+        self.assertEqual(
+            sut.find_owner(Path(root, "a", "src", "main", "A.java")),
+            MavenGaKey.of("com.example", "a"),
+        )
+        self.assertEqual(
+            sut.find_owner(Path(root, "a", "nested", "pom.xml")),
+            MavenGaKey.of("com.example", "nested"),
+        )
+        self.assertEqual(
+            sut.find_owner(Path(root, "b", "B.java")),
+            MavenGaKey.of("com.example", "root"),
+        )
+        self.assertIsNone(sut.find_owner(Path("/other", "Other.java")))
+
+        self.assertEqual(
+            sut.find_owners(
+                [
+                    Path(root, "a", "A.java"),
+                    Path(root, "a", "pom.xml"),
+                    Path(root, "README.md"),
+                ]
+            ),
+            [MavenGaKey.of("com.example", "a"), MavenGaKey.of("com.example", "root")],
+        )
+
+    def test_load_persisted_index(self) -> None:
+        with TemporaryDirectory() as directory:
+            root_pom: Path = (
+                PomFixture.of("root").with_modules("a").write(Path(directory))
+            )
+            PomFixture.of("a").write(Path(directory, "a"))
+            cache: FileCache = FileCache(Path(directory, "cache"))
+
+            sut: MavenModuleOwnershipIndex = MavenModuleOwnershipIndex.load(
+                root_pom, cache, XmlMavenModuleReader()
+            )
+
+            self.assertEqual(
+                sut.find_owner(Path(directory, "a", "A.java")),
+                MavenGaKey.of("com.example", "a"),
+            )
+
+            # the persisted index does not need a reader
+            sut = MavenModuleOwnershipIndex.load(root_pom, cache, _FailingReader())
+
+            self.assertEqual(
+                sut.find_owner(Path(directory, "a", "A.java")),
+                MavenGaKey.of("com.example", "a"),
+            )
+
+    def test_load_rebuilds_index_after_pom_changed(self) -> None:
+        with TemporaryDirectory() as directory:
+            root_pom: Path = (
+                PomFixture.of("root").with_modules("a").write(Path(directory))
+            )
+            module_pom: Path = PomFixture.of("a").write(Path(directory, "a"))
+            cache: FileCache = FileCache(Path(directory, "cache"))
+
+            MavenModuleOwnershipIndex.load(root_pom, cache, XmlMavenModuleReader())
+
+            # a new module is added to a module that is not the root
+            PomFixture.of("b").write(Path(directory, "a", "b"))
+            PomFixture.of("a").with_modules("b").write(Path(directory, "a"))
+            stat: os.stat_result = module_pom.stat()
+            os.utime(module_pom, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            self.assertRaises(
+                AssertionError,
+                lambda: MavenModuleOwnershipIndex.load(
+                    root_pom, cache, _FailingReader()
+                ),
+            )
+
+            sut: MavenModuleOwnershipIndex = MavenModuleOwnershipIndex.load(
+                root_pom, cache, XmlMavenModuleReader()
+            )
+
+            self.assertEqual(
+                sut.find_owner(Path(directory, "a", "b", "B.java")),
+                MavenGaKey.of("com.example", "b"),
+            )
+
+
+class _FailingReader(XmlMavenModuleReader):
+    def read_recursive(self, *poms: Path) -> List:
+        raise AssertionError("The index is expected to be loaded from the cache.")
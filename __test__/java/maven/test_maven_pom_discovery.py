@@ -0,0 +1,95 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+from unittest import TestCase
+
+from java.maven.maven_pom_discovery import MavenPomDiscovery
+from java.maven.xml_maven_module_reader import XmlMavenModuleReader
+
+
+class TestMavenPomDiscovery(TestCase):
+    def test_find_poms(self) -> None:
+        with TemporaryDirectory() as directory:
+            root: Path = Path(directory)
+            self._touch(root, "pom.xml")
+            self._touch(root, "a", "pom.xml")
+            self._touch(root, "a", "nested", "deeper", "pom.xml")
+            self._touch(root, "b", "README.md")
+
+            # build output and dependencies are never searched
+            self._touch(root, "a", "target", "pom.xml")
+            self._touch(root, "node_modules", "c", "pom.xml")
+            self._touch(root, ".git", "pom.xml")
+
+            for max_workers in [1, 4]:
+                self.assertEqual(
+                    self._find(MavenPomDiscovery(max_workers), root),
+                    ["a/nested/deeper/pom.xml", "a/pom.xml", "pom.xml"],
+                )
+
+    def test_find_poms_respects_gitignore(self) -> None:
+        with TemporaryDirectory() as directory:
+            root: Path = Path(directory)
+            self._touch(root, "pom.xml")
+            self._touch(root, "generated", "pom.xml")
+            self._touch(root, "a", "pom.xml")
+            self._touch(root, "a", "out", "pom.xml")
+            self._touch(root, "a", "kept", "pom.xml")
+            self._touch(root, "b", "out", "pom.xml")
+            Path(root, ".gitignore").write_text("/generated/\n# comment\n")
+            Path(root, "a", ".gitignore").write_text("*/\n!kept/\n")
+
+            self.assertEqual(
+                self._find(MavenPomDiscovery(), root),
+                ["a/kept/pom.xml", "a/pom.xml", "b/out/pom.xml", "pom.xml"],
+            )
+            self.assertEqual(
+                len(self._find(MavenPomDiscovery(respect_gitignore=False), root)), 6
+            )
+
+    def test_find_poms_respects_negations_of_nested_gitignore(self) -> None:
+        with TemporaryDirectory() as directory:
+            root: Path = Path(directory)
+            self._touch(root, "pom.xml")
+            self._touch(root, "a", "pom.xml")
+            self._touch(root, "a", "generated", "pom.xml")
+            self._touch(root, "a", "b", "generated", "pom.xml")
+            self._touch(root, "c", "generated", "pom.xml")
+            Path(root, ".gitignore").write_text("generated/\n")
+            Path(root, "a", ".gitignore").write_text("!generated/\n")
+            # the deeper file wins again, even though the outer negation matches as well
+            Path(root, "a", "b", ".gitignore").write_text("generated/\n")
+
+            self.assertEqual(
+                self._find(MavenPomDiscovery(), root),
+                ["a/generated/pom.xml", "a/pom.xml", "pom.xml"],
+            )
+
+    def test_iter_poms_streams_into_reader(self) -> None:
+        with TemporaryDirectory() as directory:
+            root: Path = Path(directory)
+            for name in ["a", "b", "c"]:
+                Path(root, name).mkdir()
+                Path(root, name, "pom.xml").write_text(
+                    "<project><groupId>com.example</groupId>"
+                    f"<artifactId>{name}</artifactId><version>1.0.0</version></project>"
+                )
+
+            modules: List[str] = [
+                m.identifier.artifact_id
+                for m in XmlMavenModuleReader(max_workers=4).iter_all(
+                    MavenPomDiscovery().iter_poms(root)
+                )
+            ]
+
+            self.assertEqual(sorted(modules), ["a", "b", "c"])
+
+    @staticmethod
+    def _find(sut: MavenPomDiscovery, root: Path) -> List[str]:
+        return sorted([p.relative_to(root).as_posix() for p in sut.iter_poms(root)])
+
+    @staticmethod
+    def _touch(root: Path, *segments: str) -> None:
+        file: Path = Path(root, *segments)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text("<project />")
@@ -0,0 +1,156 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+from unittest import TestCase
+
+from __test__.java.maven.pom_fixture import PomFixture
+from java.maven.maven_ga_key import MavenGaKey
+from java.maven.maven_module import MavenModule
+from java.maven.maven_reactor_graph import MavenReactorGraph
+from java.maven.xml_maven_module_reader import XmlMavenModuleReader
+from java.maven.xml_maven_project import XmlMavenProject
+
+
+class TestMavenReactorGraph(TestCase):
+    def setUp(self) -> None:
+        self._directory: TemporaryDirectory = TemporaryDirectory()
+        self._root: Path = Path(self._directory.name)
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def test_topological_order(self) -> None:
+        sut: MavenReactorGraph = self._read_graph()
+
+        order: List[str] = self._names(sut.topological_order())
+
+        self.assertEqual(len(order), 5)
+        self.assertEqual(order[0], "root")
+        self.assertLess(order.index("a"), order.index("b"))
+        self.assertLess(order.index("a"), order.index("c"))
+        self.assertLess(order.index("b"), order.index("d"))
+        self.assertLess(order.index("c"), order.index("d"))
+
+    def test_layers(self) -> None:
+        sut: MavenReactorGraph = self._read_graph()
+
+        self.assertEqual(
+            [sorted(self._names(layer)) for layer in sut.layers()],
+            [["root"], ["a"], ["b", "c"], ["d"]],
+        )
+
+    def test_dependencies_and_dependents(self) -> None:
+        sut: MavenReactorGraph = self._read_graph()
+
+        # dependencies outside of the reactor are ignored, plugins within the reactor are dependencies
+        self.assertEqual(
+            sorted(self._names(sut.get_dependencies(self._get(sut, "c")))),
+            ["a", "root"],
+        )
+        self.assertEqual(
+            sorted(self._names(sut.get_dependencies(self._get(sut, "d")))),
+            ["b", "c", "root"],
+        )
+        self.assertEqual(
+            sorted(self._names(sut.get_dependents(self._get(sut, "a")))), ["b", "c"]
+        )
+        self.assertEqual(self._names(sut.get_dependents(self._get(sut, "d"))), [])
+
+    def test_transitive_dependents(self) -> None:
+        sut: MavenReactorGraph = self._read_graph()
+
+        self.assertEqual(
+            self._names(sut.get_transitive_dependents(self._get(sut, "b"))),
+            ["b", "d"],
+        )
+        self.assertEqual(
+            self._names(sut.get_transitive_dependents(self._get(sut, "a")))[0], "a"
+        )
+        self.assertEqual(
+            sorted(self._names(sut.get_transitive_dependents(self._get(sut, "a")))),
+            ["a", "b", "c", "d"],
+        )
+        self.assertEqual(
+            sorted(
+                self._names(
+                    sut.get_transitive_dependencies(
+                        self._get(sut, "b"), self._get(sut, "c")
+                    )
+                )
+            ),
+            ["a", "b", "c", "root"],
+        )
+
+    def test_cycle(self) -> None:
+        self._write_pom(PomFixture.of("root").with_modules("a", "b"))
+        self._write_pom(PomFixture.of("a").with_parent().with_dependencies("b"))
+        self._write_pom(PomFixture.of("b").with_parent().with_dependencies("a"))
+
+        project: XmlMavenProject = XmlMavenProject()
+        project.add_all_modules(
+            XmlMavenModuleReader().read_recursive(Path(self._root, "pom.xml"))
+        )
+        sut: MavenReactorGraph = MavenReactorGraph.of(project)
+
+        self.assertRaises(AssertionError, sut.topological_order)
+
+    def test_parent_managing_its_children(self) -> None:
+        # the parent is no dependent of its children, and the versions of dependencies within the reactor are managed
+        self._write_pom(
+            PomFixture.of("root")
+            .with_modules("bom", "a", "b")
+            .with_managed_dependencies("a", "b")
+            .with_imported_boms("bom")
+        )
+        # the BOM cannot inherit from the parent that imports it
+        self._write_pom(PomFixture.of("bom").with_managed_dependencies("a", "b"))
+        self._write_pom(PomFixture.of("a").with_parent().with_managed_dependencies("b"))
+        self._write_pom(
+            PomFixture.of("b").with_parent().with_dependencies("a", version=None)
+        )
+
+        project: XmlMavenProject = XmlMavenProject()
+        project.add_all_modules(
+            XmlMavenModuleReader().read_recursive(Path(self._root, "pom.xml"))
+        )
+        sut: MavenReactorGraph = MavenReactorGraph.of(project)
+
+        self.assertEqual(
+            [sorted(self._names(layer)) for layer in sut.layers()],
+            [["bom"], ["root"], ["a"], ["b"]],
+        )
+        self.assertEqual(
+            self._names(sut.get_transitive_dependents(self._get(sut, "bom"))),
+            ["bom", "root", "a", "b"],
+        )
+
+    def _read_graph(self) -> MavenReactorGraph:
+        self._write_pom(PomFixture.of("root").with_modules("a", "b", "c", "d"))
+        self._write_pom(PomFixture.of("a").with_parent().with_dependencies("external"))
+        self._write_pom(PomFixture.of("b").with_parent().with_dependencies("a"))
+        self._write_pom(PomFixture.of("c").with_parent().with_plugins("a"))
+        self._write_pom(
+            PomFixture.of("d").with_parent().with_dependencies("b", "c", "c")
+        )
+
+        project: XmlMavenProject = XmlMavenProject()
+        project.add_all_modules(
+            XmlMavenModuleReader().read_recursive(Path(self._root, "pom.xml"))
+        )
+
+        return MavenReactorGraph.of(project)
+
+    def _write_pom(self, pom: PomFixture) -> None:
+        pom.write(
+            self._root
+            if pom.artifact_id == "root"
+            else Path(self._root, pom.artifact_id)
+        )
+
+    @staticmethod
+    def _get(graph: MavenReactorGraph, artifact_id: str) -> MavenModule:
+        return graph.get_module(MavenGaKey.of("com.example", artifact_id))
+
+    @staticmethod
+    def _names(modules: List[MavenModule]) -> List[str]:
+        return [m.identifier.artifact_id for m in modules]
@@ -0,0 +1,86 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from __test__.java.maven.pom_fixture import PomFixture
+from java.maven.maven_version_scanner import MavenVersionScanner
+
+
+class TestMavenVersionScanner(TestCase):
+    RESOURCES: Path = Path(
+        Path(__file__).parent, "resources", "test_xml_maven_module_reader"
+    )
+
+    def test_scan_version(self) -> None:
+        sut: MavenVersionScanner = MavenVersionScanner()
+
+        self.assertEqual(
+            sut.scan(Path(self.RESOURCES, "single_module", "pom.xml")), "13.3.7"
+        )
+
+    def test_scan_version_stops_after_version(self) -> None:
+        with TemporaryDirectory() as directory:
+            # everything after the version is never parsed, so the broken remainder is not noticed
+            pom: Path = self._write_pom(
+                Path(directory), "<version>1.2.3</version><broken>"
+            )
+
+            self.assertEqual(MavenVersionScanner().scan(pom), "1.2.3")
+
+    def test_scan_version_from_property(self) -> None:
+        with TemporaryDirectory() as directory:
+            pom: Path = self._write_pom(
+                Path(directory),
+                "<version>${revision}</version>"
+                "<properties><revision>${major}.0.0</revision><major>2</major></properties>",
+            )
+
+            self.assertEqual(MavenVersionScanner().scan(pom), "2.0.0")
+
+            pom = self._write_pom(
+                Path(directory),
+                "<version>${revision}</version>"
+                "<properties><revision>${major}.${minor}.0</revision><major>2</major></properties>",
+            )
+
+            self.assertRaises(AssertionError, lambda: MavenVersionScanner().scan(pom))
+
+    def test_scan_version_from_parent(self) -> None:
+        with TemporaryDirectory() as directory:
+            self._write_pom(
+                Path(directory),
+                "<version>${revision}</version><properties><revision>3.0.0</revision></properties>",
+            )
+            child_pom: Path = self._write_pom(
+                Path(directory, "child"),
+                "<parent><version>${revision}</version></parent>",
+            )
+            other_child_pom: Path = self._write_pom(
+                Path(directory, "other-child"),
+                "<parent><version>1.0.0</version></parent><version>${revision}</version>",
+            )
+
+            self.assertEqual(MavenVersionScanner().scan(child_pom), "3.0.0")
+            self.assertEqual(MavenVersionScanner().scan(other_child_pom), "3.0.0")
+
+    def test_scan_version_fails_for_unresolved_properties(self) -> None:
+        with TemporaryDirectory() as directory:
+            pom: Path = self._write_pom(
+                Path(directory), "<version>${revision}</version>"
+            )
+
+            self.assertRaises(AssertionError, lambda: MavenVersionScanner().scan(pom))
+
+            pom = self._write_pom(
+                Path(directory),
+                "<version>${a}</version><properties><a>${b}</a><b>${a}</b></properties>",
+            )
+
+            self.assertRaises(AssertionError, lambda: MavenVersionScanner().scan(pom))
+
+    @staticmethod
+    def _write_pom(directory: Path, content: str) -> Path:
+        # the version, if any, is part of the content, to test where the scanner finds it
+        return (
+            PomFixture.of(directory.name, None).with_content(content).write(directory)
+        )
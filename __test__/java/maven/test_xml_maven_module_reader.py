@@ -1,14 +1,19 @@
+import tracemalloc
 from pathlib import Path
-from typing import List, cast
+from tempfile import TemporaryDirectory
+from typing import ClassVar, Iterator, List, cast
 from unittest import TestCase
 
 from java.maven.xml_maven_module import XmlMavenModule
 from java.maven.xml_maven_module_identifier import XmlMavenModuleIdentifier
 from java.maven.xml_maven_module_reader import XmlMavenModuleReader
+from utility.file_cache import FileCache
+from utility.xml.source_xml_document import SourceXmlDocument
 
 
 class TestXmlMavenModuleReader(TestCase):
     RESOURCES: Path = Path(Path(__file__).parent, "resources", Path(__file__).stem)
+    MAX_PEAK_BYTES_PER_MODULE: ClassVar[int] = 128 * 1024
 
     def test_read_single_module(self) -> None:
         sut: XmlMavenModuleReader = XmlMavenModuleReader()
@@ -21,13 +26,90 @@ class TestXmlMavenModuleReader(TestCase):
         self.assertEqual(module.identifier.artifact_id, "application")
         self.assertEqual(module.identifier.version, "13.3.7")
         self.assertEqual(len(module.properties), 1)
-        self.assertEqual(len(module.dependencies), 2)
-        self.assertEqual(len(module.plugins), 2)
+        self.assertEqual(len(module.dependencies), 1)
+        self.assertEqual(len(module.managed_dependencies), 1)
+        self.assertEqual(len(module.plugins), 1)
+        self.assertEqual(len(module.managed_plugins), 1)
         self.assertIsNotNone(module.parent_identifier)
         self.assertEqual(module.parent_identifier.group_id, "com.example")
         self.assertEqual(module.parent_identifier.artifact_id, "parent")
         self.assertEqual(module.parent_identifier.version, "1.1.1")
 
+    def test_read_single_module_read_only(self) -> None:
+        sut: XmlMavenModuleReader = XmlMavenModuleReader(read_only=True)
+
+        module: XmlMavenModule = sut.read(
+            Path(self.RESOURCES, "single_module", "pom.xml")
+        )
+
+        self.assertEqual(module.identifier.group_id, "com.example")
+        self.assertEqual(module.identifier.artifact_id, "application")
+        self.assertEqual(module.identifier.version, "13.3.7")
+        self.assertEqual(len(module.properties), 1)
+        self.assertEqual(len(module.dependencies), 1)
+        self.assertEqual(len(module.managed_dependencies), 1)
+        self.assertEqual(len(module.plugins), 1)
+        self.assertEqual(len(module.managed_plugins), 1)
+        self.assertIsNotNone(module.parent_identifier)
+        self.assertEqual(module.parent_identifier.artifact_id, "parent")
+        self.assertRaises(
+            AssertionError, lambda: module.xml_document.save(module.pom_file)
+        )
+
+    def test_read_build_dependency_keys(self) -> None:
+        sut: XmlMavenModuleReader = XmlMavenModuleReader(
+            read_only=True,
+            sections=[XmlMavenModuleReader.Section.BUILD_DEPENDENCIES],
+        )
+
+        module: XmlMavenModule = sut.read(
+            Path(self.RESOURCES, "single_module", "pom.xml")
+        )
+
+        # managed dependencies and plugins are no build dependencies, but unversioned ones are
+        self.assertEqual(
+            [str(k) for k in module.build_dependency_keys],
+            [
+                "com.example:dp-with-version",
+                "com.example:dp-without-version",
+                "com.example:plm-with-version",
+                "com.example:pl-with-version",
+                "com.example:pl-without-version",
+            ],
+        )
+        self.assertRaises(AssertionError, lambda: module.dependencies)
+
+    def test_read_sections_lazily(self) -> None:
+        sut: XmlMavenModuleReader = XmlMavenModuleReader()
+
+        module: XmlMavenModule = sut.read(
+            Path(self.RESOURCES, "single_module", "pom.xml")
+        )
+
+        self.assertIs(module.properties, module.properties)
+        self.assertIs(module.dependencies, module.dependencies)
+        self.assertIs(module.plugins, module.plugins)
+        self.assertIs(module.managed_dependencies, module.managed_dependencies)
+        self.assertEqual(len(module.dependencies), 1)
+
+    def test_read_requested_sections_read_only(self) -> None:
+        sut: XmlMavenModuleReader = XmlMavenModuleReader(
+            read_only=True, sections=[XmlMavenModuleReader.Section.PLUGINS]
+        )
+
+        module: XmlMavenModule = sut.read(
+            Path(self.RESOURCES, "single_module", "pom.xml")
+        )
+
+        self.assertEqual(module.identifier.artifact_id, "application")
+        self.assertEqual(module.parent_identifier.artifact_id, "parent")
+        self.assertEqual(len(module.plugins), 1)
+        self.assertEqual(len(module.managed_plugins), 1)
+        self.assertRaises(AssertionError, lambda: module.properties)
+        self.assertRaises(AssertionError, lambda: module.dependencies)
+        self.assertRaises(AssertionError, lambda: module.managed_dependencies)
+        self.assertRaises(AssertionError, lambda: module.build_dependency_keys)
+
     def test_read_multi_module_recursively(self) -> None:
         sut: XmlMavenModuleReader = XmlMavenModuleReader()
 
@@ -42,7 +124,8 @@ class TestXmlMavenModuleReader(TestCase):
         self.assertEqual(parent.identifier.artifact_id, "application")
         self.assertEqual(parent.identifier.version, "13.3.7")
         self.assertEqual(len(parent.properties), 1)
-        self.assertEqual(len(parent.dependencies), 2)
+        self.assertEqual(len(parent.dependencies), 1)
+        self.assertEqual(len(parent.managed_dependencies), 1)
         self.assertIsNotNone(parent.parent_identifier)
         self.assertEqual(parent.parent_identifier.group_id, "com.example")
         self.assertEqual(parent.parent_identifier.artifact_id, "parent")
@@ -53,7 +136,8 @@ class TestXmlMavenModuleReader(TestCase):
         self.assertEqual(child.identifier.artifact_id, "sub-module")
         self.assertEqual(child.identifier.version, "1.33.7")
         self.assertEqual(len(child.properties), 1)
-        self.assertEqual(len(child.dependencies), 1)
+        self.assertEqual(len(child.dependencies), 0)
+        self.assertEqual(len(child.managed_dependencies), 1)
         self.assertIsNotNone(child.parent_identifier)
         self.assertEqual(child.parent_identifier.group_id, "com.example")
         self.assertEqual(child.parent_identifier.artifact_id, "application")
@@ -65,3 +149,257 @@ class TestXmlMavenModuleReader(TestCase):
             cast(XmlMavenModuleIdentifier, child.identifier).version_node,
             cast(XmlMavenModuleIdentifier, child.parent_identifier).version_node,
         )
+
+    def test_read_recursively_in_parallel(self) -> None:
+        with TemporaryDirectory() as directory:
+            pom: Path = self._write_aggregator(Path(directory), "root", ["a", "b"])
+            self._write_aggregator(Path(directory, "a"), "a", ["a-1", "a-2"])
+            self._write_aggregator(Path(directory, "a", "a-1"), "a-1", [])
+            self._write_aggregator(Path(directory, "a", "a-2"), "a-2", ["a-2-1"])
+            self._write_aggregator(Path(directory, "a", "a-2", "a-2-1"), "a-2-1", [])
+            self._write_aggregator(Path(directory, "b"), "b", ["b-1"])
+            self._write_aggregator(Path(directory, "b", "b-1"), "b-1", [])
+
+            sequential_modules: List[XmlMavenModule] = XmlMavenModuleReader(
+                max_workers=1
+            ).read_recursive(pom)
+            parallel_modules: List[XmlMavenModule] = XmlMavenModuleReader(
+                max_workers=4
+            ).read_recursive(pom)
+
+        self.assertEqual(
+            [m.identifier.artifact_id for m in sequential_modules],
+            ["root", "a", "a-1", "a-2", "a-2-1", "b", "b-1"],
+        )
+        self.assertEqual(
+            [m.identifier.artifact_id for m in parallel_modules],
+            [m.identifier.artifact_id for m in sequential_modules],
+        )
+
+    def test_iter_recursively_yields_modules_while_reading(self) -> None:
+        for max_workers in [1, 4]:
+            with TemporaryDirectory() as directory:
+                pom: Path = self._write_aggregator(
+                    Path(directory), "root", ["a", "broken"]
+                )
+                self._write_aggregator(Path(directory, "a"), "a", [])
+                Path(directory, "broken").mkdir()
+                Path(directory, "broken", "pom.xml").write_text("<project>")
+
+                modules: Iterator[XmlMavenModule] = XmlMavenModuleReader(
+                    max_workers=max_workers
+                ).iter_recursive(pom)
+
+                self.assertEqual(next(modules).identifier.artifact_id, "root")
+                self.assertEqual(next(modules).identifier.artifact_id, "a")
+                self.assertRaises(Exception, lambda: next(modules))
+
+    def test_read_recursively_reads_shared_modules_once(self) -> None:
+        for max_workers in [1, 4]:
+            with TemporaryDirectory() as directory:
+                pom: Path = self._write_aggregator(Path(directory), "root", ["a", "b"])
+                self._write_aggregator(Path(directory, "a"), "a", ["../shared"])
+                self._write_aggregator(Path(directory, "b"), "b", ["../shared"])
+                self._write_aggregator(Path(directory, "shared"), "shared", [])
+
+                sut: XmlMavenModuleReader = XmlMavenModuleReader(
+                    max_workers=max_workers
+                )
+
+                self.assertEqual(
+                    [m.identifier.artifact_id for m in sut.read_recursive(pom)],
+                    ["root", "a", "shared", "b"],
+                )
+                self.assertEqual(sut.read_recursive(pom), [])
+
+                sut.reset_visited()
+
+                self.assertEqual(len(sut.read_recursive(pom)), 4)
+
+    def test_read_recursively_multiple_roots(self) -> None:
+        with TemporaryDirectory() as directory:
+            first_pom: Path = self._write_aggregator(
+                Path(directory, "first"), "first", ["../shared"]
+            )
+            second_pom: Path = self._write_aggregator(
+                Path(directory, "second"), "second", ["../shared"]
+            )
+            self._write_aggregator(Path(directory, "shared"), "shared", [])
+
+            modules: List[XmlMavenModule] = XmlMavenModuleReader().read_recursive(
+                first_pom, second_pom, first_pom
+            )
+
+            self.assertEqual(
+                [m.identifier.artifact_id for m in modules],
+                ["first", "shared", "second"],
+            )
+
+    def test_read_recursively_detects_cycles(self) -> None:
+        for max_workers in [1, 4]:
+            with TemporaryDirectory() as directory:
+                pom: Path = self._write_aggregator(Path(directory), "root", ["a"])
+                self._write_aggregator(Path(directory, "a"), "a", ["b"])
+                self._write_aggregator(Path(directory, "a", "b"), "b", ["../.."])
+
+                with self.assertRaisesRegex(AssertionError, "Cyclic Maven modules"):
+                    XmlMavenModuleReader(max_workers=max_workers).read_recursive(pom)
+
+    def test_read_recursively_detects_cycles_of_visited_modules(self) -> None:
+        for max_workers in [1, 4]:
+            with TemporaryDirectory() as directory:
+                # both modules are scheduled by the root, before they list each other
+                pom: Path = self._write_aggregator(Path(directory), "root", ["a", "b"])
+                self._write_aggregator(Path(directory, "a"), "a", ["../b"])
+                self._write_aggregator(Path(directory, "b"), "b", ["../a"])
+
+                with self.assertRaisesRegex(
+                    AssertionError, r"Cyclic Maven modules: .*b.* -> .*a.* -> .*b"
+                ):
+                    XmlMavenModuleReader(max_workers=max_workers).read_recursive(pom)
+
+    def test_iter_all_reads_given_poms_only(self) -> None:
+        for max_workers in [1, 4]:
+            with TemporaryDirectory() as directory:
+                pom: Path = self._write_aggregator(Path(directory), "root", ["a"])
+                a_pom: Path = self._write_aggregator(Path(directory, "a"), "a", ["b"])
+                b_pom: Path = self._write_aggregator(Path(directory, "a", "b"), "b", [])
+
+                sut: XmlMavenModuleReader = XmlMavenModuleReader(
+                    max_workers=max_workers
+                )
+
+                self.assertEqual(
+                    [
+                        m.identifier.artifact_id
+                        for m in sut.iter_all([b_pom, pom, b_pom])
+                    ],
+                    ["b", "root"],
+                )
+                self.assertEqual(
+                    [
+                        m.identifier.artifact_id
+                        for m in sut.iter_all(iter([a_pom, pom, b_pom]))
+                    ],
+                    ["a"],
+                )
+
+    def test_read_recursively_from_cache(self) -> None:
+        with TemporaryDirectory() as directory:
+            pom: Path = self._write_reactor(Path(directory), 2, 3)
+            cache: FileCache = FileCache(Path(directory, "cache"))
+
+            parsed_modules: List[XmlMavenModule] = XmlMavenModuleReader(
+                cache=cache
+            ).read_recursive(pom)
+            cached_modules: List[XmlMavenModule] = XmlMavenModuleReader(
+                cache=cache
+            ).read_recursive(pom)
+
+            self.assertFalse(
+                any(
+                    isinstance(m.xml_document, SourceXmlDocument)
+                    for m in parsed_modules
+                )
+            )
+            self.assertTrue(
+                all(
+                    isinstance(m.xml_document, SourceXmlDocument)
+                    for m in cached_modules
+                )
+            )
+            self.assertEqual(
+                [str(m.identifier) for m in cached_modules],
+                [str(m.identifier) for m in parsed_modules],
+            )
+            self.assertEqual(
+                [len(m.dependencies) for m in cached_modules],
+                [len(m.dependencies) for m in parsed_modules],
+            )
+
+            child: XmlMavenModule = cached_modules[1]
+            self.assertIs(
+                cast(XmlMavenModuleIdentifier, child.identifier).version_node,
+                cast(XmlMavenModuleIdentifier, child.parent_identifier).version_node,
+            )
+
+            child.identifier.version = "2.0.0"
+            child.xml_document.save(child.pom_file)
+
+            reread_modules: List[XmlMavenModule] = XmlMavenModuleReader(
+                cache=cache
+            ).read_recursive(pom)
+
+            self.assertNotIsInstance(reread_modules[1].xml_document, SourceXmlDocument)
+            self.assertEqual(reread_modules[1].identifier.version, "2.0.0")
+            self.assertEqual(reread_modules[1].parent_identifier.version, "2.0.0")
+
+    def test_read_large_reactor_recursively_peak_memory(self) -> None:
+        module_count: int = 200
+        with TemporaryDirectory() as directory:
+            pom: Path = self._write_reactor(Path(directory), module_count, 50)
+
+            sut: XmlMavenModuleReader = XmlMavenModuleReader()
+
+            tracemalloc.start()
+            try:
+                modules: List[XmlMavenModule] = sut.read_recursive(pom)
+                _, peak = tracemalloc.get_traced_memory()
+
+            finally:
+                tracemalloc.stop()
+
+        self.assertEqual(len(modules), module_count + 1)
+        self.assertLess(peak / len(modules), self.MAX_PEAK_BYTES_PER_MODULE)
+
+    @staticmethod
+    def _write_reactor(
+        directory: Path, module_count: int, dependency_count: int
+    ) -> Path:
+        names: List[str] = [f"module-{index}" for index in range(module_count)]
+        dependencies: str = "".join(
+            [
+                "<dependency>"
+                "<groupId>com.example</groupId>"
+                f"<artifactId>dependency-{index}</artifactId>"
+                "<version>1.0.0</version>"
+                "</dependency>\n"
+                for index in range(dependency_count)
+            ]
+        )
+
+        for name in names:
+            Path(directory, name).mkdir()
+            Path(directory, name, "pom.xml").write_text(
+                '<project xmlns="http://maven.apache.org/POM/4.0.0">\n'
+                "<parent><groupId>com.example</groupId><artifactId>parent</artifactId><version>1.0.0</version></parent>\n"
+                f"<artifactId>{name}</artifactId>\n"
+                f"<dependencies>\n{dependencies}</dependencies>\n"
+                "</project>\n"
+            )
+
+        pom: Path = Path(directory, "pom.xml")
+        pom.write_text(
+            '<project xmlns="http://maven.apache.org/POM/4.0.0">\n'
+            "<groupId>com.example</groupId><artifactId>parent</artifactId><version>1.0.0</version>\n"
+            f"<modules>{''.join([f'<module>{name}</module>' for name in names])}</modules>\n"
+            "</project>\n"
+        )
+
+        return pom
+
+    @staticmethod
+    def _write_aggregator(
+        directory: Path, artifact_id: str, modules: List[str]
+    ) -> Path:
+        directory.mkdir(parents=True, exist_ok=True)
+
+        pom: Path = Path(directory, "pom.xml")
+        pom.write_text(
+            "<project>"
+            f"<groupId>com.example</groupId><artifactId>{artifact_id}</artifactId><version>1.0.0</version>"
+            f"<modules>{''.join([f'<module>{module}</module>' for module in modules])}</modules>"
+            "</project>"
+        )
+
+        return pom
@@ -1,7 +1,10 @@
+import shutil
 from pathlib import Path
-from typing import List
+from tempfile import TemporaryDirectory
+from typing import Dict, List
 from unittest import TestCase
 
+from __test__.java.maven.pom_fixture import PomFixture
 from java.maven.maven_module_identifier import MavenModuleIdentifier
 from java.maven.maven_property import MavenProperty
 from java.maven.xml_maven_module import XmlMavenModule
@@ -30,12 +33,13 @@ class TestXmlMavenProject(TestCase):
         self.assertIsNotNone(module.parent_identifier)
         self.assertEqual(module.parent_identifier.version, "1.1.1")
 
-        self.assertEqual(len(module.dependencies), 3)
+        self.assertEqual(len(module.dependencies), 1)
+        self.assertEqual(len(module.managed_dependencies), 2)
         self.assertDependencyVersion(
-            module.dependencies, "com.example", "dpm-with-version", "0.42.0"
+            module.managed_dependencies, "com.example", "dpm-with-version", "0.42.0"
         )
         self.assertDependencyVersion(
-            module.dependencies,
+            module.managed_dependencies,
             "com.example",
             "dpm-with-property-version",
             "${dependency.version}",
@@ -56,12 +60,13 @@ class TestXmlMavenProject(TestCase):
         self.assertIsNotNone(module.parent_identifier)
         self.assertEqual(module.parent_identifier.version, "1.1.1")
 
-        self.assertEqual(len(module.dependencies), 3)
+        self.assertEqual(len(module.dependencies), 1)
+        self.assertEqual(len(module.managed_dependencies), 2)
         self.assertDependencyVersion(
-            module.dependencies, "com.example", "dpm-with-version", "0.42.0"
+            module.managed_dependencies, "com.example", "dpm-with-version", "0.42.0"
         )
         self.assertDependencyVersion(
-            module.dependencies,
+            module.managed_dependencies,
             "com.example",
             "dpm-with-property-version",
             "${dependency.version}",
@@ -70,6 +75,190 @@ class TestXmlMavenProject(TestCase):
             module.dependencies, "com.example", "dp-with-version", "0.1.0"
         )
 
+    def test_add_all_modules_while_reading(self) -> None:
+        sut: XmlMavenProject = XmlMavenProject()
+        sut.add_all_modules(
+            XmlMavenModuleReader().iter_recursive(
+                Path(self.RESOURCES, "multi_module", "pom.xml")
+            )
+        )
+
+        self.assertEqual(
+            sorted(
+                [
+                    f"{module.identifier.artifact_id}:{version}"
+                    for module, version in sut.get_module_versions().items()
+                ]
+            ),
+            ["application:13.3.7", "sub-module:13.3.7"],
+        )
+
+    def test_resolve_inherited_properties_after_adding_parent(self) -> None:
+        with TemporaryDirectory() as directory:
+            parent_pom: Path = Path(directory, "pom.xml")
+            parent_pom.write_text(
+                "<project><groupId>com.example</groupId><artifactId>parent</artifactId>"
+                "<version>${revision}</version><properties><revision>1.0.0</revision></properties></project>"
+            )
+            Path(directory, "child").mkdir()
+            child_pom: Path = Path(directory, "child", "pom.xml")
+            child_pom.write_text(
+                "<project><parent><groupId>com.example</groupId><artifactId>parent</artifactId>"
+                "<version>${revision}</version></parent><artifactId>child</artifactId></project>"
+            )
+
+            sut: XmlMavenProject = XmlMavenProject()
+            sut.add_modules(XmlMavenModuleReader().read(child_pom))
+
+            self.assertRaisesRegex(
+                AssertionError, "parent module", sut.get_module_versions
+            )
+
+            sut.add_modules(XmlMavenModuleReader().read(parent_pom))
+
+            self.assertEqual(
+                sorted(sut.get_module_versions().values()), ["1.0.0", "1.0.0"]
+            )
+
+    def test_uniform_version(self) -> None:
+        modules: List[XmlMavenModule] = XmlMavenModuleReader().read_recursive(
+            Path(self.RESOURCES, "multi_module", "pom.xml")
+        )
+
+        sut: XmlMavenProject = XmlMavenProject()
+        sut.add_modules(*modules)
+
+        self.assertEqual(sut.uniform_version, "13.3.7")
+
+        versions: Dict[XmlMavenModule, str] = sut.get_module_versions()
+        modules[0].properties[0].value = "changed"
+
+        # properties that are no versions do not invalidate the versions
+        self.assertEqual(sut.get_module_versions(), versions)
+
+        modules[1].identifier.version = "1.0.0"
+
+        self.assertIsNone(sut.uniform_version)
+        self.assertEqual(
+            sorted(sut.get_module_versions().values()), ["1.0.0", "13.3.7"]
+        )
+
+        sut.bump_version(
+            XmlMavenProject.VersionBumpType.MINOR,
+            assert_uniform_version=False,
+            write_modules=False,
+        )
+
+        self.assertEqual(
+            sorted(sut.get_module_versions().values()), ["1.1.0", "13.4.0"]
+        )
+
+    def test_plan_and_apply_bump(self) -> None:
+        with TemporaryDirectory() as directory:
+            shutil.copytree(
+                Path(self.RESOURCES, "multi_module"), Path(directory, "multi_module")
+            )
+            modules: List[XmlMavenModule] = XmlMavenModuleReader().read_recursive(
+                Path(directory, "multi_module", "pom.xml")
+            )
+
+            sut: XmlMavenProject = XmlMavenProject()
+            sut.add_modules(*modules)
+
+            change_set: XmlMavenProject.VersionChangeSet = sut.plan_bump(
+                XmlMavenProject.VersionBumpType.MAJOR
+            )
+
+            self.assertEqual(
+                [
+                    (c.pom_file.parent.name, c.path, c.old_version, c.new_version)
+                    for c in change_set.changes
+                ],
+                [
+                    ("multi_module", "project/version", "13.3.7", "14.0.0"),
+                    ("sub-module", "project/parent/version", "13.3.7", "14.0.0"),
+                ],
+            )
+            self.assertEqual(sut.uniform_version, "13.3.7")
+            self.assertFalse(any(m.xml_document.is_dirty for m in modules))
+
+            written_files: List[Path] = sut.apply(change_set)
+
+            self.assertEqual(
+                sorted(written_files), sorted([m.pom_file.resolve() for m in modules])
+            )
+            self.assertEqual(sut.uniform_version, "14.0.0")
+            self.assertEqual(
+                XmlMavenModuleReader()
+                .read(Path(directory, "multi_module", "sub-module", "pom.xml"))
+                .identifier.version,
+                "14.0.0",
+            )
+            self.assertRaises(AssertionError, lambda: sut.apply(change_set))
+
+    def test_plan_set_version(self) -> None:
+        modules: List[XmlMavenModule] = XmlMavenModuleReader().read_recursive(
+            Path(self.RESOURCES, "multi_module", "pom.xml")
+        )
+
+        sut: XmlMavenProject = XmlMavenProject()
+        sut.add_modules(*modules)
+
+        change_set: XmlMavenProject.VersionChangeSet = sut.plan_set_version(
+            "2.0.0-SNAPSHOT"
+        )
+
+        self.assertEqual(
+            [c.new_version for c in change_set.changes],
+            ["2.0.0-SNAPSHOT", "2.0.0-SNAPSHOT"],
+        )
+
+        sut.apply(change_set, write=False)
+
+        self.assertEqual(sut.uniform_version, "2.0.0-SNAPSHOT")
+        self.assertTrue(sut.plan_set_snapshot(True).is_empty())
+
+        sut.apply(sut.plan_set_snapshot(False), write=False)
+
+        self.assertEqual(sut.uniform_version, "2.0.0")
+
+        sut.apply(sut.plan_set_snapshot(True), write=False)
+
+        self.assertEqual(sut.uniform_version, "2.0.0-SNAPSHOT")
+
+    def test_plan_ignores_references_to_module_version(self) -> None:
+        with TemporaryDirectory() as directory:
+            # the parent manages 'a' with '${project.version}', and 'a' manages 'b' with the version of its parent
+            root: PomFixture = PomFixture.of("root").with_modules("a", "b")
+            root.with_managed_dependencies("a").write(Path(directory))
+            a: PomFixture = PomFixture.of("a").with_parent()
+            a = a.with_managed_dependencies("b", version="${project.parent.version}")
+            a.write(Path(directory, "a"))
+            PomFixture.of("b").with_parent().write(Path(directory, "b"))
+
+            sut: XmlMavenProject = XmlMavenProject()
+            sut.add_all_modules(
+                XmlMavenModuleReader().read_recursive(Path(directory, "pom.xml"))
+            )
+
+            # the references follow the version of the module that contains them
+            self.assertEqual(
+                [
+                    (c.pom_file.parent.name, c.path, c.new_version)
+                    for c in sut.plan_set_version("2.0.0").changes
+                ],
+                [
+                    (Path(directory).name, "project/version", "2.0.0"),
+                    ("a", "project/parent/version", "2.0.0"),
+                    ("a", "project/version", "2.0.0"),
+                    ("b", "project/parent/version", "2.0.0"),
+                    ("b", "project/version", "2.0.0"),
+                ],
+            )
+            self.assertEqual(
+                len(sut.plan_bump(XmlMavenProject.VersionBumpType.PATCH).changes), 5
+            )
+
     def test_bump_version_with_multi_module(self) -> None:
         modules: List[XmlMavenModule] = XmlMavenModuleReader().read_recursive(
             Path(self.RESOURCES, "multi_module", "pom.xml")
@@ -0,0 +1,105 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List, Optional
+from unittest import TestCase
+
+from __test__.java.maven.pom_fixture import PomFixture
+from __test__.shell.mock.mock_shell import MockShell, MockShellResponse
+from __test__.string_matcher import StringMatcher
+from java.maven.maven_module import MavenModule
+from java.maven.xml_maven_module_reader import XmlMavenModuleReader
+from maven_impact import _get_changed_files, find_impacted_modules
+
+
+class TestMavenImpact(TestCase):
+    def setUp(self) -> None:
+        self._directory: TemporaryDirectory = TemporaryDirectory()
+        self._root: Path = Path(self._directory.name)
+
+        # the parent manages the versions of its children, which depend on each other without a version
+        self._write_pom(
+            PomFixture.of("root")
+            .with_modules("a", "b", "c")
+            .with_managed_dependencies("a", "b")
+        )
+        self._write_pom(PomFixture.of("a").with_parent())
+        self._write_pom(
+            PomFixture.of("b").with_parent().with_dependencies("a", version=None)
+        )
+        self._write_pom(PomFixture.of("c").with_parent())
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def test_get_changed_files(self) -> None:
+        shell: MockShell = self._mock_shell("a/src/A.java", "README.md")
+
+        self.assertEqual(
+            _get_changed_files(Path(self._root, "a"), "main...HEAD", shell),
+            [Path(self._root, "a", "src", "A.java"), Path(self._root, "README.md")],
+        )
+
+    def test_find_impacted_modules_of_changed_sources(self) -> None:
+        self.assertEqual(self._find("a/src/main/java/A.java"), ["a", "b"])
+        self.assertEqual(self._find("b/README.md"), ["b"])
+        self.assertEqual(
+            self._find("a/src/main/java/A.java", include_dependents=False), ["a"]
+        )
+
+    def test_find_impacted_modules_of_changed_parent(self) -> None:
+        # children only inherit the POM of their parent, not the other files it owns
+        self.assertEqual(self._find("config/checkstyle.xml"), ["root"])
+        self.assertEqual(self._find("README.md", ".github/ci.yml"), ["root"])
+        self.assertEqual(self._find("pom.xml"), ["root", "a", "c", "b"])
+        self.assertEqual(self._find("pom.xml", include_dependents=False), ["root"])
+
+    def test_find_impacted_modules_of_ignored_files(self) -> None:
+        ignored_files: List[str] = ["*.md", ".github/"]
+
+        self.assertEqual(
+            self._find("README.md", ".github/ci.yml", ignored_files=ignored_files), []
+        )
+        self.assertEqual(
+            self._find("a/README.md", "b/pom.xml", ignored_files=ignored_files), ["b"]
+        )
+        self.assertEqual(
+            self._find("config/checkstyle.xml", ignored_files=ignored_files), ["root"]
+        )
+
+    def _find(
+        self,
+        *changed_files: str,
+        include_dependents: bool = True,
+        ignored_files: Optional[List[str]] = None,
+    ) -> List[str]:
+        modules: List[MavenModule] = find_impacted_modules(
+            [Path(self._root, "pom.xml")],
+            "main...HEAD",
+            include_dependents,
+            self._mock_shell(*changed_files),
+            XmlMavenModuleReader(
+                read_only=True,
+                sections=[XmlMavenModuleReader.Section.BUILD_DEPENDENCIES],
+            ),
+            ignored_files,
+        )
+
+        return [m.identifier.artifact_id for m in modules]
+
+    def _mock_shell(self, *changed_files: str) -> MockShell:
+        shell: MockShell = MockShell()
+        shell.when_command(StringMatcher.exact("git")).has_argument(
+            StringMatcher.exact("rev-parse --show-toplevel")
+        ).then_return(MockShellResponse.of_success(f"{self._root}\n"))
+        shell.when_command(StringMatcher.exact("git")).has_argument(
+            StringMatcher.exact("diff --name-only --no-renames -z main...HEAD --")
+        ).then_return(MockShellResponse.of_success("\0".join(changed_files)))
+
+        return shell
+
+    def _write_pom(self, pom: PomFixture) -> None:
+        pom.write(
+            self._root
+            if pom.artifact_id == "root"
+            else Path(self._root, pom.artifact_id)
+        )
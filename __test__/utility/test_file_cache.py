@@ -0,0 +1,76 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from utility.file_cache import FileCache
+
+
+class TestFileCache(TestCase):
+    def test_read_written_entry(self) -> None:
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            file.write_text("<project />")
+
+            sut: FileCache = FileCache(Path(directory, "cache"))
+
+            entry: FileCache.Entry = sut.read(file)
+            self.assertEqual(entry.source, b"<project />")
+            self.assertIsNone(entry.data)
+
+            sut.write(entry, {"key": "value"})
+
+            self.assertEqual(sut.read(file).data, {"key": "value"})
+            self.assertEqual(
+                FileCache(Path(directory, "cache")).read(file).data, {"key": "value"}
+            )
+
+    def test_read_changed_file(self) -> None:
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            file.write_text("<project />")
+
+            sut: FileCache = FileCache(Path(directory, "cache"))
+            sut.write(sut.read(file), {"key": "value"})
+
+            # same size and modification time, but different content
+            stat: os.stat_result = file.stat()
+            file.write_text("<changed />")
+            os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            self.assertIsNone(sut.read(file).data)
+
+    def test_read_corrupt_entry(self) -> None:
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            file.write_text("<project />")
+
+            sut: FileCache = FileCache(Path(directory, "cache"))
+            sut.write(sut.read(file), {"key": "value"})
+
+            for cache_file in Path(directory, "cache").iterdir():
+                cache_file.write_text("{")
+
+            self.assertIsNone(sut.read(file).data)
+
+    def test_write_removes_old_entries(self) -> None:
+        with TemporaryDirectory() as directory:
+            old_file: Path = Path(directory, "old.xml")
+            old_file.write_text("<project />")
+            file: Path = Path(directory, "pom.xml")
+            file.write_text("<project />")
+
+            cache_directory: Path = Path(directory, "cache")
+            FileCache(cache_directory).write(
+                FileCache(cache_directory).read(old_file), {"key": "old"}
+            )
+            Path(cache_directory, ".interrupted.tmp").write_text("{")
+            for cache_file in cache_directory.iterdir():
+                os.utime(cache_file, ns=(0, 0))
+
+            sut: FileCache = FileCache(cache_directory, max_age_ns=60_000_000_000)
+            sut.write(sut.read(file), {"key": "value"})
+
+            self.assertEqual(len(list(cache_directory.iterdir())), 1)
+            self.assertIsNone(sut.read(old_file).data)
+            self.assertEqual(sut.read(file).data, {"key": "value"})
@@ -0,0 +1,73 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+from unittest import TestCase
+
+from __test__.java.maven.pom_fixture import PomFixture
+from java.maven.xml_maven_module import XmlMavenModule
+from java.maven.xml_maven_module_reader import XmlMavenModuleReader
+from shell.shell import DefaultShell, Shell
+from utility.git_blob_reader import GitBlobReader
+
+
+class TestGitBlobReader(TestCase):
+    def setUp(self) -> None:
+        self._directory: TemporaryDirectory = TemporaryDirectory()
+        self._root: Path = Path(self._directory.name)
+        self._shell: Shell = DefaultShell.new()
+        self._git("init", "-q")
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def test_read(self) -> None:
+        file: Path = Path(self._root, "sub", "file.txt")
+        file.parent.mkdir()
+        file.write_bytes(b"first\n")
+        self._commit()
+        file.write_bytes(b"second\r\n")
+        self._commit()
+        file.write_bytes(b"work tree")
+
+        with GitBlobReader(self._root, self._shell) as sut:
+            self.assertEqual(sut.read("HEAD~1", file), b"first\n")
+            self.assertEqual(sut.read("HEAD", file), b"second\r\n")
+            self.assertRaises(
+                AssertionError, lambda: sut.read("HEAD", Path(self._root, "missing"))
+            )
+            self.assertEqual(sut.read("HEAD~1", file), b"first\n")
+
+        self.assertEqual(file.read_bytes(), b"work tree")
+
+    def test_read_modules_of_revision(self) -> None:
+        pom: Path = PomFixture.of("root").with_modules("a").write(self._root)
+        PomFixture.of("a").write(Path(self._root, "a"))
+        self._commit()
+        PomFixture.of("root", "2.0.0").with_modules("b").write(self._root)
+        PomFixture.of("b", "2.0.0").write(Path(self._root, "b"))
+
+        with GitBlobReader(self._root, self._shell) as blob_reader:
+            modules: List[XmlMavenModule] = XmlMavenModuleReader.of_revision(
+                blob_reader, "HEAD", read_only=True, sections=[]
+            ).read_recursive(pom)
+
+        self.assertEqual(
+            [(m.identifier.artifact_id, m.identifier.version) for m in modules],
+            [("root", "1.0.0"), ("a", "1.0.0")],
+        )
+
+    def _commit(self) -> None:
+        self._git("add", "-A")
+        self._git(
+            "-c",
+            "user.name=test",
+            "-c",
+            "user.email=test@example.com",
+            "commit",
+            "-q",
+            "-m",
+            "commit",
+        )
+
+    def _git(self, *arguments: str) -> None:
+        self._shell.run_or_raise("git", list(arguments), self._root)
@@ -0,0 +1,52 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from utility.xml.default_xml_document import DefaultXmlDocument
+from utility.xml.e_tree_xml_document import ETreeXmlDocument
+from utility.xml.xml_document import XmlDocument
+from utility.xml.xml_path import XmlPath
+
+
+class TestDefaultXmlDocument(TestCase):
+    def test_parse_uses_patching_backend(self) -> None:
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            file.write_text("<project><version>1.0.0</version></project>")
+
+            sut: XmlDocument = DefaultXmlDocument.parse(file)
+
+            self.assertIsInstance(sut, ETreeXmlDocument)
+            self.assertEqual(sut.find_first_node("project", "version").text, "1.0.0")
+
+    def test_save_changes_only_changed_texts(self) -> None:
+        content: bytes = (
+            b"<?xml version='1.0' encoding='UTF-8'?>\r\n"
+            b"<project xmlns='namespace'>\r\n"
+            b"  <version>1.0.0</version>\r\n"
+            b"  <name></name>\r\n"
+            b"  <description>a&#x20;b</description>\r\n"
+            b"</project>\r\n"
+        )
+
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            file.write_bytes(content)
+
+            sut: XmlDocument = DefaultXmlDocument.parse(file)
+            sut.find_first_node("project", "version").text = "1.0.1"
+            sut.save(file)
+
+            self.assertEqual(file.read_bytes(), content.replace(b"1.0.0", b"1.0.1"))
+
+    def test_parse_read_only(self) -> None:
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            file.write_text("<project><version>1.0.0</version></project>")
+
+            sut: XmlDocument = DefaultXmlDocument.parse_read_only(
+                file, XmlPath.compile("project", "version")
+            )
+
+            self.assertEqual(sut.find_first_node("project", "version").text, "1.0.0")
+            self.assertRaises(AssertionError, lambda: sut.save(file))
@@ -0,0 +1,101 @@
+from typing import Optional
+from unittest import TestCase
+from xml.etree.ElementTree import Element, TreeBuilder, XMLParser
+
+from utility.xml.e_tree_source_patcher import ETreeSourcePatcher
+
+
+class TestETreeSourcePatcher(TestCase):
+    SOURCE: bytes = b"""<?xml version='1.0' encoding='UTF-8'?>
+<!-- leading comment -->
+<project   xmlns="namespace"   attribute='a > b'>
+    <!-- comment -->
+    <version>1.0.0</version>
+    <empty/>
+    <spaced   />
+    <nested><child>text</child></nested>
+</project>
+"""
+
+    def test_patch_leaf_text(self) -> None:
+        root: Element = self._parse()
+        sut: ETreeSourcePatcher = ETreeSourcePatcher(self.SOURCE, root)
+        root.find("{namespace}version").text = "1.0.1 & more"
+
+        patched: Optional[bytes] = sut.try_patch(root)
+
+        self.assertEqual(
+            patched,
+            self.SOURCE.replace(b"1.0.0", b"1.0.1 &amp; more"),
+        )
+
+    def test_patch_self_closing_elements(self) -> None:
+        root: Element = self._parse()
+        sut: ETreeSourcePatcher = ETreeSourcePatcher(self.SOURCE, root)
+        root.find("{namespace}empty").text = "a"
+        root.find("{namespace}spaced").text = "b"
+
+        patched: Optional[bytes] = sut.try_patch(root)
+
+        self.assertEqual(
+            patched,
+            self.SOURCE.replace(b"<empty/>", b"<empty>a</empty>").replace(
+                b"<spaced   />", b"<spaced>b</spaced>"
+            ),
+        )
+
+    def test_patch_without_changes(self) -> None:
+        root: Element = self._parse()
+        sut: ETreeSourcePatcher = ETreeSourcePatcher(self.SOURCE, root)
+
+        self.assertEqual(sut.try_patch(root), self.SOURCE)
+
+    def test_patch_non_leaf_text_is_not_supported(self) -> None:
+        root: Element = self._parse()
+        sut: ETreeSourcePatcher = ETreeSourcePatcher(self.SOURCE, root)
+        root.find("{namespace}nested").text = "text"
+
+        self.assertIsNone(sut.try_patch(root))
+
+    def test_patch_structural_change_is_not_supported(self) -> None:
+        root: Element = self._parse()
+        sut: ETreeSourcePatcher = ETreeSourcePatcher(self.SOURCE, root)
+        root.append(Element("{namespace}new"))
+
+        self.assertIsNone(sut.try_patch(root))
+
+    def test_patch_changed_attribute_is_not_supported(self) -> None:
+        root: Element = self._parse()
+        sut: ETreeSourcePatcher = ETreeSourcePatcher(self.SOURCE, root)
+        root.set("attribute", "changed")
+
+        self.assertIsNone(sut.try_patch(root))
+
+    def test_patch_changed_tail_is_not_supported(self) -> None:
+        root: Element = self._parse()
+        sut: ETreeSourcePatcher = ETreeSourcePatcher(self.SOURCE, root)
+        root.find("{namespace}version").tail = "\n"
+
+        self.assertIsNone(sut.try_patch(root))
+
+    def test_patch_replaced_element_is_not_supported(self) -> None:
+        root: Element = self._parse()
+        sut: ETreeSourcePatcher = ETreeSourcePatcher(self.SOURCE, root)
+        # the element count stays the same
+        root.remove(root.find("{namespace}empty"))
+        root.append(Element("{namespace}other"))
+
+        self.assertIsNone(sut.try_patch(root))
+
+    def test_patch_renamed_element_is_not_supported(self) -> None:
+        root: Element = self._parse()
+        sut: ETreeSourcePatcher = ETreeSourcePatcher(self.SOURCE, root)
+        root.find("{namespace}empty").tag = "{namespace}other"
+
+        self.assertIsNone(sut.try_patch(root))
+
+    def _parse(self) -> Element:
+        parser: XMLParser = XMLParser(target=TreeBuilder(insert_comments=True))
+        parser.feed(self.SOURCE)
+
+        return parser.close()
@@ -0,0 +1,75 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+from unittest import TestCase
+
+from utility.xml.e_tree_streaming_xml_document import ETreeStreamingXmlDocument
+from utility.xml.xml_node import XmlNode
+from utility.xml.xml_path import XmlPath
+
+
+class TestETreeStreamingXmlDocument(TestCase):
+    CONTENT: str = """<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="namespace">
+    <version>1.0.0</version>
+    <build>
+        <plugins>
+            <plugin><artifactId>kept</artifactId></plugin>
+        </plugins>
+        <extensions>
+            <extension><artifactId>dropped</artifactId></extension>
+        </extensions>
+    </build>
+    <reporting>
+        <plugins>
+            <plugin><artifactId>dropped</artifactId></plugin>
+        </plugins>
+    </reporting>
+</project>
+"""
+
+    def test_parse_keeps_only_given_paths(self) -> None:
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            file.write_text(self.CONTENT)
+
+            sut: ETreeStreamingXmlDocument = ETreeStreamingXmlDocument.parse(
+                file,
+                XmlPath.compile("project", "version"),
+                XmlPath.compile("project", "build", "plugins"),
+            )
+
+        self.assertEqual(sut.find_first_node("project", "version").text, "1.0.0")
+
+        artifact_ids: List[XmlNode] = sut.query_all_nodes(
+            XmlPath.compile("**", "artifactId")
+        )
+        self.assertEqual([node.text for node in artifact_ids], ["kept"])
+
+        self.assertEqual(
+            [node.name for node in sut.find_first_node("project").nodes],
+            ["version", "build"],
+        )
+        self.assertEqual(
+            [node.name for node in sut.find_first_node("project", "build").nodes],
+            ["plugins"],
+        )
+
+    def test_save_is_not_supported(self) -> None:
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            file.write_text(self.CONTENT)
+
+            sut: ETreeStreamingXmlDocument = ETreeStreamingXmlDocument.parse(
+                file, XmlPath.compile("project", "version")
+            )
+
+            self.assertRaises(AssertionError, lambda: sut.save(file))
+
+    def test_parse_rejects_descendant_paths(self) -> None:
+        self.assertRaises(
+            AssertionError,
+            lambda: ETreeStreamingXmlDocument.parse(
+                Path("pom.xml"), XmlPath.compile("**", "version")
+            ),
+        )
@@ -1,17 +1,36 @@
-from typing import Optional
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict, List, Optional
 from unittest import TestCase
 from xml.etree.ElementTree import Element, ElementTree
 
+from utility.type_utility import get_or_else
 from utility.xml.e_tree_xml_document import ETreeXmlDocument
+from utility.xml.xml_document import XmlDocument
 from utility.xml.xml_node import XmlNode
+from utility.xml.xml_path import XmlPath
 
 
 class TestETreeXmlDocument(TestCase):
+    def _create_element(
+        self, tag: str, attributes: Optional[Dict[str, str]] = None
+    ) -> Element:
+        return Element(tag, get_or_else(attributes, dict))
+
+    def _create_tree(self, root_element: Element) -> ElementTree:
+        return ElementTree(root_element)
+
+    def _create_sut(self, tree: ElementTree) -> XmlDocument:
+        return ETreeXmlDocument(tree)
+
+    def _parse(self, file: Path) -> XmlDocument:
+        return ETreeXmlDocument.parse(file)
+
     def test_find_root_node(self) -> None:
-        root_element: Element = Element("{root-namespace}root-node")
-        tree: ElementTree = ElementTree(root_element)
+        root_element: Element = self._create_element("{root-namespace}root-node")
+        tree: ElementTree = self._create_tree(root_element)
 
-        sut: ETreeXmlDocument = ETreeXmlDocument(tree)
+        sut: XmlDocument = self._create_sut(tree)
 
         root_node: Optional[XmlNode] = sut.find_first_node("root-node")
 
@@ -21,15 +40,15 @@ class TestETreeXmlDocument(TestCase):
         self.assertIsNone(root_node.text)
 
     def test_find_nested_node(self) -> None:
-        root_element: Element = Element("{root-namespace}root-node")
+        root_element: Element = self._create_element("{root-namespace}root-node")
         root_element.text = "root-text"
-        sub_element: Element = Element("{sub-namespace}sub-node")
+        sub_element: Element = self._create_element("{sub-namespace}sub-node")
         sub_element.text = "sub-text"
         root_element.append(sub_element)
 
-        tree: ElementTree = ElementTree(root_element)
+        tree: ElementTree = self._create_tree(root_element)
 
-        sut: ETreeXmlDocument = ETreeXmlDocument(tree)
+        sut: XmlDocument = self._create_sut(tree)
 
         sub_node: Optional[XmlNode] = sut.find_first_node("root-node", "sub-node")
 
@@ -37,3 +56,187 @@ class TestETreeXmlDocument(TestCase):
         self.assertEqual(sub_node.name, "sub-node")
         self.assertEqual(sub_node.namespace, "sub-namespace")
         self.assertEqual(sub_node.text, "sub-text")
+
+    def test_find_all_nested_nodes(self) -> None:
+        root_element: Element = self._create_element("{root-namespace}root-node")
+        for text in ["sub-text-1", "sub-text-2"]:
+            sub_element: Element = self._create_element("{sub-namespace}sub-node")
+            sub_element.text = text
+            root_element.append(sub_element)
+
+        tree: ElementTree = self._create_tree(root_element)
+
+        sut: XmlDocument = self._create_sut(tree)
+
+        sub_nodes: List[XmlNode] = sut.find_all_nodes("root-node", "sub-node")
+
+        self.assertEqual(
+            [node.text for node in sub_nodes], ["sub-text-1", "sub-text-2"]
+        )
+
+    def test_query_nodes(self) -> None:
+        root_element: Element = self._create_element("{root-namespace}root-node")
+        for namespace in ["sub-namespace-1", "sub-namespace-2"]:
+            sub_element: Element = self._create_element(f"{{{namespace}}}sub-node")
+            nested_element: Element = self._create_element(
+                f"{{{namespace}}}nested-node"
+            )
+            nested_element.text = namespace
+            sub_element.append(nested_element)
+            root_element.append(sub_element)
+
+        tree: ElementTree = self._create_tree(root_element)
+
+        sut: XmlDocument = self._create_sut(tree)
+
+        all_nodes: List[XmlNode] = sut.query_all_nodes(
+            XmlPath.compile("root-node", "*", "nested-node")
+        )
+        self.assertEqual(
+            [node.text for node in all_nodes], ["sub-namespace-1", "sub-namespace-2"]
+        )
+
+        descendant_nodes: List[XmlNode] = sut.query_all_nodes(
+            XmlPath.compile("**", "nested-node")
+        )
+        self.assertEqual(
+            [node.text for node in descendant_nodes],
+            ["sub-namespace-1", "sub-namespace-2"],
+        )
+
+        first_node: Optional[XmlNode] = sut.query_first_node(
+            XmlPath.compile("root-node", "sub-node", "nested-node")
+        )
+        self.assertIs(first_node, all_nodes[0])
+        self.assertIs(
+            first_node, sut.find_first_node("root-node", "sub-node", "nested-node")
+        )
+
+        namespaced_nodes: List[XmlNode] = sut.query_all_nodes(
+            XmlPath.compile("**", "nested-node", namespace="sub-namespace-2")
+        )
+        self.assertEqual([node.text for node in namespaced_nodes], ["sub-namespace-2"])
+
+        self.assertIsNone(sut.query_first_node(XmlPath.compile("other-node")))
+
+    def test_save_patches_changed_text_only(self) -> None:
+        content: str = (
+            "<?xml version='1.0'?>\n"
+            "<project xmlns='namespace'>\n"
+            "  <!-- keep 'me' -->\n"
+            "  <version>1.0.0</version>\n"
+            "</project>\n"
+        )
+
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            file.write_text(content)
+
+            sut: XmlDocument = self._parse(file)
+            sut.find_first_node("project", "version").text = "1.0.1"
+            sut.save(file)
+
+            self.assertEqual(file.read_text(), content.replace("1.0.0", "1.0.1"))
+
+            sut.find_first_node("project", "version").text = "1.0.2"
+            sut.save(file)
+
+            self.assertEqual(file.read_text(), content.replace("1.0.0", "1.0.2"))
+
+    def test_save_keeps_changes_of_the_tree(self) -> None:
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            file.write_text(
+                "<project><a x='1' /><b /><version>1.0.0</version></project>"
+            )
+
+            # changes of the tree that are not made through the nodes cannot be patched into the source
+            sut: XmlDocument = self._parse(file)
+            version: XmlNode = sut.find_first_node("project", "version")
+            version.text = "1.0.1"
+            project: XmlNode = sut.find_first_node("project")
+            project.delegate[0].set("x", "2")
+            project.delegate.remove(project.delegate[1])
+            project.delegate.insert(1, self._create_element("z"))
+            sut.save(file)
+
+            saved: XmlDocument = self._parse(file)
+            self.assertEqual(saved.find_first_node("project", "version").text, "1.0.1")
+            self.assertEqual(
+                saved.find_first_node("project", "a").delegate.get("x"), "2"
+            )
+            self.assertIsNone(saved.find_first_node("project", "b"))
+            self.assertIsNotNone(saved.find_first_node("project", "z"))
+
+    def test_save_serializes_tree_with_double_quotes(self) -> None:
+        root_element: Element = self._create_element(
+            "{root-namespace}root-node", {"key": "va'lue"}
+        )
+        sub_element: Element = self._create_element("{root-namespace}sub-node")
+        sub_element.text = "it's"
+        root_element.append(sub_element)
+
+        sut: XmlDocument = self._create_sut(self._create_tree(root_element))
+
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            sut.save(file)
+
+            self.assertEqual(
+                file.read_text(),
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<root-node xmlns="root-namespace" key="va\'lue">'
+                "<sub-node>it's</sub-node>"
+                "</root-node>",
+            )
+
+    def test_changed_nodes(self) -> None:
+        root_element: Element = self._create_element("root-node")
+        sub_element: Element = self._create_element("sub-node")
+        sub_element.text = "original"
+        root_element.append(sub_element)
+
+        sut: XmlDocument = self._create_sut(self._create_tree(root_element))
+        sub_node: XmlNode = sut.find_first_node("root-node", "sub-node")
+
+        sub_node.text = "original"
+        self.assertFalse(sut.is_dirty)
+
+        sub_node.text = "changed"
+        self.assertTrue(sut.is_dirty)
+        self.assertListEqual(sut.changed_nodes, [sub_node])
+
+        sub_node.text = "original"
+        self.assertFalse(sut.is_dirty)
+        self.assertListEqual(sut.changed_nodes, [])
+
+    def test_save_skips_unchanged_document(self) -> None:
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            file.write_text("<project><version>1.0.0</version></project>")
+
+            sut: XmlDocument = self._parse(file)
+            sut.find_first_node("project", "version").text = "1.0.0"
+
+            # the document must not be written, so external changes remain untouched
+            file.write_text("<project><version>external</version></project>")
+            sut.save(file)
+
+            self.assertEqual(
+                file.read_text(), "<project><version>external</version></project>"
+            )
+
+            sut.find_first_node("project", "version").text = "1.0.1"
+            sut.save(file)
+
+            self.assertFalse(sut.is_dirty)
+            self.assertEqual(
+                file.read_text(), "<project><version>1.0.1</version></project>"
+            )
+
+            other_file: Path = Path(directory, "other.xml")
+            sut.save(other_file)
+
+            self.assertEqual(
+                other_file.read_text(), "<project><version>1.0.1</version></project>"
+            )
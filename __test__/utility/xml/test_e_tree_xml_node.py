@@ -1,4 +1,5 @@
-from typing import List, Optional
+import tracemalloc
+from typing import ClassVar, List, Optional
 from unittest import TestCase
 from xml.etree.ElementTree import Element
 
@@ -7,29 +8,37 @@ from utility.xml.xml_node import XmlNode
 
 
 class TestETreeXmlNode(TestCase):
+    MAX_BYTES_PER_NODE: ClassVar[int] = 200
+
+    def _create_element(self, tag: str) -> Element:
+        return Element(tag)
+
+    def _create_sut(self, element: Element) -> XmlNode:
+        return ETreeXmlNode(element)
+
     def test_get_name(self) -> None:
-        element: Element = Element("{namespace}name")
-        sut: ETreeXmlNode = ETreeXmlNode(element)
+        element: Element = self._create_element("{namespace}name")
+        sut: XmlNode = self._create_sut(element)
 
         self.assertEqual(sut.name, "name")
 
     def test_get_namespace(self) -> None:
-        element: Element = Element("{namespace}name")
-        sut: ETreeXmlNode = ETreeXmlNode(element)
+        element: Element = self._create_element("{namespace}name")
+        sut: XmlNode = self._create_sut(element)
 
         self.assertEqual(sut.namespace, "namespace")
 
     def test_get_text(self) -> None:
-        element: Element = Element("{namespace}name")
+        element: Element = self._create_element("{namespace}name")
         element.text = "Hello, World!"
-        sut: ETreeXmlNode = ETreeXmlNode(element)
+        sut: XmlNode = self._create_sut(element)
 
         self.assertEqual(sut.text, "Hello, World!")
 
     def test_set_text(self) -> None:
-        element: Element = Element("{namespace}name")
+        element: Element = self._create_element("{namespace}name")
         element.text = "Hello, World!"
-        sut: ETreeXmlNode = ETreeXmlNode(element)
+        sut: XmlNode = self._create_sut(element)
 
         sut.text = "foo"
 
@@ -37,21 +46,21 @@ class TestETreeXmlNode(TestCase):
         self.assertEqual(sut.text, "foo")
 
     def test_find_first_node_without_path(self) -> None:
-        element: Element = Element("{namespace}name")
-        sut: ETreeXmlNode = ETreeXmlNode(element)
+        element: Element = self._create_element("{namespace}name")
+        sut: XmlNode = self._create_sut(element)
 
         self.assertEqual(sut, sut.find_first_node())
 
     def test_find_first_nested_node(self) -> None:
-        element: Element = Element("{namespace}name")
-        sub_element: Element = Element("{sub-namespace}sub-name")
+        element: Element = self._create_element("{namespace}name")
+        sub_element: Element = self._create_element("{sub-namespace}sub-name")
         sub_element.text = "sub-text"
 
         element.append(sub_element)
 
-        sut: ETreeXmlNode = ETreeXmlNode(element)
+        sut: XmlNode = self._create_sut(element)
 
-        sub_node: Optional[ETreeXmlNode] = sut.find_first_node("sub-name")
+        sub_node: Optional[XmlNode] = sut.find_first_node("sub-name")
 
         self.assertIsNotNone(sub_node)
         self.assertEqual(sub_node.name, "sub-name")
@@ -59,15 +68,15 @@ class TestETreeXmlNode(TestCase):
         self.assertEqual(sub_node.text, "sub-text")
 
     def test_find_first_nested_node_with_changed_element(self) -> None:
-        element: Element = Element("{namespace}name")
-        sub_element: Element = Element("{sub-namespace}sub-name")
+        element: Element = self._create_element("{namespace}name")
+        sub_element: Element = self._create_element("{sub-namespace}sub-name")
         sub_element.text = "sub-text"
 
         element.append(sub_element)
 
-        sut: ETreeXmlNode = ETreeXmlNode(element)
+        sut: XmlNode = self._create_sut(element)
 
-        sub_node: Optional[ETreeXmlNode] = sut.find_first_node("sub-name")
+        sub_node: Optional[XmlNode] = sut.find_first_node("sub-name")
 
         # sanity check: sub node is found
         self.assertIsNotNone(sub_node)
@@ -79,22 +88,22 @@ class TestETreeXmlNode(TestCase):
         self.assertIsNone(sub_node)
 
     def test_find_all_nodes_without_path(self) -> None:
-        element: Element = Element("{namespace}name")
-        sut: ETreeXmlNode = ETreeXmlNode(element)
+        element: Element = self._create_element("{namespace}name")
+        sut: XmlNode = self._create_sut(element)
 
         self.assertListEqual(sut.find_all_nodes(), [sut])
 
     def test_find_all_nested_nodes(self) -> None:
-        element: Element = Element("{namespace}name")
-        first_sub_element: Element = Element("{sub-namespace-1}sub-name")
+        element: Element = self._create_element("{namespace}name")
+        first_sub_element: Element = self._create_element("{sub-namespace-1}sub-name")
         first_sub_element.text = "sub-text-1"
-        second_sub_element: Element = Element("{sub-namespace-2}sub-name")
+        second_sub_element: Element = self._create_element("{sub-namespace-2}sub-name")
         second_sub_element.text = "sub-text-2"
 
         element.append(first_sub_element)
         element.append(second_sub_element)
 
-        sut: ETreeXmlNode = ETreeXmlNode(element)
+        sut: XmlNode = self._create_sut(element)
 
         sub_nodes: List[XmlNode] = sut.find_all_nodes("sub-name")
 
@@ -111,16 +120,16 @@ class TestETreeXmlNode(TestCase):
         self.assertEqual(second_sub_node.text, "sub-text-2")
 
     def test_find_all_nested_nodes_with_changed_element(self) -> None:
-        element: Element = Element("{namespace}name")
-        first_sub_element: Element = Element("{sub-namespace-1}sub-name")
+        element: Element = self._create_element("{namespace}name")
+        first_sub_element: Element = self._create_element("{sub-namespace-1}sub-name")
         first_sub_element.text = "sub-text-1"
-        second_sub_element: Element = Element("{sub-namespace-2}sub-name")
+        second_sub_element: Element = self._create_element("{sub-namespace-2}sub-name")
         second_sub_element.text = "sub-text-2"
 
         element.append(first_sub_element)
         element.append(second_sub_element)
 
-        sut: ETreeXmlNode = ETreeXmlNode(element)
+        sut: XmlNode = self._create_sut(element)
 
         sub_nodes: List[XmlNode] = sut.find_all_nodes("sub-name")
 
@@ -132,3 +141,102 @@ class TestETreeXmlNode(TestCase):
         sub_nodes = sut.find_all_nodes("sub-name")
 
         self.assertEqual(len(sub_nodes), 1)
+
+    def test_find_first_node_returns_cached_node(self) -> None:
+        element: Element = self._create_element("{namespace}name")
+        sub_element: Element = self._create_element("{sub-namespace}sub-name")
+        element.append(sub_element)
+
+        sut: XmlNode = self._create_sut(element)
+
+        self.assertIs(sut.find_first_node("sub-name"), sut.find_first_node("sub-name"))
+        self.assertIs(sut.find_first_node("sub-name"), sut.nodes[0])
+
+    def test_find_first_node_with_replaced_last_element(self) -> None:
+        element: Element = self._create_element("{namespace}name")
+        element.append(self._create_element("{sub-namespace}first"))
+        element.append(self._create_element("{sub-namespace}old"))
+
+        sut: XmlNode = self._create_sut(element)
+
+        # sanity check: the old element is found
+        self.assertIsNotNone(sut.find_first_node("old"))
+
+        element.remove(element[-1])
+        element.append(self._create_element("{sub-namespace}new"))
+
+        self.assertIsNone(sut.find_first_node("old"))
+        self.assertIsNotNone(sut.find_first_node("new"))
+
+    def test_find_first_node_with_replaced_middle_element(self) -> None:
+        element: Element = self._create_element("{namespace}name")
+        for name in ["a", "b", "c"]:
+            element.append(self._create_element(f"{{sub-namespace}}{name}"))
+
+        sut: XmlNode = self._create_sut(element)
+
+        # sanity check: the replaced element is found
+        self.assertIsNotNone(sut.find_first_node("b"))
+
+        element[1] = self._create_element("{sub-namespace}x")
+
+        self.assertEqual([n.name for n in sut.nodes], ["a", "x", "c"])
+        self.assertIsNone(sut.find_first_node("b"))
+        self.assertIs(sut.find_first_node("x").delegate, element[1])
+
+    def test_find_all_nested_nodes_with_added_element(self) -> None:
+        element: Element = self._create_element("{namespace}name")
+        first_sub_element: Element = self._create_element("{sub-namespace}sub-name")
+        element.append(first_sub_element)
+
+        sut: XmlNode = self._create_sut(element)
+
+        first_sub_node: Optional[XmlNode] = sut.find_first_node("sub-name")
+
+        # sanity check: only the first sub node is found
+        self.assertEqual(len(sut.find_all_nodes("sub-name")), 1)
+
+        element.append(self._create_element("{sub-namespace}sub-name"))
+        element.append(self._create_element("{sub-namespace}other-name"))
+
+        sub_nodes: List[XmlNode] = sut.find_all_nodes("sub-name")
+
+        self.assertEqual(len(sub_nodes), 2)
+        self.assertIs(sub_nodes[0], first_sub_node)
+        self.assertEqual(len(sut.find_all_nodes("other-name")), 1)
+
+    def test_node_has_no_instance_dictionary(self) -> None:
+        sut: XmlNode = self._create_sut(self._create_element("{namespace}name"))
+
+        self.assertFalse(hasattr(sut, "__dict__"))
+
+    def test_names_and_namespaces_are_shared(self) -> None:
+        first: XmlNode = self._create_sut(
+            self._create_element("{http://maven.apache.org/POM/4.0.0}project")
+        )
+        second: XmlNode = self._create_sut(
+            self._create_element("{http://maven.apache.org/POM/4.0.0}project")
+        )
+
+        self.assertIs(first.namespace, second.namespace)
+        self.assertIs(first.name, second.name)
+
+    def test_memory_per_node(self) -> None:
+        node_count: int = 10_000
+        element: Element = self._create_element("{namespace}name")
+        for _ in range(node_count):
+            element.append(self._create_element("{namespace}sub-name"))
+
+        tracemalloc.start()
+        try:
+            sut: XmlNode = self._create_sut(element)
+            for node in sut.find_all_nodes("sub-name"):
+                self.assertEqual(node.namespace, "namespace")
+                self.assertIsNone(node.find_first_node("other-name"))
+
+            size, _ = tracemalloc.get_traced_memory()
+
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(size / node_count, self.MAX_BYTES_PER_NODE)
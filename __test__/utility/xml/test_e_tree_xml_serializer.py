@@ -0,0 +1,44 @@
+from unittest import TestCase
+from xml.etree.ElementTree import Comment, Element, SubElement
+
+from utility.xml.e_tree_xml_serializer import ETreeXmlSerializer
+
+
+class TestETreeXmlSerializer(TestCase):
+    def test_serialize(self) -> None:
+        root: Element = Element(
+            "{default}project",
+            {
+                "{http://www.w3.org/2001/XMLSchema-instance}schemaLocation": "location",
+                "plain": 'a "quoted" value',
+            },
+        )
+        root.text = "\n  "
+        comment: Element = Comment(" it's a comment ")
+        comment.tail = "\n  "
+        root.append(comment)
+        version: Element = SubElement(root, "{default}version")
+        version.text = "1.0.0 & <more>"
+        version.tail = "\n  "
+        SubElement(root, "{default}empty").tail = "\n"
+
+        self.assertEqual(
+            ETreeXmlSerializer(root).serialize().decode("UTF-8"),
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<project xmlns="default" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+            'xsi:schemaLocation="location" plain="a &quot;quoted&quot; value">\n'
+            "  <!-- it's a comment -->\n"
+            "  <version>1.0.0 &amp; &lt;more&gt;</version>\n"
+            "  <empty />\n"
+            "</project>",
+        )
+
+    def test_serialize_unqualified_element_below_default_namespace(self) -> None:
+        root: Element = Element("{default}project")
+        SubElement(root, "unqualified")
+
+        self.assertEqual(
+            ETreeXmlSerializer(root).serialize().decode("UTF-8"),
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<project xmlns="default"><unqualified xmlns="" /></project>',
+        )
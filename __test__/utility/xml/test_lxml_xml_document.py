@@ -0,0 +1,98 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict, Optional
+from unittest import skip, skipIf
+
+from __test__.utility.xml import test_e_tree_xml_document
+from utility.type_utility import get_or_else
+from utility.xml.default_xml_document import DefaultXmlDocument
+from utility.xml.xml_document import XmlDocument
+
+if DefaultXmlDocument.is_lxml_available():
+    from lxml import etree
+
+    from utility.xml.lxml_xml_document import LxmlXmlDocument
+
+
+@skipIf(not DefaultXmlDocument.is_lxml_available(), "lxml is not installed")
+class TestLxmlXmlDocument(test_e_tree_xml_document.TestETreeXmlDocument):
+    def _create_element(
+        self, tag: str, attributes: Optional[Dict[str, str]] = None
+    ) -> "etree._Element":
+        return etree.Element(tag, get_or_else(attributes, dict))
+
+    def _create_tree(self, root_element: "etree._Element") -> "etree._ElementTree":
+        return etree.ElementTree(root_element)
+
+    def _create_sut(self, tree: "etree._ElementTree") -> XmlDocument:
+        return LxmlXmlDocument(tree)
+
+    def _parse(self, file: Path) -> XmlDocument:
+        return LxmlXmlDocument.parse(file)
+
+    @skip("lxml re-serializes the root element instead of patching the source")
+    def test_save_patches_changed_text_only(self) -> None:
+        pass
+
+    def test_save_serializes_tree_with_double_quotes(self) -> None:
+        root_element: etree._Element = etree.Element(
+            "{root-namespace}root-node",
+            {"key": "va'lue"},
+            nsmap={None: "root-namespace"},
+        )
+        sub_element: etree._Element = etree.SubElement(
+            root_element, "{root-namespace}sub-node"
+        )
+        sub_element.text = "it's"
+
+        sut: XmlDocument = self._create_sut(self._create_tree(root_element))
+
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            sut.save(file)
+
+            self.assertEqual(
+                file.read_text(),
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<root-node xmlns="root-namespace" key="va\'lue">'
+                "<sub-node>it's</sub-node>"
+                "</root-node>",
+            )
+
+    def test_save_preserves_formatting(self) -> None:
+        content: str = (
+            "<?xml version='1.0'?>\n"
+            "<!DOCTYPE project [<!ENTITY name 'value'>]>\n"
+            "<!-- header -->\n"
+            "<project xmlns='namespace'>\n"
+            "  <!-- keep me -->\n"
+            "  <version>1.0.0</version>\n"
+            "  <description><![CDATA[a < b]]> &name;</description>\n"
+            "</project>\n"
+            "<!-- footer -->\n"
+        )
+
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            file.write_text(content)
+
+            sut: XmlDocument = self._parse(file)
+            sut.find_first_node("project", "version").text = "1.0.1"
+            sut.save(file)
+
+            self.assertEqual(
+                file.read_text(),
+                content.replace("1.0.0", "1.0.1").replace(
+                    "xmlns='namespace'", 'xmlns="namespace"'
+                ),
+            )
+
+    def test_save_read_only(self) -> None:
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            file.write_text("<project><version>1.0.0</version></project>")
+
+            sut: XmlDocument = LxmlXmlDocument.parse(file, read_only=True)
+
+            self.assertEqual(sut.find_first_node("project", "version").text, "1.0.0")
+            self.assertRaises(AssertionError, lambda: sut.save(file))
@@ -0,0 +1,39 @@
+from typing import ClassVar
+from unittest import skipIf
+
+from __test__.utility.xml import test_e_tree_xml_node
+from utility.xml.default_xml_document import DefaultXmlDocument
+from utility.xml.xml_node import XmlNode
+from utility.xml.xml_path import XmlPath
+
+if DefaultXmlDocument.is_lxml_available():
+    from lxml import etree
+
+    from utility.xml.lxml_xml_node import LxmlXmlNode
+
+
+@skipIf(not DefaultXmlDocument.is_lxml_available(), "lxml is not installed")
+class TestLxmlXmlNode(test_e_tree_xml_node.TestETreeXmlNode):
+    # lxml creates a Python proxy object for every element that is wrapped
+    MAX_BYTES_PER_NODE: ClassVar[int] = 400
+
+    def _create_element(self, tag: str) -> "etree._Element":
+        return etree.Element(tag)
+
+    def _create_sut(self, element: "etree._Element") -> XmlNode:
+        return LxmlXmlNode(element)
+
+    def test_query_nodes_skips_comments(self) -> None:
+        element: etree._Element = etree.fromstring(
+            "<root><!-- comment --><sub>1</sub><other><sub>2</sub></other></root>"
+        )
+        sut: XmlNode = self._create_sut(element)
+
+        self.assertEqual(
+            [node.name for node in sut.query_all_nodes(XmlPath.compile("*"))],
+            ["sub", "other"],
+        )
+        self.assertEqual(
+            [node.text for node in sut.query_all_nodes(XmlPath.compile("**", "sub"))],
+            ["1", "2"],
+        )
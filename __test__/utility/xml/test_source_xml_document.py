@@ -0,0 +1,64 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from utility.xml.source_xml_document import SourceXmlDocument
+from utility.xml.source_xml_node import SourceXmlNode
+from utility.xml.xml_path import XmlPath
+
+
+class TestSourceXmlDocument(TestCase):
+    SOURCE: str = (
+        "<project>\n"
+        "  <!-- comment -->\n"
+        "  <version>1.0.0</version>\n"
+        "  <empty/>\n"
+        "  <other>text</other>\n"
+        "</project>\n"
+    )
+
+    def test_save_patches_nodes(self) -> None:
+        with TemporaryDirectory() as directory:
+            file: Path = Path(directory, "pom.xml")
+            file.write_text(self.SOURCE)
+
+            sut: SourceXmlDocument = SourceXmlDocument(file.read_bytes(), file)
+            version: SourceXmlNode = sut.create_node(
+                "version", "", "1.0.0", 1, self.SOURCE.index("<version>")
+            )
+            empty: SourceXmlNode = sut.create_node(
+                "empty", "", None, 2, self.SOURCE.index("<empty/>")
+            )
+            other: SourceXmlNode = sut.create_node(
+                "other", "", "text", 3, self.SOURCE.index("<other>")
+            )
+
+            self.assertFalse(sut.requires_save(file))
+
+            version.text = "1.0.0-SNAPSHOT"
+            empty.text = "filled"
+            self.assertListEqual(sut.changed_nodes, [version, empty])
+
+            sut.save(file)
+
+            expected: str = self.SOURCE.replace("1.0.0", "1.0.0-SNAPSHOT").replace(
+                "<empty/>", "<empty>filled</empty>"
+            )
+            self.assertEqual(file.read_text(), expected)
+            self.assertFalse(sut.is_dirty)
+            self.assertEqual(other.start, expected.index("<other>"))
+
+            other.text = "a < b"
+            sut.save(file)
+
+            self.assertEqual(file.read_text(), expected.replace("text", "a &lt; b"))
+
+    def test_search_is_not_supported(self) -> None:
+        sut: SourceXmlDocument = SourceXmlDocument(
+            self.SOURCE.encode("UTF-8"), Path("pom.xml")
+        )
+
+        self.assertRaises(AssertionError, lambda: sut.find_first_node("project"))
+        self.assertRaises(
+            AssertionError, lambda: sut.query_all_nodes(XmlPath.compile("project"))
+        )
@@ -0,0 +1,101 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+from unittest import TestCase
+
+from utility.xml.e_tree_streaming_xml_document import ETreeStreamingXmlDocument
+from utility.xml.e_tree_xml_document import ETreeXmlDocument
+from utility.xml.xml_batch_writer import XmlBatchWriter
+from utility.xml.xml_path import XmlPath
+
+
+class TestXmlBatchWriter(TestCase):
+    CONTENT: str = "<project><version>1.0.0</version></project>"
+
+    def test_commit(self) -> None:
+        with TemporaryDirectory() as directory:
+            files: List[Path] = self._create_files(directory, "a.xml", "b.xml", "c.xml")
+            documents: List[ETreeXmlDocument] = [
+                ETreeXmlDocument.parse(file) for file in files
+            ]
+            documents[0].find_first_node("project", "version").text = "1.0.1"
+            documents[1].find_first_node("project", "version").text = "1.0.1"
+
+            sut: XmlBatchWriter = XmlBatchWriter(max_workers=2)
+            for document, file in zip(documents, files):
+                sut.add(document, file)
+
+            written_files: List[Path] = sut.commit()
+
+            self.assertListEqual(
+                written_files, [files[0].resolve(), files[1].resolve()]
+            )
+            self.assertEqual(
+                files[0].read_text(), self.CONTENT.replace("1.0.0", "1.0.1")
+            )
+            self.assertEqual(
+                files[1].read_text(), self.CONTENT.replace("1.0.0", "1.0.1")
+            )
+            self.assertEqual(files[2].read_text(), self.CONTENT)
+            self.assertFalse(any(document.is_dirty for document in documents))
+            self.assertListEqual(
+                sorted(path.name for path in Path(directory).iterdir()),
+                ["a.xml", "b.xml", "c.xml"],
+            )
+
+    def test_commit_rolls_back_if_serialization_fails(self) -> None:
+        with TemporaryDirectory() as directory:
+            files: List[Path] = self._create_files(directory, "a.xml", "b.xml")
+            document: ETreeXmlDocument = ETreeXmlDocument.parse(files[0])
+            document.find_first_node("project", "version").text = "1.0.1"
+
+            sut: XmlBatchWriter = XmlBatchWriter()
+            sut.add(document, files[0])
+            sut.add(
+                ETreeStreamingXmlDocument.parse(
+                    files[1], XmlPath.compile("project", "version")
+                ),
+                files[1],
+            )
+
+            self.assertRaises(AssertionError, sut.commit)
+
+            self.assertEqual(files[0].read_text(), self.CONTENT)
+            self.assertEqual(files[1].read_text(), self.CONTENT)
+            self.assertTrue(document.is_dirty)
+            self.assertListEqual(
+                sorted(path.name for path in Path(directory).iterdir()),
+                ["a.xml", "b.xml"],
+            )
+
+    def test_commit_rolls_back_if_replacing_fails(self) -> None:
+        with TemporaryDirectory() as directory:
+            files: List[Path] = self._create_files(directory, "a.xml")
+            document: ETreeXmlDocument = ETreeXmlDocument.parse(files[0])
+            document.find_first_node("project", "version").text = "1.0.1"
+
+            # a directory can't be replaced with a file
+            blocked_file: Path = Path(directory, "blocked.xml")
+            blocked_file.mkdir()
+
+            sut: XmlBatchWriter = XmlBatchWriter()
+            sut.add(document, files[0])
+            sut.add(document, blocked_file)
+
+            self.assertRaises(OSError, sut.commit)
+
+            self.assertEqual(files[0].read_text(), self.CONTENT)
+            self.assertTrue(blocked_file.is_dir())
+            self.assertListEqual(
+                sorted(path.name for path in Path(directory).iterdir()),
+                ["a.xml", "blocked.xml"],
+            )
+
+    def _create_files(self, directory: str, *names: str) -> List[Path]:
+        result: List[Path] = []
+        for name in names:
+            file: Path = Path(directory, name)
+            file.write_text(self.CONTENT)
+            result.append(file)
+
+        return result
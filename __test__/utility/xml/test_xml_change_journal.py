@@ -0,0 +1,62 @@
+from typing import List
+from unittest import TestCase
+from xml.etree.ElementTree import Element
+
+from utility.xml.e_tree_xml_node import ETreeXmlNode
+from utility.xml.xml_change_journal import XmlChangeJournal
+
+
+class TestXmlChangeJournal(TestCase):
+    def test_record(self) -> None:
+        element: Element = Element("name")
+        element.text = "original"
+        node: ETreeXmlNode = ETreeXmlNode(element)
+
+        sut: XmlChangeJournal = XmlChangeJournal()
+
+        node.text = "changed"
+        sut.record(node, "original")
+
+        self.assertFalse(sut.is_empty())
+        self.assertListEqual(sut.changed_nodes, [node])
+        self.assertEqual(sut.get_original_text(node), "original")
+
+        node.text = "changed again"
+        sut.record(node, "changed")
+
+        self.assertListEqual(sut.changed_nodes, [node])
+        self.assertEqual(sut.get_original_text(node), "original")
+
+    def test_record_change_back_to_original(self) -> None:
+        element: Element = Element("name")
+        element.text = "original"
+        node: ETreeXmlNode = ETreeXmlNode(element)
+
+        sut: XmlChangeJournal = XmlChangeJournal()
+
+        node.text = "changed"
+        sut.record(node, "original")
+        node.text = "original"
+        sut.record(node, "changed")
+
+        self.assertTrue(sut.is_empty())
+        self.assertListEqual(sut.changed_nodes, [])
+
+    def test_record_notifies_listeners(self) -> None:
+        element: Element = Element("name")
+        element.text = "original"
+        node: ETreeXmlNode = ETreeXmlNode(element)
+        notified_nodes: List[ETreeXmlNode] = []
+
+        sut: XmlChangeJournal = XmlChangeJournal()
+        sut.add_listener(notified_nodes.append)
+
+        sut.record(node, "original")
+        sut.record(node, "changed")
+
+        self.assertListEqual(notified_nodes, [node, node])
+
+        sut.remove_listener(notified_nodes.append)
+        sut.record(node, "original")
+
+        self.assertListEqual(notified_nodes, [node, node])
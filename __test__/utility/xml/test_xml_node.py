@@ -2,6 +2,7 @@ from typing import List, Optional
 from unittest import TestCase
 
 from utility.xml.xml_node import XmlNode
+from utility.xml.xml_path import XmlPath
 
 
 class TestXmlNode(TestCase):
@@ -39,3 +40,40 @@ class TestXmlNode(TestCase):
 
         self.assertEqual(sut.name, "foo")
         self.assertEqual(sut.text, "baz")
+
+    def test_query_all_nodes(self) -> None:
+        class MockXmlNode(XmlNode):
+            def __init__(self, name: str, *nodes: XmlNode):
+                self._name: str = name
+                self._nodes: List[XmlNode] = list(nodes)
+
+            @property
+            def name(self) -> str:
+                return self._name
+
+            def _get_text(self) -> Optional[str]:
+                return None
+
+            def _set_text(self, text: str) -> None:
+                pass
+
+            def _get_nodes(self) -> List["XmlNode"]:
+                return self._nodes
+
+            def find_first_node(self, *path_segments: str) -> Optional["XmlNode"]:
+                return None
+
+            def find_all_nodes(self, *path_segments: str) -> List["XmlNode"]:
+                return []
+
+        sut: XmlNode = MockXmlNode(
+            "root",
+            MockXmlNode("a", MockXmlNode("c")),
+            MockXmlNode("b", MockXmlNode("c")),
+        )
+
+        self.assertEqual(len(sut.query_all_nodes(XmlPath.compile("a", "c"))), 1)
+        self.assertEqual(len(sut.query_all_nodes(XmlPath.compile("*", "c"))), 2)
+        self.assertEqual(len(sut.query_all_nodes(XmlPath.compile("**", "c"))), 2)
+        self.assertEqual(sut.query_first_node(XmlPath.compile("b")).name, "b")
+        self.assertIsNone(sut.query_first_node(XmlPath.compile("d")))
@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+from utility.xml.xml_path import XmlPath
+
+
+class TestXmlPath(TestCase):
+    def test_compile_is_cached(self) -> None:
+        self.assertIs(
+            XmlPath.compile("project", "version"), XmlPath.compile("project", "version")
+        )
+
+    def test_expression(self) -> None:
+        self.assertEqual(XmlPath.compile("a", "b", "c").expression, "a/b/c")
+        self.assertEqual(XmlPath.compile("a", "*", "c").expression, "a/*/c")
+        self.assertEqual(XmlPath.compile("a", "**", "c").expression, "a//c")
+        self.assertEqual(XmlPath.compile("**", "c").expression, ".//c")
+
+    def test_namespaces(self) -> None:
+        self.assertDictEqual(XmlPath.compile("a").namespaces, {"": "*"})
+        self.assertDictEqual(
+            XmlPath.compile("a", namespace="namespace").namespaces, {"": "namespace"}
+        )
+
+    def test_tail(self) -> None:
+        self.assertEqual(XmlPath.compile("a", "b").tail(), XmlPath.compile("b"))
+        self.assertTrue(XmlPath.compile("a").tail().is_empty())
+
+    def test_invalid_segments(self) -> None:
+        self.assertRaises(AssertionError, lambda: XmlPath.compile("a/b"))
+        self.assertRaises(AssertionError, lambda: XmlPath.compile("a[1]"))
+        self.assertRaises(AssertionError, lambda: XmlPath.compile("a", "**"))
@@ -190,11 +190,14 @@ class MavenFormatterConfiguration(FormatterConfiguration):
         if not pom_file.exists() or not pom_file.is_file():
             return MavenFormatterConfiguration()
 
-        module: XmlMavenModule = XmlMavenModuleReader().read(pom_file)
+        module: XmlMavenModule = XmlMavenModuleReader.cached(
+            read_only=True, sections=[XmlMavenModuleReader.Section.PLUGINS]
+        ).read(pom_file)
         goals: List[str] = []
 
         def has_plugin(g: str, a: str) -> bool:
-            for plugin in module.plugins:
+            # managed plugins are configured as well, e.g. to run their goals on demand
+            for plugin in [*module.plugins, *module.managed_plugins]:
                 if plugin.group_id == g and plugin.artifact_id == a:
                     return True
 
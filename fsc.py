@@ -2,7 +2,7 @@ import re
 from argparse import ArgumentParser
 from pathlib import Path
 from re import Pattern
-from typing import Any, List, Optional, Set, cast
+from typing import Any, Iterator, List, Optional, Set, cast
 
 from development_environment.development_environment import DevelopmentEnvironment
 from development_environment.formatter_configuration import (
@@ -10,6 +10,7 @@ from development_environment.formatter_configuration import (
     MavenFormatterConfiguration,
     VenvFormatterConfiguration,
 )
+from java.maven.maven_module_ownership_index import MavenModuleOwnershipIndex
 from java.maven.xml_maven_module import XmlMavenModule
 from java.maven.xml_maven_module_reader import XmlMavenModuleReader
 from shell.shell import Shell
@@ -58,10 +59,36 @@ def _get_maven_modules_arguments(
 
         return result
 
+    maven_files: List[Path] = list(
+        filter(_is_relevant_for_maven_formatting, files_to_format)
+    )
+    root_pom: Path = Path(dev_env.root, "pom.xml")
+    module_names: Set[str] = (
+        _find_maven_module_names(root_pom, maven_files)
+        if root_pom.is_file()
+        else _find_maven_module_names_by_poms(dev_env.root, maven_files)
+    )
+    module_names -= set(formatter_configuration.excluded_modules)
+
+    result: List[str] = []
+    for name in module_names:
+        result.extend(["-pl", name])
+
+    return result
+
+
+def _find_maven_module_names(root_pom: Path, files: List[Path]) -> Set[str]:
+    # the modules of the reactor are indexed once, so that files are mapped to modules without any file system access
+    index: MavenModuleOwnershipIndex = MavenModuleOwnershipIndex.load(root_pom)
+    return set(str(ga_key) for ga_key in index.find_owners(files))
+
+
+def _find_maven_module_names_by_poms(root: Path, files: List[Path]) -> Set[str]:
+    # without a reactor, the POM in the closest parent directory of every file is used
     poms: Set[Path] = set()
-    for file in filter(_is_relevant_for_maven_formatting, files_to_format):
+    for file in files:
         parent: Path = file.parent
-        while parent != dev_env.root:
+        while parent != root:
             pom: Path = Path(parent, "pom.xml")
             if pom.exists() and pom.is_file():
                 poms.add(pom)
@@ -69,18 +96,13 @@ def _get_maven_modules_arguments(
 
             parent = parent.parent
 
-    module_reader: XmlMavenModuleReader = XmlMavenModuleReader()
-    modules: List[XmlMavenModule] = [module_reader.read(pom) for pom in poms]
-    module_names: Set[str] = set(
-        f"{m.identifier.group_id}:{m.identifier.artifact_id}" for m in modules
+    # only the identifiers are needed, so no other section is read
+    module_reader: XmlMavenModuleReader = XmlMavenModuleReader.cached(
+        read_only=True, sections=[]
     )
-    module_names -= set(formatter_configuration.excluded_modules)
-
-    result: List[str] = []
-    for name in module_names:
-        result.extend(["-pl", name])
-
-    return result
+    # every module is dropped as soon as its name is known, so that only one POM is kept in memory at a time
+    modules: Iterator[XmlMavenModule] = (module_reader.read(pom) for pom in poms)
+    return set(str(m.identifier.ga_key) for m in modules)
 
 
 def _is_relevant_for_maven_formatting(file: Path) -> bool:
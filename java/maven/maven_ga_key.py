@@ -0,0 +1,57 @@
+from threading import Lock
+from typing import Any, ClassVar, Tuple
+from weakref import WeakValueDictionary
+
+
+# interned 'groupId:artifactId' key, so that equal keys are the same object and dict lookups are pointer comparisons
+class MavenGaKey:
+    __slots__ = ("_group_id", "_artifact_id", "_hash", "__weakref__")
+
+    INSTANCES: ClassVar[WeakValueDictionary] = WeakValueDictionary()
+    LOCK: ClassVar[Lock] = Lock()
+
+    @staticmethod
+    def of(group_id: str, artifact_id: str) -> "MavenGaKey":
+        key: Tuple[str, str] = (group_id, artifact_id)
+        instance: Any = MavenGaKey.INSTANCES.get(key)
+        if instance is not None:
+            return instance
+
+        with MavenGaKey.LOCK:
+            return MavenGaKey.INSTANCES.setdefault(
+                key, MavenGaKey(group_id, artifact_id)
+            )
+
+    def __init__(self, group_id: str, artifact_id: str):
+        self._group_id: str = group_id
+        self._artifact_id: str = artifact_id
+        self._hash: int = hash((group_id, artifact_id))
+
+    @property
+    def group_id(self) -> str:
+        return self._group_id
+
+    @property
+    def artifact_id(self) -> str:
+        return self._artifact_id
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+
+        if not isinstance(other, MavenGaKey):
+            return False
+
+        return (
+            self._group_id == other._group_id
+            and self._artifact_id == other._artifact_id
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __str__(self) -> str:
+        return f"{self._group_id}:{self._artifact_id}"
+
+    def __repr__(self) -> str:
+        return f"MavenGaKey('{self._group_id}', '{self._artifact_id}')"
@@ -0,0 +1,64 @@
+from threading import Lock
+from typing import Any, ClassVar, Tuple
+from weakref import WeakValueDictionary
+
+from java.maven.maven_ga_key import MavenGaKey
+
+
+# interned 'groupId:artifactId:version' key, see 'MavenGaKey'
+class MavenGavKey:
+    __slots__ = ("_ga_key", "_version", "_hash", "__weakref__")
+
+    INSTANCES: ClassVar[WeakValueDictionary] = WeakValueDictionary()
+    LOCK: ClassVar[Lock] = Lock()
+
+    @staticmethod
+    def of(ga_key: MavenGaKey, version: str) -> "MavenGavKey":
+        key: Tuple[MavenGaKey, str] = (ga_key, version)
+        instance: Any = MavenGavKey.INSTANCES.get(key)
+        if instance is not None:
+            return instance
+
+        with MavenGavKey.LOCK:
+            return MavenGavKey.INSTANCES.setdefault(key, MavenGavKey(ga_key, version))
+
+    def __init__(self, ga_key: MavenGaKey, version: str):
+        self._ga_key: MavenGaKey = ga_key
+        self._version: str = version
+        self._hash: int = hash((ga_key, version))
+
+    @property
+    def ga_key(self) -> MavenGaKey:
+        return self._ga_key
+
+    @property
+    def group_id(self) -> str:
+        return self._ga_key.group_id
+
+    @property
+    def artifact_id(self) -> str:
+        return self._ga_key.artifact_id
+
+    @property
+    def version(self) -> str:
+        return self._version
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+
+        if not isinstance(other, MavenGavKey):
+            return False
+
+        return self._ga_key == other._ga_key and self._version == other._version
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __str__(self) -> str:
+        return f"{self._ga_key}:{self._version}"
+
+    def __repr__(self) -> str:
+        return (
+            f"MavenGavKey('{self.group_id}', '{self.artifact_id}', '{self._version}')"
+        )
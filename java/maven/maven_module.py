@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
+from java.maven.maven_ga_key import MavenGaKey
 from java.maven.maven_module_identifier import MavenModuleIdentifier
 from java.maven.maven_property import MavenProperty
 
@@ -46,5 +47,30 @@ class MavenModule(ABC):
     def _get_plugins(self) -> List[MavenModuleIdentifier]:
         raise NotImplementedError
 
+    @property
+    def managed_dependencies(self) -> List[MavenModuleIdentifier]:
+        return self._get_managed_dependencies()
+
+    @abstractmethod
+    def _get_managed_dependencies(self) -> List[MavenModuleIdentifier]:
+        raise NotImplementedError
+
+    @property
+    def managed_plugins(self) -> List[MavenModuleIdentifier]:
+        return self._get_managed_plugins()
+
+    @abstractmethod
+    def _get_managed_plugins(self) -> List[MavenModuleIdentifier]:
+        raise NotImplementedError
+
+    @property
+    def build_dependency_keys(self) -> List[MavenGaKey]:
+        # the modules that must be built before this one (except for the parent), even if their version is managed
+        return self._get_build_dependency_keys()
+
+    @abstractmethod
+    def _get_build_dependency_keys(self) -> List[MavenGaKey]:
+        raise NotImplementedError
+
     def __str__(self) -> str:
         return str(self.identifier)
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 
+from java.maven.maven_ga_key import MavenGaKey
+from java.maven.maven_gav_key import MavenGavKey
+
 
 class MavenModuleIdentifier(ABC):
     @property
@@ -26,5 +29,16 @@ class MavenModuleIdentifier(ABC):
     def _set_version(self, version: str) -> None:
         raise NotImplementedError
 
+    @property
+    def ga_key(self) -> MavenGaKey:
+        return self._get_ga_key()
+
+    def _get_ga_key(self) -> MavenGaKey:
+        return MavenGaKey.of(self.group_id, self.artifact_id)
+
+    @property
+    def gav_key(self) -> MavenGavKey:
+        return MavenGavKey.of(self.ga_key, self.version)
+
     def __str__(self) -> str:
         return f"{self.group_id}:{self.artifact_id}:{self.version}"
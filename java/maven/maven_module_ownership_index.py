@@ -0,0 +1,159 @@
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Tuple
+
+from java.maven.maven_ga_key import MavenGaKey
+from java.maven.xml_maven_module import XmlMavenModule
+from java.maven.xml_maven_module_reader import XmlMavenModuleReader
+from utility.file_cache import FileCache
+from utility.type_utility import get_or_else
+
+
+# maps files to the module in their closest parent directory, without any file system access per file
+class MavenModuleOwnershipIndex:
+    CACHE_NAME: ClassVar[str] = "maven-module-ownership"
+    CACHE_FORMAT_VERSION: ClassVar[int] = 1
+
+    @dataclass
+    class Node:
+        children: Dict[str, "MavenModuleOwnershipIndex.Node"] = field(
+            default_factory=dict
+        )
+        owner: Optional[MavenGaKey] = None
+
+    @staticmethod
+    def of(modules: Iterable[XmlMavenModule]) -> "MavenModuleOwnershipIndex":
+        return MavenModuleOwnershipIndex(
+            [(m.pom_file.parent, m.identifier.ga_key) for m in modules]
+        )
+
+    @staticmethod
+    def load(
+        root_pom: Path,
+        cache: Optional[FileCache] = None,
+        module_reader: Optional[XmlMavenModuleReader] = None,
+    ) -> "MavenModuleOwnershipIndex":
+        # the index is rebuilt when any POM of the reactor changed, e.g. because a module was added to an aggregator
+        cache = get_or_else(
+            cache, lambda: FileCache.new(MavenModuleOwnershipIndex.CACHE_NAME)
+        )
+        entry: FileCache.Entry = cache.read(root_pom)
+        cached_index: Optional[
+            MavenModuleOwnershipIndex
+        ] = MavenModuleOwnershipIndex._load_index(entry.data)
+        if cached_index is not None:
+            return cached_index
+
+        # only the identifiers and modules are needed to build the index
+        module_reader = get_or_else(
+            module_reader,
+            lambda: XmlMavenModuleReader.cached(
+                read_only=True, max_workers=os.cpu_count(), sections=[]
+            ),
+        )
+        modules: List[XmlMavenModule] = module_reader.read_recursive(root_pom)
+        index: MavenModuleOwnershipIndex = MavenModuleOwnershipIndex.of(modules)
+        MavenModuleOwnershipIndex._store_index(cache, entry, modules)
+
+        return index
+
+    @staticmethod
+    def _load_index(
+        data: Optional[Dict[str, Any]],
+    ) -> Optional["MavenModuleOwnershipIndex"]:
+        if data is None or data.get("version") != (
+            MavenModuleOwnershipIndex.CACHE_FORMAT_VERSION
+        ):
+            return None
+
+        # one 'stat' per POM of the reactor tells whether the index is still valid
+        for pom, size, mtime_ns in data["poms"]:
+            try:
+                stat: os.stat_result = os.stat(pom)
+
+            except OSError:
+                return None
+
+            if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                return None
+
+        return MavenModuleOwnershipIndex(
+            [
+                (Path(directory), MavenGaKey.of(group_id, artifact_id))
+                for directory, group_id, artifact_id in data["modules"]
+            ]
+        )
+
+    @staticmethod
+    def _store_index(
+        cache: FileCache, entry: FileCache.Entry, modules: List[XmlMavenModule]
+    ) -> None:
+        poms: List[List[Any]] = []
+        for module in modules:
+            try:
+                stat: os.stat_result = os.stat(module.pom_file)
+
+            except OSError:
+                return
+
+            poms.append(
+                [os.path.abspath(module.pom_file), stat.st_size, stat.st_mtime_ns]
+            )
+
+        cache.write(
+            entry,
+            {
+                "version": MavenModuleOwnershipIndex.CACHE_FORMAT_VERSION,
+                "poms": poms,
+                "modules": [
+                    [
+                        os.path.dirname(os.path.abspath(m.pom_file)),
+                        m.identifier.ga_key.group_id,
+                        m.identifier.ga_key.artifact_id,
+                    ]
+                    for m in modules
+                ],
+            },
+        )
+
+    def __init__(self, module_directories: Iterable[Tuple[Path, MavenGaKey]]):
+        self._root: MavenModuleOwnershipIndex.Node = MavenModuleOwnershipIndex.Node()
+        for directory, ga_key in module_directories:
+            node: MavenModuleOwnershipIndex.Node = self._root
+            for segment in self._get_segments(directory):
+                node = node.children.setdefault(
+                    segment, MavenModuleOwnershipIndex.Node()
+                )
+
+            # if multiple modules share a directory (e.g. with different POM names), the first one wins
+            if node.owner is None:
+                node.owner = ga_key
+
+    def find_owner(self, file: Path) -> Optional[MavenGaKey]:
+        # the owner of the deepest module directory along the path of the file
+        owner: Optional[MavenGaKey] = None
+        node: Optional[MavenModuleOwnershipIndex.Node] = self._root
+        for segment in self._get_segments(file.parent):
+            node = node.children.get(segment)
+            if node is None:
+                break
+
+            if node.owner is not None:
+                owner = node.owner
+
+        return owner
+
+    def find_owners(self, files: Iterable[Path]) -> List[MavenGaKey]:
+        owners: Dict[MavenGaKey, None] = {}
+        for file in files:
+            owner: Optional[MavenGaKey] = self.find_owner(file)
+            if owner is not None:
+                owners[owner] = None
+
+        return list(owners)
+
+    @staticmethod
+    def _get_segments(path: Path) -> List[str]:
+        # paths are only normalized lexically, so that no file system access is needed
+        return os.path.normcase(os.path.abspath(path)).split(os.sep)
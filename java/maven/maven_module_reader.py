@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from java.maven.maven_module import MavenModule
 
@@ -11,5 +11,9 @@ class MavenModuleReader(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def read_recursive(self, pom: Path) -> List[MavenModule]:
+    def read_recursive(self, *poms: Path) -> List[MavenModule]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_recursive(self, *poms: Path) -> Iterator[MavenModule]:
         raise NotImplementedError
@@ -0,0 +1,145 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from queue import SimpleQueue
+from typing import ClassVar, Iterator, List, Optional, Set, Tuple
+
+from pathspec import PathSpec
+
+
+# finds all POMs in a directory tree, e.g. for projects whose modules are not all listed by one aggregator
+class MavenPomDiscovery:
+    POM_NAME: ClassVar[str] = "pom.xml"
+    GITIGNORE_NAME: ClassVar[str] = ".gitignore"
+    PRUNED_DIRECTORIES: ClassVar[Set[str]] = {"target", "node_modules", ".git"}
+
+    @dataclass(frozen=True)
+    class IgnoreRules:
+        # the directory of the '.gitignore' file, the patterns are relative to it
+        directory: str
+        spec: PathSpec
+
+    @dataclass(frozen=True)
+    class ScanResult:
+        poms: List[Path]
+        directories: List[Tuple[str, Tuple["MavenPomDiscovery.IgnoreRules", ...]]]
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        respect_gitignore: bool = True,
+        pruned_directories: Optional[Set[str]] = None,
+    ):
+        # 'None' uses the default worker count of the thread pool
+        self._max_workers: Optional[int] = max_workers
+        self._respect_gitignore: bool = respect_gitignore
+        self._pruned_directories: Set[str] = (
+            set(pruned_directories)
+            if pruned_directories is not None
+            else MavenPomDiscovery.PRUNED_DIRECTORIES
+        )
+
+    def find_poms(self, root: Path) -> List[Path]:
+        return list(self.iter_poms(root))
+
+    def iter_poms(self, root: Path) -> Iterator[Path]:
+        # every directory is scanned by its own task, and POMs are yielded as soon as their directory was scanned
+        results: SimpleQueue = SimpleQueue()
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(self._max_workers)
+        try:
+            pending_count: int = 1
+            executor.submit(self._scan, os.path.abspath(root), ()).add_done_callback(
+                results.put
+            )
+            while pending_count > 0:
+                future: Future = results.get()
+                pending_count -= 1
+
+                result: MavenPomDiscovery.ScanResult = future.result()
+                for directory, ignore_rules in result.directories:
+                    pending_count += 1
+                    executor.submit(
+                        self._scan, directory, ignore_rules
+                    ).add_done_callback(results.put)
+
+                yield from result.poms
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _scan(
+        self,
+        directory: str,
+        ignore_rules: Tuple["MavenPomDiscovery.IgnoreRules", ...],
+    ) -> "MavenPomDiscovery.ScanResult":
+        try:
+            with os.scandir(directory) as iterator:
+                entries: List[os.DirEntry] = list(iterator)
+
+        except OSError:
+            # just like git, unreadable directories are skipped
+            return MavenPomDiscovery.ScanResult([], [])
+
+        if self._respect_gitignore:
+            for entry in entries:
+                if entry.name == MavenPomDiscovery.GITIGNORE_NAME and entry.is_file():
+                    rules: Optional[
+                        MavenPomDiscovery.IgnoreRules
+                    ] = self._read_ignore_rules(directory, entry.path)
+                    if rules is not None:
+                        ignore_rules = ignore_rules + (rules,)
+
+                    break
+
+        poms: List[Path] = []
+        directories: List[Tuple[str, Tuple[MavenPomDiscovery.IgnoreRules, ...]]] = []
+        for entry in entries:
+            # symbolic links are not followed, so that links cannot create cycles
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in self._pruned_directories and not self._is_ignored(
+                    entry.path, True, ignore_rules
+                ):
+                    directories.append((entry.path, ignore_rules))
+
+            elif entry.name == MavenPomDiscovery.POM_NAME and entry.is_file():
+                if not self._is_ignored(entry.path, False, ignore_rules):
+                    poms.append(Path(entry.path))
+
+        return MavenPomDiscovery.ScanResult(poms, directories)
+
+    def _read_ignore_rules(
+        self, directory: str, gitignore: str
+    ) -> Optional["MavenPomDiscovery.IgnoreRules"]:
+        try:
+            with open(gitignore, "r", encoding="UTF-8") as r:
+                spec: PathSpec = PathSpec.from_lines("gitwildmatch", r)
+
+        except (OSError, ValueError):
+            return None
+
+        # a trailing separator (e.g. of a file system root) would break the relative paths
+        return MavenPomDiscovery.IgnoreRules(directory.rstrip(os.sep), spec)
+
+    def _is_ignored(
+        self,
+        path: str,
+        is_directory: bool,
+        ignore_rules: Tuple["MavenPomDiscovery.IgnoreRules", ...],
+    ) -> bool:
+        # just like git, the last matching pattern wins, and the patterns of deeper '.gitignore' files come last. so
+        # the patterns are searched backwards, and a negation in a deeper file re-includes what an outer file ignores
+        for rules in reversed(ignore_rules):
+            # the path is always below the directory of the '.gitignore' file
+            relative_path: str = path[len(rules.directory) + 1 :].replace(os.sep, "/")
+            if is_directory:
+                relative_path = f"{relative_path}/"
+
+            for pattern in reversed(rules.spec.patterns):
+                if (
+                    pattern.include is not None
+                    and pattern.match_file(relative_path) is not None
+                ):
+                    return pattern.include
+
+        return False
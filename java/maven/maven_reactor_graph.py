@@ -0,0 +1,223 @@
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from java.maven.maven_ga_key import MavenGaKey
+from java.maven.maven_module import MavenModule
+from java.maven.xml_maven_project import XmlMavenProject
+
+
+# the build order of the modules of a reactor, based on their parents, dependencies, plugins and imported BOMs within
+# the reactor
+class MavenReactorGraph:
+    @staticmethod
+    def of(project: XmlMavenProject) -> "MavenReactorGraph":
+        return MavenReactorGraph(project.modules)
+
+    def __init__(self, modules: Iterable[MavenModule]):
+        # modules are referred to by their index, so that edges are plain integers
+        self._modules: List[MavenModule] = []
+        self._ids: Dict[MavenGaKey, int] = {}
+        for module in modules:
+            ga_key: MavenGaKey = module.identifier.ga_key
+            if ga_key not in self._ids:
+                self._ids[ga_key] = len(self._modules)
+                self._modules.append(module)
+
+        # both directions are stored as adjacency arrays: the edges of module 'i' are 'targets[offsets[i]:offsets[i + 1]]'
+        self._upstream_offsets: array = array("l", [0])
+        self._upstream_targets: array = array("l")
+        for module_id, module in enumerate(self._modules):
+            self._upstream_targets.extend(self._find_upstream_ids(module_id, module))
+            self._upstream_offsets.append(len(self._upstream_targets))
+
+        self._downstream_offsets: array
+        self._downstream_targets: array
+        self._downstream_offsets, self._downstream_targets = self._invert()
+
+        self._layers: Optional[List[List[int]]] = None
+        self._positions: Optional[array] = None
+
+    def _find_upstream_ids(self, module_id: int, module: MavenModule) -> List[int]:
+        # managed dependencies and plugins are no edges, e.g. parents usually manage the versions of their children
+        ga_keys: List[MavenGaKey] = list(module.build_dependency_keys)
+        if module.parent_identifier is not None:
+            ga_keys.append(module.parent_identifier.ga_key)
+
+        # modules outside of the reactor are no edges, and every edge is only stored once
+        upstream_ids: Dict[int, None] = {}
+        for ga_key in ga_keys:
+            upstream_id: Optional[int] = self._ids.get(ga_key)
+            if upstream_id is not None and upstream_id != module_id:
+                upstream_ids[upstream_id] = None
+
+        return list(upstream_ids)
+
+    def _invert(self) -> Tuple[array, array]:
+        counts: List[int] = [0] * len(self._modules)
+        for upstream_id in self._upstream_targets:
+            counts[upstream_id] += 1
+
+        offsets: array = array("l", [0])
+        for count in counts:
+            offsets.append(offsets[-1] + count)
+
+        targets: array = array(
+            "l", bytes(len(self._upstream_targets) * array("l").itemsize)
+        )
+        next_indices: List[int] = list(offsets[:-1])
+        for module_id in range(len(self._modules)):
+            for upstream_id in self._get_upstream_ids(module_id):
+                targets[next_indices[upstream_id]] = module_id
+                next_indices[upstream_id] += 1
+
+        return offsets, targets
+
+    # region module queries
+
+    @property
+    def modules(self) -> List[MavenModule]:
+        return list(self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+    def __contains__(self, module: MavenModule) -> bool:
+        return module.identifier.ga_key in self._ids
+
+    def get_module(self, ga_key: MavenGaKey) -> Optional[MavenModule]:
+        module_id: Optional[int] = self._ids.get(ga_key)
+        return self._modules[module_id] if module_id is not None else None
+
+    def get_dependencies(self, module: MavenModule) -> List[MavenModule]:
+        return self._to_modules(self._get_upstream_ids(self._get_id(module)))
+
+    def get_dependents(self, module: MavenModule) -> List[MavenModule]:
+        return self._to_modules(self._get_downstream_ids(self._get_id(module)))
+
+    def get_transitive_dependencies(self, *modules: MavenModule) -> List[MavenModule]:
+        return self._to_sorted_modules(
+            self._traverse(
+                [self._get_id(m) for m in modules],
+                self._upstream_offsets,
+                self._upstream_targets,
+            )
+        )
+
+    def get_transitive_dependents(self, *modules: MavenModule) -> List[MavenModule]:
+        return self._to_sorted_modules(
+            self._traverse(
+                [self._get_id(m) for m in modules],
+                self._downstream_offsets,
+                self._downstream_targets,
+            )
+        )
+
+    # endregion
+
+    # region build order
+
+    def topological_order(self) -> List[MavenModule]:
+        # every module is listed after all of its dependencies
+        return [self._modules[i] for layer in self._get_layers() for i in layer]
+
+    def layers(self) -> List[List[MavenModule]]:
+        # the modules of a layer only depend on modules of previous layers, so that they can be built in parallel
+        return [self._to_modules(layer) for layer in self._get_layers()]
+
+    def _get_layers(self) -> List[List[int]]:
+        if self._layers is not None:
+            return self._layers
+
+        # Kahn's algorithm, processing all modules without remaining dependencies at once
+        remaining_counts: List[int] = [
+            self._upstream_offsets[i + 1] - self._upstream_offsets[i]
+            for i in range(len(self._modules))
+        ]
+        layers: List[List[int]] = []
+        layer: List[int] = [i for i, count in enumerate(remaining_counts) if count == 0]
+        processed_count: int = 0
+        while len(layer) > 0:
+            layers.append(layer)
+            processed_count += len(layer)
+
+            next_layer: List[int] = []
+            for module_id in layer:
+                for downstream_id in self._get_downstream_ids(module_id):
+                    remaining_counts[downstream_id] -= 1
+                    if remaining_counts[downstream_id] == 0:
+                        next_layer.append(downstream_id)
+
+            layer = next_layer
+
+        if processed_count < len(self._modules):
+            cyclic_modules: List[str] = [
+                str(self._modules[i].identifier.ga_key)
+                for i, count in enumerate(remaining_counts)
+                if count > 0
+            ]
+            raise AssertionError(
+                f"Unable to determine the build order: the modules {', '.join(cyclic_modules)} "
+                f"are part of (or depend on) a cycle."
+            )
+
+        positions: array = array("l", bytes(len(self._modules) * array("l").itemsize))
+        for position, module_id in enumerate([i for l in layers for i in l]):
+            positions[module_id] = position
+
+        self._layers = layers
+        self._positions = positions
+
+        return layers
+
+    # endregion
+
+    def _get_id(self, module: MavenModule) -> int:
+        module_id: Optional[int] = self._ids.get(module.identifier.ga_key)
+        if module_id is None:
+            raise AssertionError(
+                f"Module '{module.identifier.ga_key}' is not part of the reactor."
+            )
+
+        return module_id
+
+    def _get_upstream_ids(self, module_id: int) -> array:
+        return self._upstream_targets[
+            self._upstream_offsets[module_id] : self._upstream_offsets[module_id + 1]
+        ]
+
+    def _get_downstream_ids(self, module_id: int) -> array:
+        return self._downstream_targets[
+            self._downstream_offsets[module_id] : self._downstream_offsets[
+                module_id + 1
+            ]
+        ]
+
+    def _traverse(
+        self, start_ids: List[int], offsets: array, targets: array
+    ) -> List[int]:
+        # the start modules are part of the result, and every module is visited once
+        visited: bytearray = bytearray(len(self._modules))
+        result: List[int] = []
+        for module_id in start_ids:
+            if not visited[module_id]:
+                visited[module_id] = 1
+                result.append(module_id)
+
+        index: int = 0
+        while index < len(result):
+            module_id: int = result[index]
+            index += 1
+            for target_id in targets[offsets[module_id] : offsets[module_id + 1]]:
+                if not visited[target_id]:
+                    visited[target_id] = 1
+                    result.append(target_id)
+
+        return result
+
+    def _to_modules(self, module_ids: Iterable[int]) -> List[MavenModule]:
+        return [self._modules[i] for i in module_ids]
+
+    def _to_sorted_modules(self, module_ids: List[int]) -> List[MavenModule]:
+        self._get_layers()
+        positions: array = self._positions
+        return self._to_modules(sorted(module_ids, key=positions.__getitem__))
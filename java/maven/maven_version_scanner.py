@@ -0,0 +1,230 @@
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, ClassVar, Dict, List, Optional, Pattern, Set
+from xml.parsers import expat
+from xml.parsers.expat import XMLParserType
+
+
+# finds the version of a single POM without reading the whole model, stopping as soon as the version is resolved
+class MavenVersionScanner:
+    CHUNK_SIZE: ClassVar[int] = 16 * 1024
+    PROPERTY: ClassVar[Pattern] = re.compile(r"\$\{(?P<name>[^}]+)}")
+    SCANNED_ELEMENTS: ClassVar[Set[str]] = {"version", "parent", "properties"}
+    PARENT_VERSION_PROPERTIES: ClassVar[Set[str]] = {
+        "project.parent.version",
+        "parent.version",
+    }
+
+    @dataclass
+    class Context:
+        pom: Path
+        version: Optional[str] = None
+        parent_version: Optional[str] = None
+        relative_path: Optional[str] = None
+        properties: Dict[str, str] = field(default_factory=dict)
+
+        # the element names from the root to the current element and the text of the current element
+        path: List[str] = field(default_factory=list)
+        text: List[str] = field(default_factory=list)
+
+    class _Resolved(Exception):
+        pass
+
+    def scan(self, pom: Path) -> str:
+        context: MavenVersionScanner.Context = self._scan(pom, lambda c: c.version)
+
+        # just like Maven, modules without a version inherit the version of their parent
+        version: Optional[str] = (
+            context.version if context.version is not None else context.parent_version
+        )
+        if version is None:
+            raise AssertionError(
+                f"Unable to determine Maven Version from '{pom.resolve().absolute()}'."
+            )
+
+        return self._resolve(context, version, set())
+
+    def _resolve(
+        self, context: "MavenVersionScanner.Context", value: str, names: Set[str]
+    ) -> str:
+        return MavenVersionScanner.PROPERTY.sub(
+            lambda m: self._resolve_property(context, m.group("name"), names), value
+        )
+
+    def _resolve_property(
+        self, context: "MavenVersionScanner.Context", name: str, names: Set[str]
+    ) -> str:
+        if name in names:
+            raise AssertionError(
+                f"Unable to resolve property '{name}' in '{context.pom.resolve().absolute()}': "
+                f"the property references itself."
+            )
+
+        if name in MavenVersionScanner.PARENT_VERSION_PROPERTIES:
+            if context.parent_version is None:
+                raise self._create_unresolved_error(context, name)
+
+            return self._resolve(context, context.parent_version, names | {name})
+
+        if name in context.properties:
+            return self._resolve(context, context.properties[name], names | {name})
+
+        # properties that are not defined by the module are inherited from its parent
+        parent_pom: Optional[Path] = self._get_parent_pom(context)
+        if parent_pom is None:
+            raise self._create_unresolved_error(context, name)
+
+        parent_context: MavenVersionScanner.Context = self._scan(
+            parent_pom, lambda c: f"${{{name}}}"
+        )
+
+        return self._resolve_property(parent_context, name, names)
+
+    def _create_unresolved_error(
+        self, context: "MavenVersionScanner.Context", name: str
+    ) -> Exception:
+        return AssertionError(
+            f"Unable to resolve property '{name}' in '{context.pom.resolve().absolute()}'."
+        )
+
+    def _get_parent_pom(self, context: "MavenVersionScanner.Context") -> Optional[Path]:
+        if context.parent_version is None:
+            return None
+
+        relative_path: str = (
+            context.relative_path.strip()
+            if context.relative_path is not None
+            else "../pom.xml"
+        )
+        if not relative_path:
+            return None
+
+        parent_pom: Path = Path(context.pom.parent, relative_path)
+        if parent_pom.is_dir():
+            parent_pom = Path(parent_pom, "pom.xml")
+
+        if not parent_pom.is_file():
+            return None
+
+        return parent_pom
+
+    def _scan(
+        self,
+        pom: Path,
+        get_value: Callable[["MavenVersionScanner.Context"], Optional[str]],
+    ) -> "MavenVersionScanner.Context":
+        context: MavenVersionScanner.Context = MavenVersionScanner.Context(pom)
+        parser: XMLParserType = expat.ParserCreate(namespace_separator="}")
+        parser.buffer_text = True
+
+        # subtrees without relevant elements (e.g. 'dependencies') are skipped with handlers that only count the depth
+        skipped_depth: int = 0
+
+        def on_start(name: str, attributes: Dict[str, str]) -> None:
+            local_name: str = name.rpartition("}")[2]
+            context.path.append(local_name)
+            context.text.clear()
+
+            depth: int = len(context.path)
+            if (
+                depth == 2 and local_name not in MavenVersionScanner.SCANNED_ELEMENTS
+            ) or depth > 3:
+                skip_start(name, attributes)
+
+        def on_data(data: str) -> None:
+            context.text.append(data)
+
+        def on_end(name: str) -> None:
+            scanned: bool = self._on_element(context, "".join(context.text).strip())
+            context.path.pop()
+            context.text.clear()
+            if not scanned:
+                return
+
+            value: Optional[str] = get_value(context)
+            if value is not None and self._is_resolvable(context, value, set()):
+                raise MavenVersionScanner._Resolved()
+
+        def skip_start(name: str, attributes: Dict[str, str]) -> None:
+            nonlocal skipped_depth
+            skipped_depth += 1
+            if skipped_depth == 1:
+                parser.StartElementHandler = skip_start
+                parser.EndElementHandler = skip_end
+                parser.CharacterDataHandler = None
+
+        def skip_end(name: str) -> None:
+            nonlocal skipped_depth
+            skipped_depth -= 1
+            if skipped_depth == 0:
+                context.path.pop()
+                context.text.clear()
+                parser.StartElementHandler = on_start
+                parser.EndElementHandler = on_end
+                parser.CharacterDataHandler = on_data
+
+        parser.StartElementHandler = on_start
+        parser.CharacterDataHandler = on_data
+        parser.EndElementHandler = on_end
+
+        try:
+            with pom.open("rb") as r:
+                while chunk := r.read(MavenVersionScanner.CHUNK_SIZE):
+                    parser.Parse(chunk, False)
+
+                parser.Parse(b"", True)
+
+        except MavenVersionScanner._Resolved:
+            pass
+
+        except expat.ExpatError as e:
+            raise AssertionError(
+                f"Unable to parse '{pom.resolve().absolute()}': {e}."
+            ) from e
+
+        return context
+
+    def _on_element(self, context: "MavenVersionScanner.Context", text: str) -> bool:
+        path: List[str] = context.path
+        if len(path) == 2 and path[1] == "version":
+            context.version = text
+
+        elif len(path) == 3 and path[1] == "parent":
+            if path[2] == "version":
+                context.parent_version = text
+
+            elif path[2] == "relativePath":
+                context.relative_path = text
+
+            else:
+                return False
+
+        elif len(path) == 3 and path[1] == "properties":
+            context.properties[path[2]] = text
+
+        else:
+            return False
+
+        return True
+
+    def _is_resolvable(
+        self, context: "MavenVersionScanner.Context", value: str, names: Set[str]
+    ) -> bool:
+        # only checks whether the value can be resolved with what has been read so far
+        for match in MavenVersionScanner.PROPERTY.finditer(value):
+            name: str = match.group("name")
+            if name in names:
+                return False
+
+            resolved_value: Optional[str] = (
+                context.parent_version
+                if name in MavenVersionScanner.PARENT_VERSION_PROPERTIES
+                else context.properties.get(name)
+            )
+            if resolved_value is None or not self._is_resolvable(
+                context, resolved_value, names | {name}
+            ):
+                return False
+
+        return True
@@ -1,6 +1,7 @@
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional, Union
 
+from java.maven.maven_ga_key import MavenGaKey
 from java.maven.maven_module import MavenModule
 from java.maven.maven_module_identifier import MavenModuleIdentifier
 from java.maven.maven_property import MavenProperty
@@ -17,19 +18,65 @@ class XmlMavenModule(MavenModule):
         pom_file: Path,
         identifier: XmlMavenModuleIdentifier,
         parent_identifier: Optional[XmlMavenModuleIdentifier] = None,
-        properties: Optional[List[XmlMavenProperty]] = None,
-        dependencies: Optional[List[XmlMavenModuleIdentifier]] = None,
-        plugins: Optional[List[XmlMavenModuleIdentifier]] = None,
+        properties: Optional[
+            Union[List[XmlMavenProperty], Callable[[], List[XmlMavenProperty]]]
+        ] = None,
+        dependencies: Optional[
+            Union[
+                List[XmlMavenModuleIdentifier],
+                Callable[[], List[XmlMavenModuleIdentifier]],
+            ]
+        ] = None,
+        plugins: Optional[
+            Union[
+                List[XmlMavenModuleIdentifier],
+                Callable[[], List[XmlMavenModuleIdentifier]],
+            ]
+        ] = None,
+        managed_dependencies: Optional[
+            Union[
+                List[XmlMavenModuleIdentifier],
+                Callable[[], List[XmlMavenModuleIdentifier]],
+            ]
+        ] = None,
+        managed_plugins: Optional[
+            Union[
+                List[XmlMavenModuleIdentifier],
+                Callable[[], List[XmlMavenModuleIdentifier]],
+            ]
+        ] = None,
+        build_dependency_keys: Optional[
+            Union[List[MavenGaKey], Callable[[], List[MavenGaKey]]]
+        ] = None,
     ):
         self._xml_document: XmlDocument = xml_document
         self._pom_file: Path = pom_file
         self._identifier: XmlMavenModuleIdentifier = identifier
         self._parent_identifier: Optional[XmlMavenModuleIdentifier] = parent_identifier
-        self._properties: List[XmlMavenProperty] = get_or_else(properties, list)
-        self._dependencies: List[XmlMavenModuleIdentifier] = get_or_else(
-            dependencies, list
-        )
-        self._plugins: List[XmlMavenModuleIdentifier] = get_or_else(plugins, list)
+
+        # sections may be given as functions, so that they are only read from the document when they are accessed
+        self._properties: Union[
+            List[XmlMavenProperty], Callable[[], List[XmlMavenProperty]]
+        ] = get_or_else(properties, [])
+        self._dependencies: Union[
+            List[XmlMavenModuleIdentifier],
+            Callable[[], List[XmlMavenModuleIdentifier]],
+        ] = get_or_else(dependencies, [])
+        self._plugins: Union[
+            List[XmlMavenModuleIdentifier],
+            Callable[[], List[XmlMavenModuleIdentifier]],
+        ] = get_or_else(plugins, [])
+        self._managed_dependencies: Union[
+            List[XmlMavenModuleIdentifier],
+            Callable[[], List[XmlMavenModuleIdentifier]],
+        ] = get_or_else(managed_dependencies, [])
+        self._managed_plugins: Union[
+            List[XmlMavenModuleIdentifier],
+            Callable[[], List[XmlMavenModuleIdentifier]],
+        ] = get_or_else(managed_plugins, [])
+        self._build_dependency_keys: Union[
+            List[MavenGaKey], Callable[[], List[MavenGaKey]]
+        ] = get_or_else(build_dependency_keys, [])
 
     @property
     def xml_document(self) -> XmlDocument:
@@ -46,10 +93,37 @@ class XmlMavenModule(MavenModule):
         return self._parent_identifier
 
     def _get_properties(self) -> List[MavenProperty]:
+        if callable(self._properties):
+            self._properties = self._properties()
+
         return self._properties
 
     def _get_dependencies(self) -> List[MavenModuleIdentifier]:
+        if callable(self._dependencies):
+            self._dependencies = self._dependencies()
+
         return self._dependencies
 
     def _get_plugins(self) -> List[MavenModuleIdentifier]:
+        if callable(self._plugins):
+            self._plugins = self._plugins()
+
         return self._plugins
+
+    def _get_managed_dependencies(self) -> List[MavenModuleIdentifier]:
+        if callable(self._managed_dependencies):
+            self._managed_dependencies = self._managed_dependencies()
+
+        return self._managed_dependencies
+
+    def _get_managed_plugins(self) -> List[MavenModuleIdentifier]:
+        if callable(self._managed_plugins):
+            self._managed_plugins = self._managed_plugins()
+
+        return self._managed_plugins
+
+    def _get_build_dependency_keys(self) -> List[MavenGaKey]:
+        if callable(self._build_dependency_keys):
+            self._build_dependency_keys = self._build_dependency_keys()
+
+        return self._build_dependency_keys
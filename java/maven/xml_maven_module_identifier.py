@@ -1,3 +1,6 @@
+from typing import Optional
+
+from java.maven.maven_ga_key import MavenGaKey
 from java.maven.maven_module_identifier import MavenModuleIdentifier
 from utility.xml.xml_node import XmlNode
 
@@ -9,6 +12,7 @@ class XmlMavenModuleIdentifier(MavenModuleIdentifier):
         self._group_id_node: XmlNode = group_id_node
         self._artifact_id_node: XmlNode = artifact_id_node
         self._version_node: XmlNode = version_node
+        self._ga_key: Optional[MavenGaKey] = None
 
     @property
     def group_id(self) -> str:
@@ -30,6 +34,19 @@ class XmlMavenModuleIdentifier(MavenModuleIdentifier):
     def artifact_id_node(self) -> XmlNode:
         return self._artifact_id_node
 
+    def _get_ga_key(self) -> MavenGaKey:
+        # the nodes may change, so the cached key is only used as long as it still matches their texts
+        group_id: str = self.group_id
+        artifact_id: str = self.artifact_id
+        if (
+            self._ga_key is None
+            or self._ga_key.group_id != group_id
+            or self._ga_key.artifact_id != artifact_id
+        ):
+            self._ga_key = MavenGaKey.of(group_id, artifact_id)
+
+        return self._ga_key
+
     def _get_version(self) -> str:
         return self._version_node.text
 
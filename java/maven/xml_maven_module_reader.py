@@ -1,84 +1,473 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from enum import Enum
 from pathlib import Path
-from typing import List, Optional
-from xml.etree import ElementTree
-from xml.etree.ElementTree import TreeBuilder, XMLParser
-
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from java.maven.maven_ga_key import MavenGaKey
 from java.maven.maven_module_reader import MavenModuleReader
 from java.maven.xml_maven_module import XmlMavenModule
 from java.maven.xml_maven_module_identifier import XmlMavenModuleIdentifier
 from java.maven.xml_maven_property import XmlMavenProperty
-from utility.type_utility import all_defined, get_or_raise
-from utility.xml.e_tree_xml_document import ETreeXmlDocument
+from utility.file_cache import FileCache
+from utility.git_blob_reader import GitBlobReader
+from utility.type_utility import all_defined, get_or_else, get_or_raise
+from utility.xml.default_xml_document import DefaultXmlDocument
+from utility.xml.source_xml_document import SourceXmlDocument
 from utility.xml.xml_document import XmlDocument
 from utility.xml.xml_node import XmlNode
+from utility.xml.xml_path import XmlPath
+from utility.xml.xml_source_patcher import XmlSourcePatcher
+
+T = TypeVar("T")
 
 
 class XmlMavenModuleReader(MavenModuleReader):
+    PROJECT: ClassVar[XmlPath] = XmlPath.compile("project")
+    PARENT: ClassVar[XmlPath] = XmlPath.compile("project", "parent")
+    PROPERTIES: ClassVar[XmlPath] = XmlPath.compile("project", "properties", "*")
+    MODULES: ClassVar[XmlPath] = XmlPath.compile("project", "modules", "*")
+    DEPENDENCIES: ClassVar[XmlPath] = XmlPath.compile("project", "dependencies", "*")
+    MANAGED_DEPENDENCIES: ClassVar[XmlPath] = XmlPath.compile(
+        "project", "dependencyManagement", "dependencies", "*"
+    )
+    PLUGINS: ClassVar[XmlPath] = XmlPath.compile("project", "build", "plugins", "*")
+    MANAGED_PLUGINS: ClassVar[XmlPath] = XmlPath.compile(
+        "project", "build", "pluginManagement", "plugins", "*"
+    )
+    # plugins without group id are plugins of Maven itself
+    DEFAULT_PLUGIN_GROUP_ID: ClassVar[str] = "org.apache.maven.plugins"
+    IMPORT_SCOPE: ClassVar[str] = "import"
+    PROJECT_GROUP_ID_PROPERTIES: ClassVar[Set[str]] = {
+        "${project.groupId}",
+        "${pom.groupId}",
+    }
+    READ_ONLY_PATHS: ClassVar[List[XmlPath]] = [
+        XmlPath.compile("project", name)
+        for name in ["groupId", "artifactId", "version", "parent", "modules"]
+    ]
+
+    class Section(Enum):
+        PROPERTIES = "properties"
+        DEPENDENCIES = "dependencies"
+        PLUGINS = "plugins"
+        BUILD_DEPENDENCIES = "build dependencies"
+
+    # the additional paths that are kept by read-only documents for every section
+    READ_ONLY_SECTION_PATHS: ClassVar[Dict[Section, List[XmlPath]]] = {
+        Section.PROPERTIES: [XmlPath.compile("project", "properties")],
+        Section.DEPENDENCIES: [
+            XmlPath.compile("project", "dependencies"),
+            XmlPath.compile("project", "dependencyManagement"),
+        ],
+        Section.PLUGINS: [
+            XmlPath.compile("project", "build", "plugins"),
+            XmlPath.compile("project", "build", "pluginManagement", "plugins"),
+        ],
+        Section.BUILD_DEPENDENCIES: [
+            XmlPath.compile("project", "dependencies"),
+            XmlPath.compile("project", "dependencyManagement"),
+            XmlPath.compile("project", "build", "plugins"),
+        ],
+    }
+
+    CACHE_NAME: ClassVar[str] = "maven-modules"
+    CACHE_FORMAT_VERSION: ClassVar[int] = 2
+
     @dataclass
     class Context:
         pom: Path
         xml_document: XmlDocument
-        properties: List[XmlMavenProperty] = field(default_factory=list)
+        # sections that have not been read yet are 'None'
+        properties: Optional[List[XmlMavenProperty]] = None
         parent_identifier: Optional[XmlMavenModuleIdentifier] = None
         identifier: Optional[XmlMavenModuleIdentifier] = None
-        dependencies: List[XmlMavenModuleIdentifier] = field(default_factory=list)
-        plugins: List[XmlMavenModuleIdentifier] = field(default_factory=list)
+        dependencies: Optional[List[XmlMavenModuleIdentifier]] = None
+        plugins: Optional[List[XmlMavenModuleIdentifier]] = None
+        modules: List[XmlNode] = field(default_factory=list)
+        managed_dependencies: Optional[List[XmlMavenModuleIdentifier]] = None
+        managed_plugins: Optional[List[XmlMavenModuleIdentifier]] = None
+        build_dependency_keys: Optional[List[MavenGaKey]] = None
+
+    @dataclass
+    class PendingModule:
+        pom: Path
+        resolved_pom: Path
+        ancestors: Tuple[Path, ...]
+        future: Optional[Future] = None
+
+    @staticmethod
+    def cached(
+        read_only: bool = False,
+        max_workers: Optional[int] = 1,
+        sections: Optional[Iterable["XmlMavenModuleReader.Section"]] = None,
+    ) -> "XmlMavenModuleReader":
+        return XmlMavenModuleReader(
+            read_only,
+            FileCache.new(XmlMavenModuleReader.CACHE_NAME),
+            max_workers,
+            sections,
+        )
+
+    @staticmethod
+    def of_revision(
+        blob_reader: GitBlobReader,
+        revision: str,
+        read_only: bool = False,
+        max_workers: Optional[int] = 1,
+        sections: Optional[Iterable["XmlMavenModuleReader.Section"]] = None,
+    ) -> "XmlMavenModuleReader":
+        # POMs are read as they are in the given revision, so the paths of the work tree are only used as names
+        return XmlMavenModuleReader(
+            read_only,
+            None,
+            max_workers,
+            sections,
+            lambda pom: blob_reader.read(revision, pom),
+        )
+
+    def __init__(
+        self,
+        read_only: bool = False,
+        cache: Optional[FileCache] = None,
+        max_workers: Optional[int] = 1,
+        sections: Optional[Iterable["XmlMavenModuleReader.Section"]] = None,
+        source_reader: Optional[Callable[[Path], bytes]] = None,
+    ):
+        if cache is not None and source_reader is not None:
+            raise AssertionError(
+                "Unable to cache modules that are not read from the file system."
+            )
+
+        self._read_only: bool = read_only
+        self._cache: Optional[FileCache] = cache
+
+        # reads the source of a POM, instead of the file itself (e.g. from a git revision)
+        self._source_reader: Optional[Callable[[Path], bytes]] = source_reader
+
+        # all sections are read lazily when they are accessed, unless the caller tells which sections it is going to
+        # use: these are read right away (e.g. in parallel), and read-only documents drop all other sections
+        self._sections: Optional[Set[XmlMavenModuleReader.Section]] = (
+            set(sections) if sections is not None else None
+        )
+
+        # modules are read sequentially by default, 'None' uses the default worker count of the thread pool
+        self._max_workers: Optional[int] = max_workers
+
+        # POMs that were already read recursively, so that every POM is only read once per reader
+        self._visited: Set[Path] = set()
+        # the modules of every aggregator that was read recursively, to find cycles through POMs that were visited
+        self._modules_by_aggregator: Dict[Path, Set[Path]] = {}
 
     def read(self, pom: Path) -> XmlMavenModule:
-        context: XmlMavenModuleReader.Context = self._create_context(pom)
-        return self._read(context)
+        context: XmlMavenModuleReader.Context = self._read_context(pom)
+        return self._create_module(context)
+
+    def _read_context(self, pom: Path) -> "XmlMavenModuleReader.Context":
+        if self._cache is None:
+            context: XmlMavenModuleReader.Context = self._create_context(pom)
+            self._read(context, get_or_else(self._sections, set))
+
+            return context
+
+        entry: FileCache.Entry = self._cache.read(pom)
+        cached_context: Optional[XmlMavenModuleReader.Context] = self._load_context(
+            pom, entry
+        )
+        if cached_context is not None:
+            return cached_context
 
-    def _read(self, context: "XmlMavenModuleReader.Context") -> XmlMavenModule:
-        self._read_properties(context)
+        # the whole document is parsed, because the cache needs the positions of all nodes in the source
+        context: XmlMavenModuleReader.Context = XmlMavenModuleReader.Context(
+            pom, DefaultXmlDocument.parse(pom, entry.source)
+        )
+        # the cache needs all sections
+        self._read(context, set(XmlMavenModuleReader.Section))
+        self._store_context(context, entry)
+
+        return context
+
+    def _read(
+        self,
+        context: "XmlMavenModuleReader.Context",
+        sections: Set["XmlMavenModuleReader.Section"],
+    ) -> None:
         self._read_parent_identifier(context)
         self._read_identifier(context)
-        self._read_dependencies(context)
-        self._read_plugins(context)
+        self._read_modules(context)
+
+        if XmlMavenModuleReader.Section.PROPERTIES in sections:
+            context.properties = self._read_properties(context)
+
+        if XmlMavenModuleReader.Section.DEPENDENCIES in sections:
+            context.dependencies = self._read_dependencies(context)
+            context.managed_dependencies = self._read_managed_dependencies(context)
 
+        if XmlMavenModuleReader.Section.PLUGINS in sections:
+            context.plugins = self._read_plugins(context)
+            context.managed_plugins = self._read_managed_plugins(context)
+
+        if XmlMavenModuleReader.Section.BUILD_DEPENDENCIES in sections:
+            context.build_dependency_keys = self._read_build_dependency_keys(context)
+
+    def _create_module(self, context: "XmlMavenModuleReader.Context") -> XmlMavenModule:
         return XmlMavenModule(
             context.xml_document,
             context.pom,
             get_or_raise(context.identifier),
             context.parent_identifier,
-            context.properties,
-            context.dependencies,
-            context.plugins,
+            self._get_section(
+                context,
+                context.properties,
+                XmlMavenModuleReader.Section.PROPERTIES,
+                self._read_properties,
+            ),
+            self._get_section(
+                context,
+                context.dependencies,
+                XmlMavenModuleReader.Section.DEPENDENCIES,
+                self._read_dependencies,
+            ),
+            self._get_section(
+                context,
+                context.plugins,
+                XmlMavenModuleReader.Section.PLUGINS,
+                self._read_plugins,
+            ),
+            self._get_section(
+                context,
+                context.managed_dependencies,
+                XmlMavenModuleReader.Section.DEPENDENCIES,
+                self._read_managed_dependencies,
+            ),
+            self._get_section(
+                context,
+                context.managed_plugins,
+                XmlMavenModuleReader.Section.PLUGINS,
+                self._read_managed_plugins,
+            ),
+            self._get_section(
+                context,
+                context.build_dependency_keys,
+                XmlMavenModuleReader.Section.BUILD_DEPENDENCIES,
+                self._read_build_dependency_keys,
+            ),
         )
 
-    def read_recursive(self, pom: Path) -> List[XmlMavenModule]:
-        context: XmlMavenModuleReader.Context = self._create_context(pom)
-        return self._read_recursive(context)
+    def _get_section(
+        self,
+        context: "XmlMavenModuleReader.Context",
+        values: Optional[List[T]],
+        section: "XmlMavenModuleReader.Section",
+        read: Callable[["XmlMavenModuleReader.Context"], List[T]],
+    ) -> Union[List[T], Callable[[], List[T]]]:
+        if values is not None:
+            return values
+
+        if not self._read_only or self._sections is None or section in self._sections:
+            # the module reads the section when it is accessed for the first time
+            return lambda: read(context)
+
+        def raise_error() -> List[T]:
+            raise AssertionError(
+                f"Unable to read {section.value} from '{context.pom.resolve().absolute()}': the section was not requested."
+            )
 
-    def _read_recursive(
-        self, context: "XmlMavenModuleReader.Context"
-    ) -> List[XmlMavenModule]:
-        result: List[XmlMavenModule] = [self._read(context)]
+        return raise_error
 
-        for pom_path in self._read_modules(context):
-            new_context: "XmlMavenModuleReader.Context" = self._create_context(pom_path)
-            result.extend(self._read_recursive(new_context))
+    def read_recursive(self, *poms: Path) -> List[XmlMavenModule]:
+        # POMs that were read by an earlier call are skipped, until 'reset_visited' is called
+        return list(self.iter_recursive(*poms))
 
-        return result
+    def iter_recursive(self, *poms: Path) -> Iterator[XmlMavenModule]:
+        # every POM is only read once per reader, so a second call yields no modules until 'reset_visited' is called.
+        # modules are yielded depth-first as soon as they are read, while sibling modules are read in parallel
+        executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(self._max_workers) if self._max_workers != 1 else None
+        )
+        stack: List[XmlMavenModuleReader.PendingModule] = []
+        try:
+            stack.extend(reversed(self._schedule(executor, list(poms), ())))
+            while len(stack) > 0:
+                pending: XmlMavenModuleReader.PendingModule = stack.pop()
+                context: XmlMavenModuleReader.Context = self._get_context(pending)
+
+                stack.extend(
+                    reversed(
+                        self._schedule(
+                            executor,
+                            self._get_module_poms(context),
+                            pending.ancestors + (pending.resolved_pom,),
+                        )
+                    )
+                )
 
-    def _create_context(self, pom: Path) -> "XmlMavenModuleReader.Context":
-        parser: XMLParser = XMLParser(target=TreeBuilder(insert_comments=True))
-        xml_document: XmlDocument = ETreeXmlDocument(ElementTree.parse(pom, parser))
+                yield self._create_module(context)
+
+        finally:
+            # modules that have not been read (e.g. because the iteration was stopped early) can be read again later
+            for pending in stack:
+                self._visited.discard(pending.resolved_pom)
 
-        return XmlMavenModuleReader.Context(pom, xml_document)
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
 
-    def _read_properties(self, context: "XmlMavenModuleReader.Context") -> None:
-        root: Optional[XmlNode] = context.xml_document.find_first_node(
-            "project", "properties"
+    def iter_all(self, poms: Iterable[Path]) -> Iterator[XmlMavenModule]:
+        # every POM is read without its modules, e.g. because all POMs of a directory tree were discovered anyway.
+        # POMs are read in parallel while the given POMs are still being produced, and yielded in the given order
+        executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(self._max_workers) if self._max_workers != 1 else None
         )
-        if root is None:
-            return
+        queue: Deque[XmlMavenModuleReader.PendingModule] = deque()
+        try:
+            for pom in poms:
+                queue.extend(self._schedule(executor, [pom], ()))
+                while len(queue) > 0 and (
+                    queue[0].future is None or queue[0].future.done()
+                ):
+                    yield self._create_module(self._get_context(queue.popleft()))
+
+            while len(queue) > 0:
+                yield self._create_module(self._get_context(queue.popleft()))
+
+        finally:
+            for pending in queue:
+                self._visited.discard(pending.resolved_pom)
+
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def reset_visited(self) -> None:
+        self._visited.clear()
+        self._modules_by_aggregator.clear()
+
+    def _get_context(
+        self, pending: "XmlMavenModuleReader.PendingModule"
+    ) -> "XmlMavenModuleReader.Context":
+        if pending.future is not None:
+            return pending.future.result()
+
+        return self._read_context(pending.pom)
+
+    def _schedule(
+        self,
+        executor: Optional[ThreadPoolExecutor],
+        poms: List[Path],
+        ancestors: Tuple[Path, ...],
+    ) -> List["XmlMavenModuleReader.PendingModule"]:
+        result: List[XmlMavenModuleReader.PendingModule] = []
+        for pom in poms:
+            resolved_pom: Path = pom.resolve()
+            if resolved_pom in ancestors:
+                XmlMavenModuleReader._raise_cycle(
+                    [*ancestors[ancestors.index(resolved_pom) :], resolved_pom]
+                )
+
+            if len(ancestors) > 0:
+                self._modules_by_aggregator.setdefault(ancestors[-1], set()).add(
+                    resolved_pom
+                )
 
-        context.properties = [XmlMavenProperty(node) for node in root.nodes]
+            # every POM is only read once, even if it is reachable from multiple aggregators. a visited POM is no
+            # ancestor, but it may still list the aggregator as one of its (transitive) modules
+            if resolved_pom in self._visited:
+                if len(ancestors) > 0:
+                    path: Optional[List[Path]] = self._find_module_path(
+                        resolved_pom, ancestors[-1]
+                    )
+                    if path is not None:
+                        XmlMavenModuleReader._raise_cycle([ancestors[-1], *path])
+
+                continue
+
+            self._visited.add(resolved_pom)
+            result.append(
+                XmlMavenModuleReader.PendingModule(
+                    pom,
+                    resolved_pom,
+                    ancestors,
+                    (
+                        executor.submit(self._read_context, pom)
+                        if executor is not None
+                        else None
+                    ),
+                )
+            )
+
+        return result
+
+    def _find_module_path(self, start: Path, end: Path) -> Optional[List[Path]]:
+        # the modules of POMs that are not read yet are unknown, so a cycle is found once its last POM is read
+        previous: Dict[Path, Path] = {start: start}
+        stack: List[Path] = [start]
+        while len(stack) > 0:
+            pom: Path = stack.pop()
+            if pom == end:
+                path: List[Path] = [pom]
+                while pom != start:
+                    pom = previous[pom]
+                    path.append(pom)
+
+                return list(reversed(path))
+
+            for module in self._modules_by_aggregator.get(pom, ()):
+                if module not in previous:
+                    previous[module] = pom
+                    stack.append(module)
+
+        return None
+
+    @staticmethod
+    def _raise_cycle(cycle: List[Path]) -> None:
+        raise AssertionError(
+            f"Cyclic Maven modules: {' -> '.join([str(p) for p in cycle])}."
+        )
+
+    def _create_context(self, pom: Path) -> "XmlMavenModuleReader.Context":
+        source: Optional[bytes] = (
+            self._source_reader(pom) if self._source_reader is not None else None
+        )
+        if self._read_only:
+            paths: List[XmlPath] = list(XmlMavenModuleReader.READ_ONLY_PATHS)
+            for section in get_or_else(
+                self._sections, set(XmlMavenModuleReader.Section)
+            ):
+                paths.extend(XmlMavenModuleReader.READ_ONLY_SECTION_PATHS[section])
+
+            return XmlMavenModuleReader.Context(
+                pom, DefaultXmlDocument.parse_read_only(pom, *paths, source=source)
+            )
+
+        return XmlMavenModuleReader.Context(pom, DefaultXmlDocument.parse(pom, source))
+
+    def _read_properties(
+        self, context: "XmlMavenModuleReader.Context"
+    ) -> List[XmlMavenProperty]:
+        return [
+            XmlMavenProperty(node)
+            for node in context.xml_document.query_all_nodes(
+                XmlMavenModuleReader.PROPERTIES
+            )
+        ]
 
     def _read_parent_identifier(self, context: "XmlMavenModuleReader.Context") -> None:
-        root: Optional[XmlNode] = context.xml_document.find_first_node(
-            "project", "parent"
+        root: Optional[XmlNode] = context.xml_document.query_first_node(
+            XmlMavenModuleReader.PARENT
         )
         if root is None:
             return
@@ -95,15 +484,17 @@ class XmlMavenModuleReader(MavenModuleReader):
         context.parent_identifier = XmlMavenModuleIdentifier(g, a, v)
 
     def _read_identifier(self, context: "XmlMavenModuleReader.Context") -> None:
-        g: Optional[XmlNode] = context.xml_document.find_first_node(
-            "project", "groupId"
-        )
-        a: Optional[XmlNode] = context.xml_document.find_first_node(
-            "project", "artifactId"
-        )
-        v: Optional[XmlNode] = context.xml_document.find_first_node(
-            "project", "version"
+        g: Optional[XmlNode] = None
+        a: Optional[XmlNode] = None
+        v: Optional[XmlNode] = None
+
+        root: Optional[XmlNode] = context.xml_document.query_first_node(
+            XmlMavenModuleReader.PROJECT
         )
+        if root is not None:
+            g = root.find_first_node("groupId")
+            a = root.find_first_node("artifactId")
+            v = root.find_first_node("version")
 
         if g is None:
             if context.parent_identifier is None:
@@ -128,69 +519,199 @@ class XmlMavenModuleReader(MavenModuleReader):
 
         context.identifier = XmlMavenModuleIdentifier(g, a, v)
 
-    def _read_dependencies(self, context: "XmlMavenModuleReader.Context") -> None:
-        dp_root: Optional[XmlNode] = context.xml_document.find_first_node(
-            "project", "dependencies"
+    def _read_dependencies(
+        self, context: "XmlMavenModuleReader.Context"
+    ) -> List[XmlMavenModuleIdentifier]:
+        return self._read_versioned_identifiers(
+            context, XmlMavenModuleReader.DEPENDENCIES
         )
-        if dp_root is not None:
-            for dependency_root in dp_root.nodes:
-                self._read_dependency(context, dependency_root)
 
-        dpm_root: Optional[XmlNode] = context.xml_document.find_first_node(
-            "project", "dependencyManagement", "dependencies"
+    def _read_managed_dependencies(
+        self, context: "XmlMavenModuleReader.Context"
+    ) -> List[XmlMavenModuleIdentifier]:
+        return self._read_versioned_identifiers(
+            context, XmlMavenModuleReader.MANAGED_DEPENDENCIES
         )
-        if dpm_root is not None:
-            for dependency_root in dpm_root.nodes:
-                self._read_dependency(context, dependency_root)
 
-    def _read_dependency(
-        self, context: "XmlMavenModuleReader.Context", root: XmlNode
-    ) -> None:
-        g: Optional[XmlNode] = root.find_first_node("groupId")
-        a: Optional[XmlNode] = root.find_first_node("artifactId")
-        v: Optional[XmlNode] = root.find_first_node("version")
+    def _read_modules(self, context: "XmlMavenModuleReader.Context") -> None:
+        context.modules = context.xml_document.query_all_nodes(
+            XmlMavenModuleReader.MODULES
+        )
 
-        if not all_defined(g, a, v):
-            return
+    def _get_module_poms(self, context: "XmlMavenModuleReader.Context") -> List[Path]:
+        return [
+            Path(context.pom.parent, node.text, "pom.xml") for node in context.modules
+        ]
 
-        context.dependencies.append(XmlMavenModuleIdentifier(g, a, v))
+    def _read_plugins(
+        self, context: "XmlMavenModuleReader.Context"
+    ) -> List[XmlMavenModuleIdentifier]:
+        return self._read_versioned_identifiers(context, XmlMavenModuleReader.PLUGINS)
 
-    def _read_modules(self, context: "XmlMavenModuleReader.Context") -> List[Path]:
-        root: Optional[XmlNode] = context.xml_document.find_first_node(
-            "project", "modules"
+    def _read_managed_plugins(
+        self, context: "XmlMavenModuleReader.Context"
+    ) -> List[XmlMavenModuleIdentifier]:
+        return self._read_versioned_identifiers(
+            context, XmlMavenModuleReader.MANAGED_PLUGINS
         )
-        if root is None:
-            return []
 
-        return [Path(context.pom.parent, node.text, "pom.xml") for node in root.nodes]
+    def _read_versioned_identifiers(
+        self, context: "XmlMavenModuleReader.Context", path: XmlPath
+    ) -> List[XmlMavenModuleIdentifier]:
+        identifiers: List[XmlMavenModuleIdentifier] = []
+        for root in context.xml_document.query_all_nodes(path):
+            g: Optional[XmlNode] = root.find_first_node("groupId")
+            a: Optional[XmlNode] = root.find_first_node("artifactId")
+            v: Optional[XmlNode] = root.find_first_node("version")
 
-    def _read_plugins(self, context: "XmlMavenModuleReader.Context") -> None:
-        build_root: Optional[XmlNode] = context.xml_document.find_first_node(
-            "project", "build"
-        )
-        if build_root is None:
-            return
+            if all_defined(g, a, v):
+                identifiers.append(XmlMavenModuleIdentifier(g, a, v))
 
-        pl_root: Optional[XmlNode] = build_root.find_first_node("plugins")
-        if pl_root is not None:
-            for plugin_root in pl_root.nodes:
-                self._read_plugin(context, plugin_root)
-
-        plm_root: Optional[XmlNode] = build_root.find_first_node(
-            "pluginManagement", "plugins"
-        )
-        if plm_root is not None:
-            for plugin_root in plm_root.nodes:
-                self._read_plugin(context, plugin_root)
+        return identifiers
 
-    def _read_plugin(
-        self, context: "XmlMavenModuleReader.Context", root: XmlNode
+    def _read_build_dependency_keys(
+        self, context: "XmlMavenModuleReader.Context"
+    ) -> List[MavenGaKey]:
+        # just like Maven orders the reactor: by dependencies and plugins, whether their version is managed or not.
+        # managed dependencies are no dependencies, unless they import a BOM
+        project_group_id: str = get_or_raise(context.identifier).group_id
+        keys: Dict[MavenGaKey, None] = {}
+
+        def add_key(root: XmlNode, default_group_id: Optional[str]) -> None:
+            g: Optional[XmlNode] = root.find_first_node("groupId")
+            a: Optional[XmlNode] = root.find_first_node("artifactId")
+
+            group_id: Optional[str] = g.text if g is not None else default_group_id
+            if group_id in XmlMavenModuleReader.PROJECT_GROUP_ID_PROPERTIES:
+                group_id = project_group_id
+
+            if group_id is not None and a is not None:
+                keys[MavenGaKey.of(group_id, a.text)] = None
+
+        for root in context.xml_document.query_all_nodes(
+            XmlMavenModuleReader.DEPENDENCIES
+        ):
+            add_key(root, None)
+
+        for root in context.xml_document.query_all_nodes(XmlMavenModuleReader.PLUGINS):
+            add_key(root, XmlMavenModuleReader.DEFAULT_PLUGIN_GROUP_ID)
+
+        for root in context.xml_document.query_all_nodes(
+            XmlMavenModuleReader.MANAGED_DEPENDENCIES
+        ):
+            scope: Optional[XmlNode] = root.find_first_node("scope")
+            if scope is not None and scope.text == XmlMavenModuleReader.IMPORT_SCOPE:
+                add_key(root, None)
+
+        return list(keys)
+
+    # region cache
+    def _store_context(
+        self, context: "XmlMavenModuleReader.Context", entry: FileCache.Entry
     ) -> None:
-        g: Optional[XmlNode] = root.find_first_node("groupId")
-        a: Optional[XmlNode] = root.find_first_node("artifactId")
-        v: Optional[XmlNode] = root.find_first_node("version")
+        nodes: List[XmlNode] = []
+        node_ids: Dict[int, int] = {}
+
+        def get_node_id(node: XmlNode) -> int:
+            if id(node) not in node_ids:
+                node_ids[id(node)] = len(nodes)
+                nodes.append(node)
+
+            return node_ids[id(node)]
+
+        def get_node_ids(identifier: XmlMavenModuleIdentifier) -> List[int]:
+            return [
+                get_node_id(identifier.group_id_node),
+                get_node_id(identifier.artifact_id_node),
+                get_node_id(identifier.version_node),
+            ]
+
+        data: Dict[str, Any] = {
+            "version": XmlMavenModuleReader.CACHE_FORMAT_VERSION,
+            "identifier": get_node_ids(get_or_raise(context.identifier)),
+            "parent": (
+                get_node_ids(context.parent_identifier)
+                if context.parent_identifier is not None
+                else None
+            ),
+            "properties": [
+                get_node_id(p.node) for p in get_or_raise(context.properties)
+            ],
+            "dependencies": [
+                get_node_ids(d) for d in get_or_raise(context.dependencies)
+            ],
+            "plugins": [get_node_ids(p) for p in get_or_raise(context.plugins)],
+            "managed_dependencies": [
+                get_node_ids(d) for d in get_or_raise(context.managed_dependencies)
+            ],
+            "managed_plugins": [
+                get_node_ids(p) for p in get_or_raise(context.managed_plugins)
+            ],
+            "build_dependency_keys": [
+                [k.group_id, k.artifact_id]
+                for k in get_or_raise(context.build_dependency_keys)
+            ],
+            "modules": [get_node_id(m) for m in context.modules],
+        }
+
+        indices: Optional[List[int]] = context.xml_document.find_element_indices(nodes)
+        if indices is None or len(indices) < 1:
+            return
 
-        if not all_defined(g, a, v):
+        starts: Optional[List[int]] = XmlSourcePatcher(entry.source).find_starts(
+            max(indices), include_comments=False
+        )
+        if starts is None:
             return
 
-        context.plugins.append(XmlMavenModuleIdentifier(g, a, v))
+        data["nodes"] = [
+            [node.name, node.namespace, node.text, index, starts[index]]
+            for node, index in zip(nodes, indices)
+        ]
+
+        self._cache.write(entry, data)
+
+    def _load_context(
+        self, pom: Path, entry: FileCache.Entry
+    ) -> Optional["XmlMavenModuleReader.Context"]:
+        data: Optional[Dict[str, Any]] = entry.data
+        if data is None:
+            return None
+
+        if data.get("version") != XmlMavenModuleReader.CACHE_FORMAT_VERSION:
+            return None
+
+        document: SourceXmlDocument = SourceXmlDocument(entry.source, pom)
+        try:
+            nodes: List[XmlNode] = [
+                document.create_node(name, namespace, text, index, start)
+                for name, namespace, text, index, start in data["nodes"]
+            ]
+
+            def get_identifier(node_ids: List[int]) -> XmlMavenModuleIdentifier:
+                g, a, v = node_ids
+                return XmlMavenModuleIdentifier(nodes[g], nodes[a], nodes[v])
+
+            return XmlMavenModuleReader.Context(
+                pom,
+                document,
+                [XmlMavenProperty(nodes[i]) for i in data["properties"]],
+                (
+                    get_identifier(data["parent"])
+                    if data["parent"] is not None
+                    else None
+                ),
+                get_identifier(data["identifier"]),
+                [get_identifier(d) for d in data["dependencies"]],
+                [get_identifier(p) for p in data["plugins"]],
+                [nodes[i] for i in data["modules"]],
+                [get_identifier(d) for d in data["managed_dependencies"]],
+                [get_identifier(p) for p in data["managed_plugins"]],
+                [MavenGaKey.of(g, a) for g, a in data["build_dependency_keys"]],
+            )
+
+        except (KeyError, IndexError, TypeError, ValueError):
+            # entries that were written by an incompatible version are simply read again
+            return None
+
+    # endregion
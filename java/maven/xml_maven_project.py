@@ -1,14 +1,19 @@
 import re
+from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from re import Match
-from typing import ClassVar, Dict, List, Pattern, Set, Union, cast
+from typing import ClassVar, Dict, Iterable, List, Optional, Pattern, Set, Tuple, cast
 
+from java.maven.maven_ga_key import MavenGaKey
 from java.maven.maven_module import MavenModule
 from java.maven.maven_module_identifier import MavenModuleIdentifier
 from java.maven.xml_maven_module import XmlMavenModule
 from java.maven.xml_maven_module_identifier import XmlMavenModuleIdentifier
 from java.maven.xml_maven_property import XmlMavenProperty
 from utility.type_utility import get_or_else
+from utility.xml.xml_batch_writer import XmlBatchWriter
+from utility.xml.xml_document import XmlDocument
 from utility.xml.xml_node import XmlNode
 
 
@@ -17,26 +22,117 @@ class XmlMavenProject:
         r"^(?P<prefix>\D+)?(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)(?P<suffix>\D.+)?$"
     )
     PROPERTY: ClassVar[Pattern] = re.compile(r"^\$\{(?P<name>[^}]+)}$")
+    SNAPSHOT_SUFFIX: ClassVar[str] = "-SNAPSHOT"
+    # properties that Maven resolves to the version of the module itself (or its parent)
+    MODULE_VERSION_PROPERTIES: ClassVar[Set[str]] = {
+        "project.version",
+        "project.parent.version",
+    }
 
     class VersionBumpType(Enum):
         MAJOR = "major"
         MINOR = "minor"
         PATCH = "patch"
 
+    @dataclass(frozen=True)
+    class VersionChange:
+        pom_file: Path
+        # the changed node, e.g. 'project/version' or 'project/properties/revision'
+        path: str
+        old_version: str
+        new_version: str
+        node: XmlNode = field(compare=False, repr=False)
+        xml_document: XmlDocument = field(compare=False, repr=False)
+
+        def __str__(self) -> str:
+            return f"{self.pom_file}: {self.path}: {self.old_version} -> {self.new_version}"
+
+    @dataclass(frozen=True)
+    class VersionChangeSet:
+        changes: Tuple["XmlMavenProject.VersionChange", ...] = ()
+
+        @property
+        def pom_files(self) -> List[Path]:
+            return list(dict.fromkeys([change.pom_file for change in self.changes]))
+
+        def is_empty(self) -> bool:
+            return len(self.changes) < 1
+
+        def __str__(self) -> str:
+            return "\n".join([str(change) for change in self.changes])
+
     def __init__(self):
-        self._modules: Dict[str, XmlMavenModule] = {}
+        self._modules: Dict[MavenGaKey, XmlMavenModule] = {}
+
+        # indices that are built on demand, so that sections of modules are only read when they are needed
+        self._property_nodes: Dict[MavenModule, Dict[str, XmlNode]] = {}
+        self._inheritance_chains: Dict[MavenModule, List[XmlMavenModule]] = {}
+
+        # the versions of all modules, until a version node (or a property it refers to) is changed
+        self._versions: Optional[Dict[XmlMavenModule, str]] = None
+        self._version_nodes: Set[XmlNode] = set()
+        self._uniform_version: Optional[str] = None
 
     def add_modules(self, *modules: XmlMavenModule) -> None:
+        self.add_all_modules(modules)
+
+    def add_all_modules(self, modules: Iterable[XmlMavenModule]) -> None:
+        # modules are consumed one by one, so that they can be added while they are still being read
         for module in modules:
-            module_id: str = self._module_id(module)
-            if module_id not in self._modules:
-                self._modules[module_id] = module
+            ga_key: MavenGaKey = module.identifier.ga_key
+            if ga_key not in self._modules:
+                self._modules[ga_key] = module
+
+                # the new module may be the (missing) parent of any module that was added before
+                self._inheritance_chains.clear()
+                self._versions = None
+
+                module.xml_document.add_change_listener(self._on_node_changed)
+
+    @property
+    def modules(self) -> List[XmlMavenModule]:
+        return list(self._modules.values())
 
     def get_module_versions(self) -> Dict[XmlMavenModule, str]:
-        return {
-            module: self._resolve_version_property_node(module, module.identifier).text
-            for module in self._modules.values()
-        }
+        return dict(self._get_versions())
+
+    @property
+    def uniform_version(self) -> Optional[str]:
+        # the version of all modules, or 'None' if the modules have different versions
+        self._get_versions()
+        return self._uniform_version
+
+    def _get_versions(self) -> Dict[XmlMavenModule, str]:
+        if self._versions is not None:
+            return self._versions
+
+        versions: Dict[XmlMavenModule, str] = {}
+        version_nodes: Set[XmlNode] = set()
+        for module in self._modules.values():
+            node: XmlNode = self._resolve_version_property_node(
+                module, module.identifier
+            )
+            versions[module] = node.text
+
+            version_nodes.add(node)
+            if isinstance(module.identifier, XmlMavenModuleIdentifier):
+                version_nodes.add(
+                    cast(XmlMavenModuleIdentifier, module.identifier).version_node
+                )
+
+        unique_versions: Set[str] = set(versions.values())
+
+        self._versions = versions
+        self._version_nodes = version_nodes
+        self._uniform_version = (
+            next(iter(unique_versions)) if len(unique_versions) == 1 else None
+        )
+
+        return versions
+
+    def _on_node_changed(self, node: XmlNode) -> None:
+        if self._versions is not None and node in self._version_nodes:
+            self._versions = None
 
     def bump_version(
         self,
@@ -44,9 +140,54 @@ class XmlMavenProject:
         assert_uniform_version: bool = True,
         write_modules: bool = True,
     ) -> None:
-        current_versions: Dict[str, str] = {
-            self._module_id(module): version
-            for module, version in self.get_module_versions().items()
+        self.apply(
+            self.plan_bump(bump_type, assert_uniform_version), write=write_modules
+        )
+
+    def plan_bump(
+        self,
+        bump_type: "XmlMavenProject.VersionBumpType",
+        assert_uniform_version: bool = True,
+    ) -> "XmlMavenProject.VersionChangeSet":
+        updated_versions: Dict[MavenGaKey, str] = self._bump_versions(
+            self._get_current_versions(assert_uniform_version), bump_type
+        )
+
+        return self._plan(updated_versions)
+
+    def plan_set_version(
+        self, version: str, assert_uniform_version: bool = True
+    ) -> "XmlMavenProject.VersionChangeSet":
+        return self._plan(
+            {
+                ga_key: version
+                for ga_key in self._get_current_versions(assert_uniform_version)
+            }
+        )
+
+    def plan_set_snapshot(self, snapshot: bool) -> "XmlMavenProject.VersionChangeSet":
+        # only the '-SNAPSHOT' suffix of every version is added or removed, so modules may have different versions
+        updated_versions: Dict[MavenGaKey, str] = {}
+        for ga_key, version in self._get_current_versions(False).items():
+            release_version: str = (
+                version[: -len(XmlMavenProject.SNAPSHOT_SUFFIX)]
+                if version.endswith(XmlMavenProject.SNAPSHOT_SUFFIX)
+                else version
+            )
+            updated_versions[ga_key] = (
+                f"{release_version}{XmlMavenProject.SNAPSHOT_SUFFIX}"
+                if snapshot
+                else release_version
+            )
+
+        return self._plan(updated_versions)
+
+    def _get_current_versions(
+        self, assert_uniform_version: bool
+    ) -> Dict[MavenGaKey, str]:
+        current_versions: Dict[MavenGaKey, str] = {
+            module.identifier.ga_key: version
+            for module, version in self._get_versions().items()
         }
 
         if assert_uniform_version:
@@ -56,38 +197,94 @@ class XmlMavenProject:
                     f"The Maven project is expected to have a uniform version, but multiple versions were found."
                 )
 
-        updated_versions: Dict[str, str] = self._bump_versions(
-            current_versions, bump_type
+        return current_versions
+
+    def _plan(
+        self, updated_versions: Dict[MavenGaKey, str]
+    ) -> "XmlMavenProject.VersionChangeSet":
+        # every node is changed once, even if it is referenced by multiple modules (e.g. a property of the parent)
+        locations: Dict[XmlNode, Tuple[XmlMavenModule, str]] = {}
+        new_versions: Dict[XmlNode, str] = {}
+        for module in self._modules.values():
+            for identifier, path in self._get_versioned_identifiers(module):
+                new_version: Optional[str] = updated_versions.get(identifier.ga_key)
+                if new_version is None:
+                    continue
+
+                location: Optional[
+                    Tuple[XmlMavenModule, XmlNode, str]
+                ] = self._resolve_version_location(module, identifier, path)
+                # e.g. '${project.version}' follows the version of the module, which is changed on its own
+                if location is None:
+                    continue
+
+                owner, node, node_path = location
+                if node not in locations:
+                    locations[node] = (owner, node_path)
+
+                new_versions[node] = new_version
+
+        return XmlMavenProject.VersionChangeSet(
+            tuple(
+                [
+                    XmlMavenProject.VersionChange(
+                        owner.pom_file,
+                        node_path,
+                        node.text,
+                        new_versions[node],
+                        node,
+                        owner.xml_document,
+                    )
+                    for node, (owner, node_path) in locations.items()
+                    if node.text != new_versions[node]
+                ]
+            )
         )
 
+    def apply(
+        self, change_set: "XmlMavenProject.VersionChangeSet", write: bool = True
+    ) -> List[Path]:
+        for change in change_set.changes:
+            if change.node.text != change.old_version:
+                raise AssertionError(
+                    f"Unable to apply version change '{change}': the version has been changed to "
+                    f"'{change.node.text}' in the meantime."
+                )
+
+        for change in change_set.changes:
+            change.node.text = change.new_version
+
+        if not write:
+            return []
+
+        # only the documents that are affected by the changes are written
+        writer: XmlBatchWriter = XmlBatchWriter()
+        for change in change_set.changes:
+            writer.add(change.xml_document, change.pom_file)
+
+        return writer.commit()
+
+    def write_modules(self, max_workers: Optional[int] = None) -> List[Path]:
+        writer: XmlBatchWriter = XmlBatchWriter(max_workers)
         for module in self._modules.values():
-            self._set_version(module, updated_versions, write_modules)
+            writer.add(module.xml_document, module.pom_file)
+
+        return writer.commit()
 
-    def _collect_current_versions(self) -> Dict[str, str]:
+    def _collect_current_versions(self) -> Dict[MavenGaKey, str]:
         return {
-            self._module_id(module): self._resolve_version_property_node(
+            module.identifier.ga_key: self._resolve_version_property_node(
                 module, module.identifier
             ).text
             for module in self._modules.values()
         }
 
-    def _module_id(self, module: Union[MavenModule, MavenModuleIdentifier]) -> str:
-        module_id: MavenModuleIdentifier
-        if isinstance(module, MavenModule):
-            module_id = cast(MavenModule, module).identifier
-
-        elif isinstance(module, MavenModuleIdentifier):
-            module_id = cast(MavenModuleIdentifier, module)
-
-        else:
-            raise AssertionError(f"Unable to determine module id of '{module}'.")
-
-        return f"{module_id.group_id}:{module_id.artifact_id}"
-
     def _bump_versions(
-        self, versions: Dict[str, str], bump_type: "XmlMavenProject.VersionBumpType"
-    ) -> Dict[str, str]:
-        result: Dict[str, str] = {}
+        self,
+        versions: Dict[MavenGaKey, str],
+        bump_type: "XmlMavenProject.VersionBumpType",
+    ) -> Dict[MavenGaKey, str]:
+        result: Dict[MavenGaKey, str] = {}
         for key, value in versions.items():
             match: Match = XmlMavenProject.SEMANTIC_VERSION.match(value)
             if match is None:
@@ -121,36 +318,48 @@ class XmlMavenProject:
 
         return result
 
-    def _set_version(
+    def _get_versioned_identifiers(
+        self, module: XmlMavenModule
+    ) -> List[Tuple[MavenModuleIdentifier, str]]:
+        # all identifiers of the module whose version may be bumped, with the path of their version node
+        result: List[Tuple[MavenModuleIdentifier, str]] = []
+        if module.parent_identifier is not None:
+            result.append((module.parent_identifier, "project/parent/version"))
+
+        result.append((module.identifier, "project/version"))
+        result.extend(
+            [
+                (d, f"project/**/dependency[{d.ga_key}]/version")
+                for d in [*module.dependencies, *module.managed_dependencies]
+            ]
+        )
+
+        return result
+
+    def _resolve_version_location(
         self,
         module: XmlMavenModule,
-        updated_versions: Dict[str, str],
-        write_modules: bool,
-    ) -> None:
-        if module.parent_identifier is not None:
-            parent_id: str = self._module_id(module.parent_identifier)
-            if parent_id in updated_versions:
-                self._resolve_version_property_node(
-                    module, module.parent_identifier
-                ).text = updated_versions[parent_id]
-
-        module_id: str = self._module_id(module.identifier)
-        if module_id in updated_versions:
-            self._resolve_version_property_node(
-                module, module.identifier
-            ).text = updated_versions[module_id]
+        module_id: MavenModuleIdentifier,
+        path: str,
+    ) -> Optional[Tuple[XmlMavenModule, XmlNode, str]]:
+        # the module that defines the version, the version node and its path, if the version is defined anywhere
+        if not isinstance(module_id, XmlMavenModuleIdentifier):
+            raise AssertionError(
+                f"Unable to determine version XML node for module '{module.identifier}'."
+            )
 
-        for dependency in module.dependencies:
-            dependency_id: str = self._module_id(dependency)
-            if dependency_id not in updated_versions:
-                continue
+        node: XmlNode = cast(XmlMavenModuleIdentifier, module_id).version_node
+        match: Match = XmlMavenProject.PROPERTY.match(node.text)
+        if match is None:
+            return module, node, path
 
-            self._resolve_version_property_node(
-                module, dependency
-            ).text = updated_versions[dependency_id]
+        property_name: str = match.group("name")
+        if property_name in XmlMavenProject.MODULE_VERSION_PROPERTIES:
+            return None
 
-        if write_modules:
-            module.xml_document.save(module.pom_file)
+        owner, property_node = self._find_property(module, property_name)
+
+        return owner, property_node, f"project/properties/{property_name}"
 
     def _resolve_version_property_node(
         self, module: MavenModule, module_id: MavenModuleIdentifier
@@ -172,26 +381,55 @@ class XmlMavenProject:
         return self._find_property_node(module, match.group("name"))
 
     def _find_property_node(self, module: MavenModule, property_name: str) -> XmlNode:
-        for p in module.properties:
-            if p.name == property_name and isinstance(p, XmlMavenProperty):
-                return cast(XmlMavenProperty, p).node
-
-        if module.parent_identifier is None:
+        return self._find_property(module, property_name)[1]
+
+    def _find_property(
+        self, module: MavenModule, property_name: str
+    ) -> Tuple[XmlMavenModule, XmlNode]:
+        chain: List[XmlMavenModule] = self._get_inheritance_chain(module)
+        for m in chain:
+            node: Optional[XmlNode] = self._get_property_nodes(m).get(property_name)
+            if node is not None:
+                return m, node
+
+        last_module: MavenModule = chain[-1] if len(chain) > 0 else module
+        if last_module.parent_identifier is None:
             raise AssertionError(
                 f"Unable to resolve property '{property_name}' in {module.identifier}."
             )
 
-        parent_id: str = self._module_id(module.parent_identifier)
-        parent_modules: List[XmlMavenModule] = list(
-            filter(
-                lambda x: self._module_id(x.identifier) == parent_id,
-                self._modules.values(),
-            )
+        raise AssertionError(
+            f"Unable to determine parent module '{last_module.parent_identifier.ga_key}' "
+            f"for module {last_module.identifier}."
         )
 
-        if len(parent_modules) != 1:
-            raise AssertionError(
-                f"Unable to determine parent module '{parent_id}' for module {module.identifier}."
-            )
+    def _get_property_nodes(self, module: XmlMavenModule) -> Dict[str, XmlNode]:
+        if module not in self._property_nodes:
+            property_nodes: Dict[str, XmlNode] = {}
+            for p in module.properties:
+                # just like a linear search, the first definition of a property wins
+                if isinstance(p, XmlMavenProperty) and p.name not in property_nodes:
+                    property_nodes[p.name] = cast(XmlMavenProperty, p).node
+
+            self._property_nodes[module] = property_nodes
+
+        return self._property_nodes[module]
+
+    def _get_inheritance_chain(self, module: MavenModule) -> List[XmlMavenModule]:
+        # the module itself followed by all of its ancestors that are part of the project
+        if module not in self._inheritance_chains:
+            chain: List[XmlMavenModule] = []
+            current: Optional[MavenModule] = module
+            while current is not None and current not in chain:
+                if isinstance(current, XmlMavenModule):
+                    chain.append(cast(XmlMavenModule, current))
+
+                current = (
+                    self._modules.get(current.parent_identifier.ga_key)
+                    if current.parent_identifier is not None
+                    else None
+                )
+
+            self._inheritance_chains[module] = chain
 
-        return self._find_property_node(parent_modules[0], property_name)
+        return self._inheritance_chains[module]
@@ -0,0 +1,221 @@
+import json
+import os
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from pathspec import PathSpec
+
+from java.maven.maven_ga_key import MavenGaKey
+from java.maven.maven_module import MavenModule
+from java.maven.maven_module_ownership_index import MavenModuleOwnershipIndex
+from java.maven.maven_reactor_graph import MavenReactorGraph
+from java.maven.xml_maven_module import XmlMavenModule
+from java.maven.xml_maven_module_reader import XmlMavenModuleReader
+from java.maven.xml_maven_project import XmlMavenProject
+from shell.shell import DefaultShell, Shell
+from shell.shell_response import ShellResponse
+from utility.type_utility import get_or_else
+
+
+def find_impacted_modules(
+    project_root_poms: List[Path],
+    diff_range: str,
+    include_dependents: bool = True,
+    shell: Optional[Shell] = None,
+    module_reader: Optional[XmlMavenModuleReader] = None,
+    ignored_files: Optional[List[str]] = None,
+) -> List[MavenModule]:
+    if any(filter(lambda x: x.name != "pom.xml", project_root_poms)):
+        raise AssertionError(
+            f"Currently, only Maven projects ('pom.xml') are supported by this operation. Sorry."
+        )
+
+    shell = get_or_else(shell, DefaultShell.new)
+    # files that match a gitignore-style pattern (relative to the repository) do not impact any module, e.g. docs
+    changed_files: List[Path] = _get_changed_files(
+        project_root_poms[0].parent,
+        diff_range,
+        shell,
+        PathSpec.from_lines("gitwildmatch", get_or_else(ignored_files, list)),
+    )
+
+    # only the sections that define edges of the reactor graph are read
+    module_reader = get_or_else(
+        module_reader,
+        lambda: XmlMavenModuleReader.cached(
+            read_only=True,
+            max_workers=os.cpu_count(),
+            sections=[XmlMavenModuleReader.Section.BUILD_DEPENDENCIES],
+        ),
+    )
+    project: XmlMavenProject = XmlMavenProject()
+    project.add_all_modules(module_reader.iter_recursive(*project_root_poms))
+
+    graph: MavenReactorGraph = MavenReactorGraph.of(project)
+    changed_modules: Dict[MavenModule, None] = {}
+    changed_poms: Set[MavenModule] = set()
+    for module, is_pom in _find_changes(project.modules, changed_files):
+        changed_modules[module] = None
+        if is_pom:
+            changed_poms.add(module)
+
+    impacted_modules: Set[MavenModule] = (
+        _find_dependents(graph, list(changed_modules), changed_poms)
+        if include_dependents
+        else set(changed_modules)
+    )
+
+    return [m for m in graph.topological_order() if m in impacted_modules]
+
+
+def _find_changes(
+    modules: List[XmlMavenModule], changed_files: List[Path]
+) -> List[Tuple[XmlMavenModule, bool]]:
+    # every file belongs to the module in its closest parent directory, files outside the reactor are ignored
+    index: MavenModuleOwnershipIndex = MavenModuleOwnershipIndex.of(modules)
+    modules_by_key: Dict[MavenGaKey, XmlMavenModule] = {}
+    for module in modules:
+        modules_by_key.setdefault(module.identifier.ga_key, module)
+
+    result: List[Tuple[XmlMavenModule, bool]] = []
+    for file in changed_files:
+        owner: Optional[MavenGaKey] = index.find_owner(file)
+        if owner is None:
+            continue
+
+        # aggregators and parents own all files next to their modules, e.g. a shared 'config/checkstyle.xml'
+        module: XmlMavenModule = modules_by_key[owner]
+        is_pom: bool = os.path.abspath(file) == os.path.abspath(module.pom_file)
+        result.append((module, is_pom))
+
+    return result
+
+
+def _find_dependents(
+    graph: MavenReactorGraph,
+    changed_modules: List[MavenModule],
+    changed_poms: Set[MavenModule],
+) -> Set[MavenModule]:
+    # children inherit the POM of their parent, but do not use its build output. so a parent only impacts its children
+    # if its POM changed, including the POMs it inherits itself
+    inherited_changes: Set[MavenModule] = set(changed_poms)
+    result: Set[MavenModule] = set(changed_modules)
+    stack: List[MavenModule] = list(changed_modules)
+    while len(stack) > 0:
+        module: MavenModule = stack.pop()
+        for dependent in graph.get_dependents(module):
+            if _is_child_only(dependent, module):
+                if module not in inherited_changes or dependent in inherited_changes:
+                    continue
+
+                inherited_changes.add(dependent)
+
+            elif dependent in result:
+                continue
+
+            result.add(dependent)
+            stack.append(dependent)
+
+    return result
+
+
+def _is_child_only(module: MavenModule, parent: MavenModule) -> bool:
+    # whether the module only depends on the other module because it is its parent
+    return (
+        module.parent_identifier is not None
+        and module.parent_identifier.ga_key == parent.identifier.ga_key
+        and parent.identifier.ga_key not in module.build_dependency_keys
+    )
+
+
+def _get_changed_files(
+    directory: Path,
+    diff_range: str,
+    shell: Shell,
+    ignored_files: Optional[PathSpec] = None,
+) -> List[Path]:
+    top_level: ShellResponse = shell.run_or_raise(
+        "git", ["rev-parse", "--show-toplevel"], directory
+    )
+    repository: Path = Path(top_level.get_stdout_lines()[0])
+
+    # without rename detection, both the old and the new path of a moved file are listed
+    diff: ShellResponse = shell.run_or_raise(
+        "git",
+        ["diff", "--name-only", "--no-renames", "-z", diff_range, "--"],
+        repository,
+    )
+
+    return [
+        Path(repository, name)
+        for name in diff.stdout.split("\0")
+        if name and (ignored_files is None or not ignored_files.match_file(name))
+    ]
+
+
+def main() -> None:
+    argument_parser: ArgumentParser = ArgumentParser(
+        "Script to find the Maven modules that are affected by changes, e.g. to build only these in CI"
+    )
+
+    argument_parser.add_argument(
+        "--range",
+        type=str,
+        required=True,
+        help="The git diff range of the changes, e.g. 'origin/main...HEAD'.",
+    )
+    argument_parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        required=False,
+        help="Indicates whether only the changed modules should be listed, without the modules that depend on them.",
+    )
+    argument_parser.add_argument(
+        "--json",
+        action="store_true",
+        required=False,
+        help="Indicates whether the modules should be printed as JSON array, e.g. for matrix builds.",
+    )
+    argument_parser.add_argument(
+        "--ignore",
+        type=str,
+        action="append",
+        required=False,
+        help="A gitignore-style pattern of files that do not impact any module, relative to the repository, e.g. "
+        "'*.md' or '.github/'. May be given multiple times.",
+    )
+    argument_parser.add_argument("pom", type=Path, nargs="+")
+
+    parsed_args: Any = argument_parser.parse_args()
+    modules: List[MavenModule] = find_impacted_modules(
+        parsed_args.pom,
+        parsed_args.range,
+        not parsed_args.changed_only,
+        ignored_files=parsed_args.ignore,
+    )
+
+    if parsed_args.json:
+        root_directory: Path = parsed_args.pom[0].resolve().parent
+        print(
+            json.dumps(
+                [
+                    {
+                        "module": str(m.identifier.ga_key),
+                        "directory": Path(
+                            os.path.relpath(m.pom_file.resolve().parent, root_directory)
+                        ).as_posix(),
+                    }
+                    for m in modules
+                    if isinstance(m, XmlMavenModule)
+                ],
+                indent=4,
+            )
+        )
+
+    elif len(modules) > 0:
+        print(f"-pl {','.join([str(m.identifier.ga_key) for m in modules])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,15 @@
+import json
 import os
 from argparse import ArgumentParser
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
-from java.maven.xml_maven_module import XmlMavenModule
+from java.maven.maven_version_scanner import MavenVersionScanner
 from java.maven.xml_maven_module_reader import XmlMavenModuleReader
 from java.maven.xml_maven_project import XmlMavenProject
+from shell.shell import Shell
+from utility.git_blob_reader import GitBlobReader
+from utility.type_utility import get_or_else
 
 
 def bump(
@@ -13,41 +17,177 @@ def bump(
     bump_type: XmlMavenProject.VersionBumpType,
     assert_uniform_version: bool = True,
     github_actions_output: bool = True,
+    dry_run: bool = False,
 ) -> None:
+    project: XmlMavenProject = __read_project(project_root_poms)
+    __apply(
+        project,
+        lambda: project.plan_bump(
+            bump_type, assert_uniform_version=assert_uniform_version
+        ),
+        github_actions_output,
+        dry_run,
+    )
+
+
+def set_version(
+    project_root_poms: List[Path],
+    version: Optional[str] = None,
+    snapshot: Optional[bool] = None,
+    assert_uniform_version: bool = True,
+    github_actions_output: bool = True,
+    dry_run: bool = False,
+) -> None:
+    if (version is None) == (snapshot is None):
+        raise AssertionError(
+            "Either a version or whether the versions are snapshots must be given."
+        )
+
+    project: XmlMavenProject = __read_project(project_root_poms)
+    __apply(
+        project,
+        lambda: (
+            project.plan_set_version(version, assert_uniform_version)
+            if version is not None
+            else project.plan_set_snapshot(snapshot)
+        ),
+        github_actions_output,
+        dry_run,
+    )
+
+
+def __read_project(project_root_poms: List[Path]) -> XmlMavenProject:
     if any(filter(lambda x: x.name != "pom.xml", project_root_poms)):
         raise AssertionError(
             f"Currently, only Maven projects ('pom.xml') are supported by this operation. Sorry."
         )
 
     project: XmlMavenProject = XmlMavenProject()
-    module_reader: XmlMavenModuleReader = XmlMavenModuleReader()
+    module_reader: XmlMavenModuleReader = XmlMavenModuleReader.cached(
+        max_workers=os.cpu_count()
+    )
 
-    for project_root_pom in project_root_poms:
-        project.add_modules(*module_reader.read_recursive(project_root_pom))
+    # all roots are read in one batch, so that modules shared by multiple roots are only read once
+    project.add_all_modules(module_reader.iter_recursive(*project_root_poms))
 
-    if github_actions_output:
-        versions: Dict[XmlMavenModule, str] = project.get_module_versions()
-        unique_versions: List[str] = list(set(versions.values()))
+    return project
 
-        if len(unique_versions) == 1:
-            __write_to_github_actions_output("old_version", unique_versions[0])
 
-        else:
-            __write_to_github_actions_output("old_version", "undefined")
+def __apply(
+    project: XmlMavenProject,
+    plan: Callable[[], XmlMavenProject.VersionChangeSet],
+    github_actions_output: bool,
+    dry_run: bool,
+) -> None:
+    if github_actions_output:
+        __write_to_github_actions_output(
+            "old_version", get_or_else(project.uniform_version, "undefined")
+        )
 
-    project.bump_version(
-        bump_type, assert_uniform_version=assert_uniform_version, write_modules=True
-    )
+    change_set: XmlMavenProject.VersionChangeSet = plan()
+    if dry_run:
+        print(change_set)
+        return
+
+    project.apply(change_set, write=True)
 
     if github_actions_output:
-        versions: Dict[XmlMavenModule, str] = project.get_module_versions()
-        unique_versions: List[str] = list(set(versions.values()))
+        __write_to_github_actions_output(
+            "new_version", get_or_else(project.uniform_version, "undefined")
+        )
+
+
+def get(
+    project_root_poms: List[Path],
+    json_output: bool = False,
+    github_actions_output: bool = False,
+) -> None:
+    if any(filter(lambda x: x.name != "pom.xml", project_root_poms)):
+        raise AssertionError(
+            f"Currently, only Maven projects ('pom.xml') are supported by this operation. Sorry."
+        )
+
+    # only the root POMs are scanned, and only until their version is known
+    scanner: MavenVersionScanner = MavenVersionScanner()
+    versions: Dict[str, str] = {
+        str(pom): scanner.scan(pom) for pom in project_root_poms
+    }
+    unique_versions: List[str] = list(dict.fromkeys(versions.values()))
+
+    if json_output:
+        print(json.dumps(versions, indent=4))
+
+    else:
+        for version in unique_versions:
+            print(version)
 
+    if github_actions_output:
         if len(unique_versions) == 1:
-            __write_to_github_actions_output("new_version", unique_versions[0])
+            __write_to_github_actions_output("version", unique_versions[0])
 
         else:
-            __write_to_github_actions_output("new_version", "undefined")
+            __write_to_github_actions_output("version", "undefined")
+
+
+def diff(
+    project_root_poms: List[Path],
+    revision_a: str,
+    revision_b: str,
+    json_output: bool = False,
+    shell: Optional[Shell] = None,
+) -> None:
+    if any(filter(lambda x: x.name != "pom.xml", project_root_poms)):
+        raise AssertionError(
+            f"Currently, only Maven projects ('pom.xml') are supported by this operation. Sorry."
+        )
+
+    # both revisions are read through the same git process, without checking them out
+    with GitBlobReader(project_root_poms[0].parent, shell) as blob_reader:
+        versions_a: Dict[str, str] = __read_versions(
+            blob_reader, revision_a, project_root_poms
+        )
+        versions_b: Dict[str, str] = __read_versions(
+            blob_reader, revision_b, project_root_poms
+        )
+
+    # modules that only exist in one of the revisions have no version in the other one
+    changes: Dict[str, Dict[str, Optional[str]]] = {}
+    for module in dict.fromkeys([*versions_a, *versions_b]):
+        old_version: Optional[str] = versions_a.get(module)
+        new_version: Optional[str] = versions_b.get(module)
+        if old_version != new_version:
+            changes[module] = {"old_version": old_version, "new_version": new_version}
+
+    if json_output:
+        print(json.dumps(changes, indent=4))
+        return
+
+    for module, change in changes.items():
+        print(
+            f"{module}: {get_or_else(change['old_version'], '(none)')} -> "
+            f"{get_or_else(change['new_version'], '(none)')}"
+        )
+
+
+def __read_versions(
+    blob_reader: GitBlobReader, revision: str, project_root_poms: List[Path]
+) -> Dict[str, str]:
+    # only the properties are needed to resolve the versions
+    module_reader: XmlMavenModuleReader = XmlMavenModuleReader.of_revision(
+        blob_reader,
+        revision,
+        read_only=True,
+        max_workers=os.cpu_count(),
+        sections=[XmlMavenModuleReader.Section.PROPERTIES],
+    )
+
+    project: XmlMavenProject = XmlMavenProject()
+    project.add_all_modules(module_reader.iter_recursive(*project_root_poms))
+
+    return {
+        str(module.identifier.ga_key): version
+        for module, version in project.get_module_versions().items()
+    }
 
 
 def __write_to_github_actions_output(key: str, value: str) -> None:
@@ -98,10 +238,96 @@ def main() -> None:
         required=False,
         help="Indicates whether the script should NOT set the GitHub action outputs.",
     )
+    bump_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        required=False,
+        help="Indicates whether the planned changes should only be printed, without changing any POM.",
+    )
     bump_parser.add_argument("pom", type=Path, nargs="+")
 
     # endregion
 
+    # region set command
+
+    set_parser: ArgumentParser = sub_parsers.add_parser(
+        "set", help="Sets the version of a Maven project, without running Maven."
+    )
+    set_version_group: Any = set_parser.add_mutually_exclusive_group(required=True)
+    set_version_group.add_argument(
+        "--version", type=str, help="The new version of all modules."
+    )
+    set_version_group.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="Only adds the '-SNAPSHOT' suffix to the versions of all modules.",
+    )
+    set_version_group.add_argument(
+        "--release",
+        action="store_true",
+        help="Only removes the '-SNAPSHOT' suffix from the versions of all modules.",
+    )
+    set_parser.add_argument(
+        "--accept-non-uniform-versions",
+        action="store_true",
+        required=False,
+        help="Indicates whether the version should even be set if the project contains different versions.",
+    )
+    set_parser.add_argument(
+        "--no-github-action-outputs",
+        action="store_true",
+        required=False,
+        help="Indicates whether the script should NOT set the GitHub action outputs.",
+    )
+    set_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        required=False,
+        help="Indicates whether the planned changes should only be printed, without changing any POM.",
+    )
+    set_parser.add_argument("pom", type=Path, nargs="+")
+
+    # endregion
+
+    # region get command
+
+    get_parser: ArgumentParser = sub_parsers.add_parser(
+        "get", help="Prints the version of Maven projects."
+    )
+    get_parser.add_argument(
+        "--json",
+        action="store_true",
+        required=False,
+        help="Indicates whether the versions should be printed as JSON object, by POM.",
+    )
+    get_parser.add_argument(
+        "--github-action-outputs",
+        action="store_true",
+        required=False,
+        help="Indicates whether the script should set the 'version' GitHub action output.",
+    )
+    get_parser.add_argument("pom", type=Path, nargs="+")
+
+    # endregion
+
+    # region diff command
+
+    diff_parser: ArgumentParser = sub_parsers.add_parser(
+        "diff",
+        help="Prints the module versions that differ between two git revisions, without checking them out.",
+    )
+    diff_parser.add_argument("revision_a", type=str)
+    diff_parser.add_argument("revision_b", type=str)
+    diff_parser.add_argument(
+        "--json",
+        action="store_true",
+        required=False,
+        help="Indicates whether the changes should be printed as JSON object, by module.",
+    )
+    diff_parser.add_argument("pom", type=Path, nargs="+")
+
+    # endregion
+
     parsed_args: Any = argument_parser.parse_args()
     if parsed_args.subparser == "bump":
         bump(
@@ -109,6 +335,32 @@ def main() -> None:
             XmlMavenProject.VersionBumpType[parsed_args.bump_type.upper()],
             not parsed_args.accept_non_uniform_versions,
             not parsed_args.no_github_action_outputs,
+            parsed_args.dry_run,
+        )
+
+    elif parsed_args.subparser == "set":
+        set_version(
+            parsed_args.pom,
+            parsed_args.version,
+            (
+                parsed_args.snapshot
+                if parsed_args.snapshot or parsed_args.release
+                else None
+            ),
+            not parsed_args.accept_non_uniform_versions,
+            not parsed_args.no_github_action_outputs,
+            parsed_args.dry_run,
+        )
+
+    elif parsed_args.subparser == "get":
+        get(parsed_args.pom, parsed_args.json, parsed_args.github_action_outputs)
+
+    elif parsed_args.subparser == "diff":
+        diff(
+            parsed_args.pom,
+            parsed_args.revision_a,
+            parsed_args.revision_b,
+            parsed_args.json,
         )
 
 
@@ -61,6 +61,28 @@ class Shell:
 
         return self._execute(process_arguments, directory)
 
+    def start(
+        self,
+        command: str,
+        arguments: Optional[List[str]] = None,
+        working_directory: Optional[Path] = None,
+    ) -> Popen:
+        # long-lived processes communicate through binary pipes, e.g. to answer many requests without being restarted
+        process_arguments: List[str] = self._assemble_process_arguments(
+            command, arguments
+        )
+        directory: Path = (
+            working_directory.resolve() if working_directory else Path(".").resolve()
+        )
+
+        return Popen(
+            process_arguments,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=directory,
+        )
+
     def _assemble_process_arguments(
         self, command: str, arguments: Optional[List[str]] = None
     ) -> List[str]:
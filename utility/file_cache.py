@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Optional, Tuple
+
+from platformdirs import user_cache_dir
+
+from utility.type_utility import get_or_else
+
+
+class FileCache:
+    VERSION: ClassVar[int] = 1
+    APPLICATION_NAME: ClassVar[str] = "dev-scripts"
+    CACHE_FILE_SUFFIXES: ClassVar[Tuple[str, ...]] = (".json", ".tmp")
+
+    # entries that were not written for this long are removed, e.g. of deleted files or of old checkouts. entries that
+    # are still used are simply written again afterwards
+    MAX_AGE_NS: ClassVar[int] = 30 * 24 * 60 * 60 * 1_000_000_000
+
+    @dataclass
+    class Entry:
+        file: Path
+        size: int
+        mtime_ns: int
+        source: bytes
+        hash: str
+        data: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def new(name: str) -> "FileCache":
+        return FileCache(Path(user_cache_dir(FileCache.APPLICATION_NAME), name))
+
+    def __init__(self, directory: Path, max_age_ns: Optional[int] = None):
+        self._directory: Path = directory
+        self._max_age_ns: int = get_or_else(max_age_ns, FileCache.MAX_AGE_NS)
+
+        # the directory is only pruned by the first write, instead of being scanned for every written entry
+        self._pruned: bool = False
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def read(self, file: Path) -> "FileCache.Entry":
+        # the file is stat-ed before it is read, so that a concurrent change is detected by the next read at the latest
+        resolved_file: Path = file.resolve()
+        stat: os.stat_result = resolved_file.stat()
+        source: bytes = resolved_file.read_bytes()
+
+        entry: FileCache.Entry = FileCache.Entry(
+            resolved_file,
+            stat.st_size,
+            stat.st_mtime_ns,
+            source,
+            hashlib.sha256(source).hexdigest(),
+        )
+
+        cached: Optional[Dict[str, Any]] = self._load(resolved_file)
+        if cached is not None and cached.get("key") == self._get_key(entry):
+            entry.data = cached.get("data")
+
+        return entry
+
+    def write(self, entry: "FileCache.Entry", data: Dict[str, Any]) -> None:
+        entry.data = data
+        content: str = json.dumps({"key": self._get_key(entry), "data": data})
+
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._prune()
+
+            descriptor, name = tempfile.mkstemp(
+                prefix=".", suffix=".tmp", dir=self._directory
+            )
+            with os.fdopen(descriptor, "w", encoding="UTF-8") as w:
+                w.write(content)
+
+            os.replace(name, self._get_cache_file(entry.file))
+
+        except OSError:
+            # the cache is an optimization only, so being unable to write it must not fail the operation
+            pass
+
+    def _prune(self) -> None:
+        if self._pruned:
+            return
+
+        self._pruned = True
+        oldest_mtime_ns: int = time.time_ns() - self._max_age_ns
+        with os.scandir(self._directory) as iterator:
+            for cache_file in iterator:
+                if not cache_file.name.endswith(FileCache.CACHE_FILE_SUFFIXES):
+                    continue
+
+                try:
+                    if cache_file.stat().st_mtime_ns < oldest_mtime_ns:
+                        os.remove(cache_file.path)
+
+                except OSError:
+                    # e.g. because another process removed the file already
+                    pass
+
+    def _load(self, file: Path) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self._get_cache_file(file).read_text(encoding="UTF-8"))
+
+        except (OSError, ValueError):
+            return None
+
+    def _get_key(self, entry: "FileCache.Entry") -> Dict[str, Any]:
+        return {
+            "version": FileCache.VERSION,
+            "path": str(entry.file),
+            "size": entry.size,
+            "mtime_ns": entry.mtime_ns,
+            "hash": entry.hash,
+        }
+
+    def _get_cache_file(self, file: Path) -> Path:
+        name: str = hashlib.sha256(str(file).encode("UTF-8")).hexdigest()
+        return Path(self._directory, f"{name}.json")
@@ -0,0 +1,84 @@
+from pathlib import Path
+from subprocess import Popen
+from threading import Lock
+from typing import Any, List, Optional
+
+from shell.shell import DefaultShell, Shell
+from shell.shell_response import ShellResponse
+from utility.type_utility import get_or_else
+
+
+# reads files of any revision through one long-lived 'git cat-file --batch' process, without touching the work tree
+class GitBlobReader:
+    def __init__(self, directory: Path, shell: Optional[Shell] = None):
+        self._directory: Path = directory
+        self._shell: Shell = get_or_else(shell, DefaultShell.new)
+
+        # the process is started on the first read, and requests of multiple threads must not interleave
+        self._repository: Optional[Path] = None
+        self._process: Optional[Popen] = None
+        self._lock: Lock = Lock()
+
+    def __enter__(self) -> "GitBlobReader":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def read(self, revision: str, file: Path) -> bytes:
+        with self._lock:
+            name: str = f"{revision}:{self._get_repository_path(file)}"
+            if "\n" in name:
+                raise AssertionError(
+                    f"Unable to read '{name}' from git: the name must not contain line breaks."
+                )
+
+            process: Popen = self._get_process()
+            process.stdin.write(f"{name}\n".encode("UTF-8"))
+            process.stdin.flush()
+
+            # the header is either '<object id> <type> <size>' or '<name> missing'
+            header: List[str] = process.stdout.readline().decode("UTF-8").split()
+            if len(header) != 3 or header[1] != "blob":
+                raise AssertionError(
+                    f"Unable to read '{name}' from git: {' '.join(header[1:]) or 'no response'}."
+                )
+
+            content: bytes = process.stdout.read(int(header[2]))
+            process.stdout.read(1)
+
+            return content
+
+    def close(self) -> None:
+        with self._lock:
+            if self._process is None:
+                return
+
+            self._process.stdin.close()
+            self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+
+    def _get_repository_path(self, file: Path) -> str:
+        # object names use paths relative to the root of the repository, with forward slashes
+        if self._repository is None:
+            response: ShellResponse = self._shell.run_or_raise(
+                "git", ["rev-parse", "--show-toplevel"], self._directory
+            )
+            self._repository = Path(response.get_stdout_lines()[0]).resolve()
+
+        resolved_file: Path = file.resolve()
+        if not resolved_file.is_relative_to(self._repository):
+            raise AssertionError(
+                f"Unable to read '{resolved_file}' from git: the file is not part of '{self._repository}'."
+            )
+
+        return resolved_file.relative_to(self._repository).as_posix()
+
+    def _get_process(self) -> Popen:
+        if self._process is None:
+            self._process = self._shell.start(
+                "git", ["cat-file", "--batch"], self._directory
+            )
+
+        return self._process
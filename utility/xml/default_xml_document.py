@@ -0,0 +1,40 @@
+from pathlib import Path
+from typing import Optional
+
+from utility.xml.e_tree_streaming_xml_document import ETreeStreamingXmlDocument
+from utility.xml.e_tree_xml_document import ETreeXmlDocument
+from utility.xml.xml_document import XmlDocument
+from utility.xml.xml_path import XmlPath
+
+try:
+    from utility.xml.lxml_xml_document import LxmlXmlDocument
+
+except ImportError:
+    # lxml is an optional dependency, which only speeds up reading documents
+    LxmlXmlDocument = None
+
+
+class DefaultXmlDocument:
+    @staticmethod
+    def parse(file: Path, source: Optional[bytes] = None) -> XmlDocument:
+        # writable documents always use the ETree backend, which patches changed texts into the original source. lxml
+        # re-serializes the root element, which changes line endings, empty elements, character references and quotes
+        return ETreeXmlDocument.parse(file, source)
+
+    @staticmethod
+    def parse_read_only(
+        file: Path, *kept_paths: XmlPath, source: Optional[bytes] = None
+    ) -> XmlDocument:
+        # lxml parses the whole document faster than the streaming parser prunes it, which only saves memory. without
+        # lxml, the streaming parser is both faster and much smaller than a whole ETree document
+        if DefaultXmlDocument.is_lxml_available():
+            return LxmlXmlDocument.parse(file, source, read_only=True)
+
+        return ETreeStreamingXmlDocument.parse(file, *kept_paths, source=source)
+
+    @staticmethod
+    def is_lxml_available() -> bool:
+        return LxmlXmlDocument is not None
+
+    def __init__(self):
+        raise AssertionError("This utility class must not be instantiated.")
@@ -0,0 +1,98 @@
+from typing import Any, Dict, List, Optional, Tuple
+from xml.etree.ElementTree import Comment, Element
+
+from utility.xml.xml_source_patcher import XmlSourcePatcher
+
+
+class ETreeSourcePatcher:
+    def __init__(self, source: bytes, root: Element):
+        self._patcher: XmlSourcePatcher = XmlSourcePatcher(source)
+        # a snapshot of all elements in document order, to find changed elements without parsing the source again.
+        # plain tuples of (element, tag, attributes, text, tail), because there is one per element of the document
+        self._snapshots: List[
+            Tuple[Element, Any, Dict[str, str], Optional[str], Optional[str]]
+        ] = [
+            (element, element.tag, element.attrib.copy(), element.text, element.tail)
+            for element in root.iter()
+        ]
+
+        # the last patched source with the patched texts by element index, until it is saved
+        self._patched: Optional[Tuple[bytes, List[Tuple[int, Optional[str]]]]] = None
+
+    def try_patch(self, root: Element) -> Optional[bytes]:
+        elements: List[Element] = list(root.iter())
+        if len(elements) != len(self._snapshots):
+            return None
+
+        changed_indices: List[int] = []
+        for index, (element, snapshot) in enumerate(zip(elements, self._snapshots)):
+            # unchanged elements are compared at once, because there is one per element of the document
+            if snapshot == (
+                element,
+                element.tag,
+                element.attrib,
+                element.text,
+                element.tail,
+            ):
+                continue
+
+            snapshot_element, tag, attributes, text, tail = snapshot
+            # only the text of leaf elements can be patched in place, every other change requires serializing the tree
+            if (
+                element is not snapshot_element
+                or element.tag != tag
+                or element.attrib != attributes
+                or not self._is_equal(element.tail, tail)
+            ):
+                return None
+
+            if self._is_equal(element.text, text):
+                continue
+
+            if element.tag is Comment or len(element) > 0:
+                return None
+
+            changed_indices.append(index)
+
+        if len(changed_indices) < 1:
+            self._patched = (self._patcher.source, [])
+            return self._patcher.source
+
+        starts: Optional[List[int]] = self._patcher.find_starts(changed_indices[-1])
+        if starts is None:
+            return None
+
+        changes: List[Tuple[int, Optional[str]]] = [
+            (starts[index], elements[index].text) for index in changed_indices
+        ]
+
+        patched_source: bytes = self._patcher.patch(changes)
+        self._patched = (
+            patched_source,
+            [(index, elements[index].text) for index in changed_indices],
+        )
+
+        return patched_source
+
+    def try_mark_saved(self, source: bytes) -> bool:
+        # a saved patched source only differs in the patched texts, so the snapshot is updated instead of taken again
+        if self._patched is None or self._patched[0] is not source:
+            return False
+
+        for index, text in self._patched[1]:
+            element, tag, attributes, _, tail = self._snapshots[index]
+            self._snapshots[index] = (element, tag, attributes, text, tail)
+
+        self._patcher = XmlSourcePatcher(source)
+        self._patched = None
+
+        return True
+
+    @staticmethod
+    def _is_equal(value: Optional[str], snapshot_value: Optional[str]) -> bool:
+        # 'None' and empty strings are serialized the same way
+        return (
+            value is snapshot_value
+            or value == snapshot_value
+            or (not value and not snapshot_value)
+        )
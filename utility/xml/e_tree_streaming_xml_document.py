@@ -0,0 +1,99 @@
+from pathlib import Path
+from typing import ClassVar, Dict, List, Optional
+from xml.etree.ElementTree import Element, ElementTree, TreeBuilder, XMLParser
+
+from utility.xml.e_tree_xml_document import ETreeXmlDocument
+from utility.xml.xml_node import XmlNode
+from utility.xml.xml_path import XmlPath
+
+
+# read-only document that only materializes the subtrees matching the given paths
+class ETreeStreamingXmlDocument(ETreeXmlDocument):
+    CHUNK_SIZE: ClassVar[int] = 64 * 1024
+
+    class _PruningTreeBuilder:
+        def __init__(self, kept_paths: List[XmlPath]):
+            self._delegate: TreeBuilder = TreeBuilder()
+            self._kept_paths: List[XmlPath] = kept_paths
+            # for every open element: the kept paths that are still matching, or None if it is kept entirely
+            self._states: List[Optional[List[XmlPath]]] = []
+            self._skipped_depth: int = 0
+
+        def start(self, tag: str, attributes: Dict[str, str]) -> None:
+            if self._skipped_depth > 0:
+                self._skipped_depth += 1
+                return
+
+            depth: int = len(self._states)
+            candidates: Optional[List[XmlPath]] = (
+                self._states[-1] if depth > 0 else self._kept_paths
+            )
+
+            if candidates is not None:
+                name: str = tag.rpartition("}")[2]
+                candidates = [
+                    candidate
+                    for candidate in candidates
+                    if candidate.segments[depth] in (XmlPath.WILDCARD, name)
+                ]
+
+                # the root element is always kept, so that the document is never empty
+                if len(candidates) < 1 and depth > 0:
+                    self._skipped_depth = 1
+                    return
+
+                if any(len(c.segments) == depth + 1 for c in candidates):
+                    candidates = None
+
+            self._states.append(candidates)
+            self._delegate.start(tag, attributes)
+
+        def end(self, tag: str) -> None:
+            if self._skipped_depth > 0:
+                self._skipped_depth -= 1
+                return
+
+            self._states.pop()
+            self._delegate.end(tag)
+
+        def data(self, data: str) -> None:
+            if self._skipped_depth > 0:
+                return
+
+            self._delegate.data(data)
+
+        def close(self) -> Element:
+            return self._delegate.close()
+
+    @staticmethod
+    def parse(
+        file: Path, *kept_paths: XmlPath, source: Optional[bytes] = None
+    ) -> "ETreeStreamingXmlDocument":
+        for kept_path in kept_paths:
+            if kept_path.is_empty() or XmlPath.DESCENDANTS in kept_path.segments:
+                raise AssertionError(
+                    f"Streaming XML documents require non-empty paths without '{XmlPath.DESCENDANTS}', "
+                    f"but got '{kept_path}'."
+                )
+
+        parser: XMLParser = XMLParser(
+            target=ETreeStreamingXmlDocument._PruningTreeBuilder(list(kept_paths))
+        )
+        if source is not None:
+            parser.feed(source)
+
+        else:
+            with file.open("rb") as r:
+                while chunk := r.read(ETreeStreamingXmlDocument.CHUNK_SIZE):
+                    parser.feed(chunk)
+
+        return ETreeStreamingXmlDocument(ElementTree(parser.close()))
+
+    def find_element_indices(self, nodes: List[XmlNode]) -> Optional[List[int]]:
+        # skipped elements are missing in the tree, so the positions do not match the source
+        return None
+
+    def serialize(self) -> bytes:
+        raise AssertionError(
+            "Unable to serialize the document: streaming XML documents are read-only."
+        )
@@ -1,69 +1,59 @@
 from pathlib import Path
-from typing import List, Optional
-from xml.etree.ElementTree import ElementTree
+from typing import Optional
+from xml.etree.ElementTree import Element, ElementTree, TreeBuilder, XMLParser
 
+from utility.type_utility import get_or_else
+from utility.xml.e_tree_source_patcher import ETreeSourcePatcher
 from utility.xml.e_tree_xml_node import ETreeXmlNode
-from utility.xml.xml_document import XmlDocument
-from utility.xml.xml_node import XmlNode
-
-
-class ETreeXmlDocument(XmlDocument):
-    def __init__(self, element_tree: ElementTree):
-        self._delegate: ElementTree = element_tree
-
-    def find_first_node(self, *path_segments: str) -> Optional[XmlNode]:
-        maybe_root: Optional[XmlNode] = self._try_get_root_node()
-        if maybe_root is None:
-            return None
-
-        if len(path_segments) < 1:
-            return None
-
-        if maybe_root.name != path_segments[0]:
-            return None
-
-        return maybe_root.find_first_node(*path_segments[1:])
-
-    def find_all_nodes(self, *path_segments: str) -> List[XmlNode]:
-        maybe_root: Optional[XmlNode] = self._try_get_root_node()
-        if maybe_root is None:
-            return []
-
-        if len(path_segments) < 1:
-            return []
-
-        if maybe_root.name != path_segments[0]:
-            return []
-
-        return maybe_root.find_all_nodes(*path_segments)
-
-    def save(self, file: Path) -> None:
-        namespace: str = self._get_default_namespace()
-        self._delegate.write(
-            file, encoding="UTF-8", xml_declaration=True, default_namespace=namespace
+from utility.xml.e_tree_xml_serializer import ETreeXmlSerializer
+from utility.xml.element_xml_document import ElementXmlDocument
+from utility.xml.element_xml_node import ElementXmlNode
+
+
+class ETreeXmlDocument(ElementXmlDocument):
+    @staticmethod
+    def parse(file: Path, source: Optional[bytes] = None) -> "ETreeXmlDocument":
+        source = get_or_else(source, file.read_bytes)
+
+        parser: XMLParser = XMLParser(target=TreeBuilder(insert_comments=True))
+        parser.feed(source)
+
+        return ETreeXmlDocument(ElementTree(parser.close()), source, file)
+
+    def __init__(
+        self,
+        element_tree: ElementTree,
+        source: Optional[bytes] = None,
+        file: Optional[Path] = None,
+    ):
+        super().__init__(element_tree, file)
+
+        # the original source allows saving changes without re-serializing the entire tree
+        self._source_patcher: Optional[ETreeSourcePatcher] = (
+            ETreeSourcePatcher(source, element_tree.getroot())
+            if source is not None
+            else None
         )
 
-        self._replace_quotes_with_double_quotes(file)
-
-    def _get_default_namespace(self) -> str:
-        maybe_root: Optional[XmlNode] = self._try_get_root_node()
-        if maybe_root is None:
-            return ""
-
-        return maybe_root.namespace
+    def serialize(self) -> bytes:
+        if self._source_patcher is not None:
+            patched_source: Optional[bytes] = self._source_patcher.try_patch(
+                self._delegate.getroot()
+            )
+            if patched_source is not None:
+                return patched_source
 
-    def _try_get_root_node(self) -> Optional[XmlNode]:
-        return ETreeXmlNode.try_create(self._delegate.getroot())
+        return ETreeXmlSerializer(self._delegate.getroot()).serialize()
 
-    def _replace_quotes_with_double_quotes(self, file: Path) -> None:
-        content: str = ""
-        with file.open("r") as r:
-            for line in r:
-                if line.strip().startswith("<!--"):
-                    content += line
+    def mark_saved(self, file: Path, content: bytes) -> None:
+        if self._source_patcher is None or not self._source_patcher.try_mark_saved(
+            content
+        ):
+            self._source_patcher = ETreeSourcePatcher(content, self._delegate.getroot())
 
-                else:
-                    content += line.replace("'", '"')
+        super().mark_saved(file, content)
 
-        with file.open("w") as w:
-            w.write(content)
+    def _try_create_root_node(
+        self, root: Optional[Element], context: ElementXmlNode.Context
+    ) -> Optional[ElementXmlNode]:
+        return ETreeXmlNode.try_create(root, context)
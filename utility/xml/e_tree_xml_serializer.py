@@ -0,0 +1,156 @@
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Comment, Element, ProcessingInstruction
+
+
+class ETreeXmlSerializer:
+    XML_DECLARATION: ClassVar[str] = '<?xml version="1.0" encoding="UTF-8"?>\n'
+    ATTRIBUTE_ENTITIES: ClassVar[Dict[str, str]] = {
+        '"': "&quot;",
+        "\n": "&#10;",
+        "\r": "&#13;",
+        "\t": "&#09;",
+    }
+
+    def __init__(self, root: Element):
+        self._root: Element = root
+        self._default_namespace: str = ETreeXmlSerializer._split_name(root.tag)[0]
+        self._prefixes: Dict[str, str] = {}
+        self._names: Dict[str, str] = {}
+
+    def serialize(self) -> bytes:
+        parts: List[str] = [ETreeXmlSerializer.XML_DECLARATION]
+        write: Callable[[str], None] = parts.append
+
+        write(f"<{self._get_name(self._root.tag, False)}")
+        self._serialize_namespaces(write)
+        self._serialize_content(self._root, write)
+
+        return "".join(parts).encode("UTF-8")
+
+    def _serialize_element(
+        self, element: Element, write: Callable[[str], None]
+    ) -> None:
+        tag: Any = element.tag
+        if tag is Comment:
+            write(f"<!--{element.text}-->")
+
+        elif tag is ProcessingInstruction:
+            write(f"<?{element.text}?>")
+
+        else:
+            name: Optional[str] = self._names.get(tag)
+            write(f"<{name if name is not None else self._get_name(tag, False)}")
+
+            if tag[0] != "{" and self._default_namespace:
+                # an unqualified element must not inherit the default namespace of the root
+                write(' xmlns=""')
+
+            self._serialize_content(element, write)
+
+        tail: Optional[str] = element.tail
+        if tail:
+            write(ETreeXmlSerializer._escape_text(tail))
+
+    def _serialize_content(
+        self, element: Element, write: Callable[[str], None]
+    ) -> None:
+        if element.attrib:
+            for key, value in element.items():
+                write(
+                    f' {self._get_name(key, True)}="{ETreeXmlSerializer._escape_attribute(value)}"'
+                )
+
+        text: Optional[str] = element.text
+        if not text and len(element) < 1:
+            write(" />")
+            return
+
+        write(">")
+        if text:
+            write(ETreeXmlSerializer._escape_text(text))
+
+        for child in element:
+            self._serialize_element(child, write)
+
+        write(f"</{self._names[element.tag]}>")
+
+    @staticmethod
+    def _escape_text(text: str) -> str:
+        if "&" in text:
+            text = text.replace("&", "&amp;")
+
+        if "<" in text:
+            text = text.replace("<", "&lt;")
+
+        if ">" in text:
+            text = text.replace(">", "&gt;")
+
+        return text
+
+    @staticmethod
+    def _escape_attribute(value: str) -> str:
+        value = ETreeXmlSerializer._escape_text(value)
+        for character, entity in ETreeXmlSerializer.ATTRIBUTE_ENTITIES.items():
+            if character in value:
+                value = value.replace(character, entity)
+
+        return value
+
+    def _serialize_namespaces(self, write: Callable[[str], None]) -> None:
+        for element in self._root.iter():
+            if isinstance(element.tag, str):
+                self._get_name(element.tag, False)
+
+            for key in element.keys():
+                self._get_name(key, True)
+
+        if self._default_namespace:
+            write(f' xmlns="{self._escape_attribute(self._default_namespace)}"')
+
+        for namespace, prefix in sorted(self._prefixes.items(), key=lambda x: x[1]):
+            if prefix == "xml":
+                # the 'xml' prefix is bound by definition and must not be declared
+                continue
+
+            write(f' xmlns:{prefix}="{self._escape_attribute(namespace)}"')
+
+    def _get_name(self, tag: str, is_attribute: bool) -> str:
+        cache_key: str = f"@{tag}" if is_attribute else tag
+        name: Optional[str] = self._names.get(cache_key)
+        if name is not None:
+            return name
+
+        namespace, local_name = ETreeXmlSerializer._split_name(tag)
+        if not namespace:
+            name = local_name
+
+        elif namespace == self._default_namespace and not is_attribute:
+            # unprefixed attributes never belong to the default namespace, so they always need a prefix
+            name = local_name
+
+        else:
+            name = f"{self._get_prefix(namespace)}:{local_name}"
+
+        self._names[cache_key] = name
+        return name
+
+    def _get_prefix(self, namespace: str) -> str:
+        prefix: Optional[str] = self._prefixes.get(namespace)
+        if prefix is not None:
+            return prefix
+
+        prefix = ElementTree._namespace_map.get(namespace)
+        if prefix is None or prefix in self._prefixes.values():
+            prefix = f"ns{len(self._prefixes)}"
+
+        self._prefixes[namespace] = prefix
+        return prefix
+
+    @staticmethod
+    def _split_name(tag: str) -> Tuple[str, str]:
+        if not tag.startswith("{"):
+            return "", tag
+
+        namespace, _, local_name = tag[1:].partition("}")
+        return namespace, local_name
@@ -0,0 +1,117 @@
+from abc import abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utility.xml.element_xml_node import ElementXmlNode
+from utility.xml.xml_change_journal import XmlChangeJournal
+from utility.xml.xml_document import XmlDocument
+from utility.xml.xml_node import XmlNode
+from utility.xml.xml_path import XmlPath
+
+
+class ElementXmlDocument(XmlDocument):
+    # the common document of ElementTree and lxml element trees, which share the same tree API
+    def __init__(self, element_tree: Any, file: Optional[Path] = None):
+        self._delegate: Any = element_tree
+        self._root: Optional[ElementXmlNode] = None
+        self._node_context: ElementXmlNode.Context = ElementXmlNode.Context()
+
+        # the file that contains the current state of the document, if any
+        self._file: Optional[Path] = file.resolve() if file is not None else None
+
+    def find_first_node(self, *path_segments: str) -> Optional[XmlNode]:
+        maybe_root: Optional[XmlNode] = self._try_get_root_node()
+        if maybe_root is None:
+            return None
+
+        if len(path_segments) < 1:
+            return None
+
+        if maybe_root.name != path_segments[0]:
+            return None
+
+        return maybe_root.find_first_node(*path_segments[1:])
+
+    def find_all_nodes(self, *path_segments: str) -> List[XmlNode]:
+        maybe_root: Optional[XmlNode] = self._try_get_root_node()
+        if maybe_root is None:
+            return []
+
+        if len(path_segments) < 1:
+            return []
+
+        if maybe_root.name != path_segments[0]:
+            return []
+
+        return maybe_root.find_all_nodes(*path_segments[1:])
+
+    def query_first_node(self, path: XmlPath) -> Optional[XmlNode]:
+        maybe_root: Optional[XmlNode] = self._try_get_root_node()
+        if maybe_root is None:
+            return None
+
+        if path.segments[:1] == (XmlPath.DESCENDANTS,):
+            return maybe_root.query_first_node(path)
+
+        if not path.matches_first_segment(maybe_root.name, maybe_root.namespace):
+            return None
+
+        return maybe_root.query_first_node(path.tail())
+
+    def query_all_nodes(self, path: XmlPath) -> List[XmlNode]:
+        maybe_root: Optional[XmlNode] = self._try_get_root_node()
+        if maybe_root is None:
+            return []
+
+        if path.segments[:1] == (XmlPath.DESCENDANTS,):
+            return maybe_root.query_all_nodes(path)
+
+        if not path.matches_first_segment(maybe_root.name, maybe_root.namespace):
+            return []
+
+        return maybe_root.query_all_nodes(path.tail())
+
+    def find_element_indices(self, nodes: List[XmlNode]) -> Optional[List[int]]:
+        root: Optional[Any] = self._delegate.getroot()
+        if root is None:
+            return None
+
+        indices: Dict[Any, int] = {}
+        for element in root.iter():
+            if ElementXmlNode.is_element(element):
+                indices[element] = len(indices)
+
+        result: List[int] = []
+        for node in nodes:
+            if not isinstance(node, ElementXmlNode) or node.delegate not in indices:
+                return None
+
+            result.append(indices[node.delegate])
+
+        return result
+
+    def _get_changed_nodes(self) -> List[XmlNode]:
+        return self._node_context.journal.changed_nodes
+
+    def _get_change_journal(self) -> XmlChangeJournal:
+        return self._node_context.journal
+
+    def requires_save(self, file: Path) -> bool:
+        return self.is_dirty or file.resolve() != self._file
+
+    def mark_saved(self, file: Path, content: bytes) -> None:
+        self._file = file.resolve()
+        self._node_context.journal.clear()
+
+    def _try_get_root_node(self) -> Optional[XmlNode]:
+        root: Optional[Any] = self._delegate.getroot()
+        if self._root is None or self._root.delegate is not root:
+            self._root = self._try_create_root_node(root, self._node_context)
+
+        return self._root
+
+    @abstractmethod
+    def _try_create_root_node(
+        self, root: Optional[Any], context: ElementXmlNode.Context
+    ) -> Optional[ElementXmlNode]:
+        raise NotImplementedError
@@ -0,0 +1,176 @@
+from abc import abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple
+
+from utility.type_utility import get_or_else, without_nones
+from utility.xml.xml_change_journal import XmlChangeJournal
+from utility.xml.xml_node import XmlNode
+from utility.xml.xml_path import XmlPath
+
+
+class ElementXmlNode(XmlNode):
+    # the common wrapper of ElementTree and lxml elements, which share the same element API.
+    # nodes are created for every element of every POM, so they must not carry a per-instance dictionary
+    __slots__ = (
+        "_delegate",
+        "_context",
+        "_qualified_name",
+        "_children",
+        "_nodes",
+        "_nodes_by_name",
+    )
+
+    # leaves are the majority of all nodes, so they share the same (never modified) empty collections
+    NO_CHILDREN: ClassVar[List[Any]] = []
+    NO_NODES: ClassVar[List["ElementXmlNode"]] = []
+    NO_NODES_BY_NAME: ClassVar[Dict[str, List["ElementXmlNode"]]] = {}
+
+    @dataclass
+    class Context:
+        # all nodes of one tree share a context, so that every element is wrapped exactly once
+        registry: Dict[Any, "ElementXmlNode"] = field(default_factory=dict)
+        journal: XmlChangeJournal = field(default_factory=XmlChangeJournal)
+
+    @staticmethod
+    def is_element(delegate: Optional[Any]) -> bool:
+        # comments, processing instructions and entities use factory functions as tag
+        return delegate is not None and isinstance(delegate.tag, str)
+
+    def __init__(
+        self, delegate: Any, context: Optional["ElementXmlNode.Context"] = None
+    ):
+        self._delegate: Any = delegate
+        self._context: ElementXmlNode.Context = get_or_else(
+            context, ElementXmlNode.Context
+        )
+        self._context.registry[delegate] = self
+
+        # the tag is only split into name and namespace once they are needed
+        self._qualified_name: Optional[Tuple[str, str]] = None
+
+        # the child wrappers are built once and only rebuilt if the children of the delegate change
+        self._children: Optional[List[Any]] = None
+        self._nodes: List[ElementXmlNode] = ElementXmlNode.NO_NODES
+        self._nodes_by_name: Dict[
+            str, List[ElementXmlNode]
+        ] = ElementXmlNode.NO_NODES_BY_NAME
+
+    @property
+    def name(self) -> str:
+        return self._get_qualified_name()[1]
+
+    @property
+    def namespace(self) -> str:
+        return self._get_qualified_name()[0]
+
+    def _get_qualified_name(self) -> Tuple[str, str]:
+        if self._qualified_name is None:
+            self._qualified_name = XmlNode._split_qualified_name(self._delegate.tag)
+
+        return self._qualified_name
+
+    @property
+    def delegate(self) -> Any:
+        return self._delegate
+
+    def _get_text(self) -> Optional[str]:
+        return self._delegate.text
+
+    def _set_text(self, text: str) -> None:
+        self._delegate.text = text
+
+    def _on_text_changed(self, previous_text: Optional[str]) -> None:
+        self._context.journal.record(self, previous_text)
+
+    def _get_nodes(self) -> List["XmlNode"]:
+        self._update_nodes()
+        return list(self._nodes)
+
+    def _get_nodes_by_name(self, name: str) -> List["ElementXmlNode"]:
+        self._update_nodes()
+        return self._nodes_by_name.get(name, [])
+
+    def _update_nodes(self) -> None:
+        if len(self._delegate) < 1:
+            self._children = ElementXmlNode.NO_CHILDREN
+            self._nodes = ElementXmlNode.NO_NODES
+            self._nodes_by_name = ElementXmlNode.NO_NODES_BY_NAME
+            return
+
+        # the wrappers are only kept while the children are the same elements in the same order. elements are only
+        # equal to themselves, so comparing the lists is a C-level identity check, much cheaper than wrapping again
+        children: List[Any] = self._delegate[:]
+        if children == self._children:
+            return
+
+        self._children = children
+        self._nodes = []
+        self._nodes_by_name = {}
+
+        for child in children:
+            node: Optional[ElementXmlNode] = self._wrap(child)
+            if node is None:
+                continue
+
+            self._nodes.append(node)
+            self._nodes_by_name.setdefault(node.name, []).append(node)
+
+    def _wrap(self, element: Any) -> Optional["ElementXmlNode"]:
+        node: Optional[ElementXmlNode] = self._context.registry.get(element)
+        if node is not None:
+            return node
+
+        if not ElementXmlNode.is_element(element):
+            return None
+
+        return self._create_node(element, self._context)
+
+    @abstractmethod
+    def _create_node(
+        self, element: Any, context: "ElementXmlNode.Context"
+    ) -> "ElementXmlNode":
+        raise NotImplementedError
+
+    def find_first_node(self, *path_segments: str) -> Optional["XmlNode"]:
+        node: ElementXmlNode = self
+        for path_segment in path_segments:
+            matching_nodes: List[ElementXmlNode] = node._get_nodes_by_name(path_segment)
+            if len(matching_nodes) < 1:
+                return None
+
+            node = matching_nodes[0]
+
+        return node
+
+    def find_all_nodes(self, *path_segments: str) -> List["XmlNode"]:
+        if len(path_segments) < 1:
+            return [self]
+
+        result: List[XmlNode] = []
+        for matching_node in self._get_nodes_by_name(path_segments[0]):
+            result.extend(matching_node.find_all_nodes(*path_segments[1:]))
+
+        return result
+
+    def query_first_node(self, path: XmlPath) -> Optional["XmlNode"]:
+        if path.is_empty():
+            return self
+
+        for element in self._iter_matching_elements(path):
+            node: Optional[ElementXmlNode] = self._wrap(element)
+            if node is not None:
+                return node
+
+        return None
+
+    def query_all_nodes(self, path: XmlPath) -> List["XmlNode"]:
+        if path.is_empty():
+            return [self]
+
+        return without_nones(
+            [self._wrap(element) for element in self._iter_matching_elements(path)]
+        )
+
+    @abstractmethod
+    def _iter_matching_elements(self, path: XmlPath) -> Iterator[Any]:
+        raise NotImplementedError
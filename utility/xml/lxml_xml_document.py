@@ -0,0 +1,118 @@
+from pathlib import Path
+from typing import ClassVar, Optional
+
+from lxml import etree
+
+from utility.type_utility import get_or_else
+from utility.xml.element_xml_document import ElementXmlDocument
+from utility.xml.element_xml_node import ElementXmlNode
+from utility.xml.lxml_xml_node import LxmlXmlNode
+
+
+class LxmlXmlDocument(ElementXmlDocument):
+    XML_DECLARATION: ClassVar[bytes] = b'<?xml version="1.0" encoding="UTF-8"?>\n'
+
+    @staticmethod
+    def parse(
+        file: Path, source: Optional[bytes] = None, read_only: bool = False
+    ) -> "LxmlXmlDocument":
+        source = get_or_else(source, file.read_bytes)
+
+        # CDATA sections and entity references are kept, so that they are serialized as written
+        parser: etree.XMLParser = etree.XMLParser(
+            remove_blank_text=False,
+            remove_comments=False,
+            strip_cdata=False,
+            resolve_entities=False,
+        )
+        root: etree._Element = etree.fromstring(source, parser)
+
+        return LxmlXmlDocument(etree.ElementTree(root), source, file, read_only)
+
+    def __init__(
+        self,
+        element_tree: etree._ElementTree,
+        source: Optional[bytes] = None,
+        file: Optional[Path] = None,
+        read_only: bool = False,
+    ):
+        super().__init__(element_tree, file)
+        self._encoding: str = get_or_else(element_tree.docinfo.encoding, "UTF-8")
+        self._read_only: bool = read_only
+
+        # everything around the root element is kept as written, because lxml does not preserve its whitespace
+        self._prolog: Optional[bytes] = None
+        self._epilog: Optional[bytes] = None
+        if source is not None:
+            self._split_source(source)
+
+    def requires_save(self, file: Path) -> bool:
+        # read-only documents always fail to save, even if nothing changed
+        return self._read_only or super().requires_save(file)
+
+    def serialize(self) -> bytes:
+        if self._read_only:
+            raise AssertionError(
+                "Unable to serialize the document: the document is read-only."
+            )
+
+        if self._prolog is None or self._epilog is None:
+            return LxmlXmlDocument.XML_DECLARATION + etree.tostring(
+                self._delegate, encoding="UTF-8", xml_declaration=False
+            )
+
+        root: bytes = etree.tostring(
+            self._delegate.getroot(),
+            encoding=self._encoding,
+            xml_declaration=False,
+            with_tail=False,
+        )
+
+        return b"".join([self._prolog, root, self._epilog])
+
+    def mark_saved(self, file: Path, content: bytes) -> None:
+        self._split_source(content)
+        super().mark_saved(file, content)
+
+    def _split_source(self, source: bytes) -> None:
+        start: int = 0
+        while True:
+            start = source.index(b"<", start)
+            if source.startswith(b"<?", start):
+                start = source.index(b"?>", start) + 2
+
+            elif source.startswith(b"<!--", start):
+                start = source.index(b"-->", start) + 3
+
+            elif source.startswith(b"<!DOCTYPE", start):
+                internal_subset: int = source.find(b"[", start)
+                doctype_end: int = source.index(b">", start)
+                if 0 <= internal_subset < doctype_end:
+                    doctype_end = source.index(b"]", internal_subset)
+                    doctype_end = source.index(b">", doctype_end)
+
+                start = doctype_end + 1
+
+            else:
+                break
+
+        end: int = len(source)
+        while True:
+            content: bytes = source[:end].rstrip()
+            if content.endswith(b"-->"):
+                end = content.rindex(b"<!--")
+
+            elif content.endswith(b"?>"):
+                end = content.rindex(b"<?")
+
+            else:
+                end = len(content)
+                break
+
+        self._prolog = source[:start]
+        self._epilog = source[end:]
+
+    def _try_create_root_node(
+        self, root: Optional[etree._Element], context: ElementXmlNode.Context
+    ) -> Optional[ElementXmlNode]:
+        return LxmlXmlNode.try_create(root, context)
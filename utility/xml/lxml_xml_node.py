@@ -0,0 +1,77 @@
+from functools import lru_cache
+from typing import ClassVar, Iterator, List, Optional
+
+from lxml import etree
+
+from utility.xml.element_xml_node import ElementXmlNode
+from utility.xml.xml_path import XmlPath
+
+
+class LxmlXmlNode(ElementXmlNode):
+    __slots__ = ()
+
+    NAMESPACE_PREFIX: ClassVar[str] = "n"
+
+    @staticmethod
+    def try_create(
+        delegate: Optional[etree._Element],
+        context: Optional[ElementXmlNode.Context] = None,
+    ) -> Optional["LxmlXmlNode"]:
+        if not ElementXmlNode.is_element(delegate):
+            return None
+
+        return LxmlXmlNode(delegate, context)
+
+    @property
+    def delegate(self) -> etree._Element:
+        return self._delegate
+
+    def _create_node(
+        self, element: etree._Element, context: ElementXmlNode.Context
+    ) -> "LxmlXmlNode":
+        return LxmlXmlNode(element, context)
+
+    def _iter_matching_elements(self, path: XmlPath) -> Iterator[etree._Element]:
+        return iter(LxmlXmlNode._compile(path)(self._delegate))
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _compile(path: XmlPath) -> etree.XPath:
+        if path.namespace is not None:
+            return etree.XPath(
+                LxmlXmlNode._to_xpath(path),
+                namespaces={LxmlXmlNode.NAMESPACE_PREFIX: path.namespace},
+            )
+
+        return etree.XPath(LxmlXmlNode._to_xpath(path))
+
+    @staticmethod
+    def _to_xpath(path: XmlPath) -> str:
+        parts: List[str] = []
+        descendants: bool = False
+        for path_segment in path.segments:
+            if path_segment == XmlPath.DESCENDANTS:
+                descendants = True
+                continue
+
+            step: str = LxmlXmlNode._to_xpath_step(path_segment, path.namespace)
+            if descendants:
+                parts.append(f"/{step}" if len(parts) > 0 else f".//{step}")
+
+            else:
+                parts.append(step)
+
+            descendants = False
+
+        return "/".join(parts)
+
+    @staticmethod
+    def _to_xpath_step(path_segment: str, namespace: Optional[str]) -> str:
+        if namespace is not None:
+            return f"{LxmlXmlNode.NAMESPACE_PREFIX}:{path_segment}"
+
+        if path_segment == XmlPath.WILDCARD:
+            return "*"
+
+        # unqualified names match any namespace, just like the element path of the ETree backend
+        return f"*[local-name()='{path_segment}']"
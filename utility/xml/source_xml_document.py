@@ -0,0 +1,91 @@
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from utility.xml.source_xml_node import SourceXmlNode
+from utility.xml.xml_change_journal import XmlChangeJournal
+from utility.xml.xml_document import XmlDocument
+from utility.xml.xml_node import XmlNode
+from utility.xml.xml_path import XmlPath
+from utility.xml.xml_source_patcher import XmlSourcePatcher
+
+
+# document that only knows some leaf nodes by their position, so that changes are saved without parsing the source
+class SourceXmlDocument(XmlDocument):
+    def __init__(self, source: bytes, file: Path):
+        self._patcher: XmlSourcePatcher = XmlSourcePatcher(source)
+        self._file: Path = file.resolve()
+        self._nodes: List[SourceXmlNode] = []
+        self._node_context: SourceXmlNode.Context = SourceXmlNode.Context()
+
+    def create_node(
+        self, name: str, namespace: str, text: Optional[str], index: int, start: int
+    ) -> SourceXmlNode:
+        node: SourceXmlNode = SourceXmlNode(
+            name, namespace, text, index, start, self._node_context
+        )
+        self._nodes.append(node)
+
+        return node
+
+    def find_first_node(self, *path_segments: str) -> Optional[XmlNode]:
+        raise self._create_missing_tree_error()
+
+    def find_all_nodes(self, *path_segments: str) -> List[XmlNode]:
+        raise self._create_missing_tree_error()
+
+    def query_first_node(self, path: XmlPath) -> Optional[XmlNode]:
+        raise self._create_missing_tree_error()
+
+    def query_all_nodes(self, path: XmlPath) -> List[XmlNode]:
+        raise self._create_missing_tree_error()
+
+    def _create_missing_tree_error(self) -> Exception:
+        return AssertionError(
+            f"Unable to search '{self._file}': source XML documents only know the nodes they were created with."
+        )
+
+    def find_element_indices(self, nodes: List[XmlNode]) -> Optional[List[int]]:
+        result: List[int] = []
+        for node in nodes:
+            if not isinstance(node, SourceXmlNode):
+                return None
+
+            result.append(node.index)
+
+        return result
+
+    def _get_changed_nodes(self) -> List[XmlNode]:
+        return self._node_context.journal.changed_nodes
+
+    def _get_change_journal(self) -> XmlChangeJournal:
+        return self._node_context.journal
+
+    def requires_save(self, file: Path) -> bool:
+        return self.is_dirty or file.resolve() != self._file
+
+    def serialize(self) -> bytes:
+        changes: List[Tuple[int, Optional[str]]] = [
+            (node.start, node.text)
+            for node in self.changed_nodes
+            if isinstance(node, SourceXmlNode)
+        ]
+
+        return self._patcher.patch(changes)
+
+    def mark_saved(self, file: Path, content: bytes) -> None:
+        self._patcher = XmlSourcePatcher(content)
+        self._file = file.resolve()
+        self._node_context.journal.clear()
+
+        if len(self._nodes) < 1:
+            return
+
+        # patched texts shift all following elements, so the start bytes have to be searched again
+        starts: Optional[List[int]] = self._patcher.find_starts(
+            max([node.index for node in self._nodes]), include_comments=False
+        )
+        if starts is None:
+            raise AssertionError(f"Unable to find the saved nodes in '{self._file}'.")
+
+        for node in self._nodes:
+            node.start = starts[node.index]
@@ -0,0 +1,80 @@
+import sys
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from utility.type_utility import get_or_else
+from utility.xml.xml_change_journal import XmlChangeJournal
+from utility.xml.xml_node import XmlNode
+
+
+# leaf node that is only known by its position in the source, without the surrounding XML tree
+class SourceXmlNode(XmlNode):
+    __slots__ = ("_context", "_name", "_namespace", "_text", "_index", "_start")
+
+    @dataclass
+    class Context:
+        journal: XmlChangeJournal = field(default_factory=XmlChangeJournal)
+
+    def __init__(
+        self,
+        name: str,
+        namespace: str,
+        text: Optional[str],
+        index: int,
+        start: int,
+        context: Optional["SourceXmlNode.Context"] = None,
+    ):
+        self._context: SourceXmlNode.Context = get_or_else(
+            context, SourceXmlNode.Context
+        )
+        self._name: str = sys.intern(name)
+        self._namespace: str = sys.intern(namespace)
+        self._text: Optional[str] = text
+
+        # the position among all elements in document order and the first byte of the start tag
+        self._index: int = index
+        self._start: int = start
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def namespace(self) -> str:
+        return self._namespace
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def start(self) -> int:
+        return self._start
+
+    @start.setter
+    def start(self, start: int) -> None:
+        self._start = start
+
+    def _get_text(self) -> Optional[str]:
+        return self._text
+
+    def _set_text(self, text: str) -> None:
+        self._text = text
+
+    def _on_text_changed(self, previous_text: Optional[str]) -> None:
+        self._context.journal.record(self, previous_text)
+
+    def _get_nodes(self) -> List["XmlNode"]:
+        return []
+
+    def find_first_node(self, *path_segments: str) -> Optional["XmlNode"]:
+        if len(path_segments) > 0:
+            return None
+
+        return self
+
+    def find_all_nodes(self, *path_segments: str) -> List["XmlNode"]:
+        if len(path_segments) > 0:
+            return []
+
+        return [self]
@@ -0,0 +1,147 @@
+import os
+import platform
+import shutil
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utility.xml.xml_document import XmlDocument
+
+
+class XmlBatchWriter:
+    @dataclass
+    class Entry:
+        document: XmlDocument
+        file: Path
+        content: Optional[bytes] = None
+        temporary_file: Optional[Path] = None
+        backup_file: Optional[Path] = None
+        is_committed: bool = False
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers: Optional[int] = max_workers
+        self._entries: Dict[Path, XmlBatchWriter.Entry] = {}
+
+    def add(self, document: XmlDocument, file: Path) -> None:
+        resolved_file: Path = file.resolve()
+        existing_entry: Optional[XmlBatchWriter.Entry] = self._entries.get(
+            resolved_file
+        )
+        if existing_entry is not None and existing_entry.document is not document:
+            raise AssertionError(
+                f"Unable to write multiple documents to '{resolved_file}'."
+            )
+
+        if document.requires_save(resolved_file):
+            self._entries[resolved_file] = XmlBatchWriter.Entry(document, resolved_file)
+
+    def commit(self) -> List[Path]:
+        # all documents are serialized and written to temporary files first, so that the target files are only
+        # replaced once every document has been written successfully
+        entries: List[XmlBatchWriter.Entry] = list(self._entries.values())
+        self._entries = {}
+
+        if len(entries) < 1:
+            return []
+
+        file_mode: int = XmlBatchWriter._get_default_file_mode()
+        try:
+            with ThreadPoolExecutor(self._max_workers) as executor:
+                futures: List[Future] = [
+                    executor.submit(self._write_temporary_file, entry, file_mode)
+                    for entry in entries
+                ]
+                for future in futures:
+                    future.result()
+
+            for entry in entries:
+                self._replace_file(entry)
+
+        except BaseException:
+            self._rollback(entries)
+            raise
+
+        self._sync_directories(entries)
+
+        for entry in entries:
+            if entry.backup_file is not None:
+                entry.backup_file.unlink(missing_ok=True)
+
+            entry.document.mark_saved(entry.file, entry.content)
+
+        return [entry.file for entry in entries]
+
+    def _write_temporary_file(
+        self, entry: "XmlBatchWriter.Entry", file_mode: int
+    ) -> None:
+        entry.content = entry.document.serialize()
+
+        descriptor, name = tempfile.mkstemp(
+            prefix=f".{entry.file.name}.", suffix=".tmp", dir=entry.file.parent
+        )
+        entry.temporary_file = Path(name)
+
+        with os.fdopen(descriptor, "wb") as w:
+            w.write(entry.content)
+            w.flush()
+            os.fsync(w.fileno())
+
+        if entry.file.exists():
+            shutil.copymode(entry.file, entry.temporary_file)
+
+        else:
+            os.chmod(entry.temporary_file, file_mode)
+
+    def _replace_file(self, entry: "XmlBatchWriter.Entry") -> None:
+        if entry.file.exists():
+            entry.backup_file = Path(
+                entry.file.parent, f".{entry.file.name}.{os.getpid()}.bak"
+            )
+            try:
+                os.link(entry.file, entry.backup_file)
+
+            except OSError:
+                shutil.copy2(entry.file, entry.backup_file)
+
+        os.replace(entry.temporary_file, entry.file)
+        entry.temporary_file = None
+        entry.is_committed = True
+
+    def _rollback(self, entries: List["XmlBatchWriter.Entry"]) -> None:
+        for entry in entries:
+            if entry.temporary_file is not None:
+                entry.temporary_file.unlink(missing_ok=True)
+
+            if not entry.is_committed:
+                if entry.backup_file is not None:
+                    entry.backup_file.unlink(missing_ok=True)
+
+                continue
+
+            if entry.backup_file is not None:
+                os.replace(entry.backup_file, entry.file)
+
+            else:
+                entry.file.unlink(missing_ok=True)
+
+    def _sync_directories(self, entries: List["XmlBatchWriter.Entry"]) -> None:
+        # renames are only durable once the containing directory has been synced, which Windows does not support
+        if platform.system() == "Windows":
+            return
+
+        for directory in set(entry.file.parent for entry in entries):
+            descriptor: int = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(descriptor)
+
+            finally:
+                os.close(descriptor)
+
+    @staticmethod
+    def _get_default_file_mode() -> int:
+        umask: int = os.umask(0)
+        os.umask(umask)
+
+        return 0o666 & ~umask
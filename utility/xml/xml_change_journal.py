@@ -0,0 +1,43 @@
+from typing import Callable, Dict, List, Optional
+
+from utility.xml.xml_node import XmlNode
+
+
+class XmlChangeJournal:
+    def __init__(self):
+        # the text of every changed node before its first change, in the order of the changes
+        self._original_texts: Dict[XmlNode, Optional[str]] = {}
+        self._listeners: List[Callable[[XmlNode], None]] = []
+
+    @property
+    def changed_nodes(self) -> List[XmlNode]:
+        return list(self._original_texts.keys())
+
+    def is_empty(self) -> bool:
+        return len(self._original_texts) < 1
+
+    def get_original_text(self, node: XmlNode) -> Optional[str]:
+        if node not in self._original_texts:
+            return node.text
+
+        return self._original_texts[node]
+
+    def add_listener(self, listener: Callable[[XmlNode], None]) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[XmlNode], None]) -> None:
+        self._listeners.remove(listener)
+
+    def record(self, node: XmlNode, previous_text: Optional[str]) -> None:
+        if node not in self._original_texts:
+            self._original_texts[node] = previous_text
+
+        elif node.text == self._original_texts[node]:
+            # the node has been changed back to its original text
+            del self._original_texts[node]
+
+        for listener in self._listeners:
+            listener(node)
+
+    def clear(self) -> None:
+        self._original_texts.clear()
@@ -1,11 +1,36 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
+from utility.xml.xml_change_journal import XmlChangeJournal
 from utility.xml.xml_node import XmlNode
+from utility.xml.xml_path import XmlPath
 
 
 class XmlDocument(ABC):
+    @property
+    def changed_nodes(self) -> List[XmlNode]:
+        return self._get_changed_nodes()
+
+    @abstractmethod
+    def _get_changed_nodes(self) -> List[XmlNode]:
+        raise NotImplementedError
+
+    @property
+    def is_dirty(self) -> bool:
+        return len(self.changed_nodes) > 0
+
+    def add_change_listener(self, listener: Callable[[XmlNode], None]) -> None:
+        # the listener is called with every node whose text is changed
+        self._get_change_journal().add_listener(listener)
+
+    def remove_change_listener(self, listener: Callable[[XmlNode], None]) -> None:
+        self._get_change_journal().remove_listener(listener)
+
+    @abstractmethod
+    def _get_change_journal(self) -> XmlChangeJournal:
+        raise NotImplementedError
+
     @abstractmethod
     def find_first_node(self, *path_segments: str) -> Optional[XmlNode]:
         raise NotImplementedError
@@ -15,5 +40,33 @@ class XmlDocument(ABC):
         raise NotImplementedError
 
     @abstractmethod
+    def query_first_node(self, path: XmlPath) -> Optional[XmlNode]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def query_all_nodes(self, path: XmlPath) -> List[XmlNode]:
+        raise NotImplementedError
+
+    def find_element_indices(self, nodes: List[XmlNode]) -> Optional[List[int]]:
+        # the position of every node among all elements of the document in document order, if known
+        return None
+
     def save(self, file: Path) -> None:
+        if not self.requires_save(file):
+            return
+
+        content: bytes = self.serialize()
+        file.write_bytes(content)
+        self.mark_saved(file, content)
+
+    @abstractmethod
+    def requires_save(self, file: Path) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def serialize(self) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def mark_saved(self, file: Path, content: bytes) -> None:
         raise NotImplementedError
@@ -1,8 +1,14 @@
+import sys
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utility.xml.xml_path import XmlPath
 
 
 class XmlNode(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -22,7 +28,15 @@ class XmlNode(ABC):
 
     @text.setter
     def text(self, text: str) -> None:
+        previous_text: Optional[str] = self._get_text()
+        if text == previous_text:
+            return
+
         self._set_text(text)
+        self._on_text_changed(previous_text)
+
+    def _on_text_changed(self, previous_text: Optional[str]) -> None:
+        pass
 
     @abstractmethod
     def _set_text(self, text: str) -> None:
@@ -43,3 +57,58 @@ class XmlNode(ABC):
     @abstractmethod
     def find_all_nodes(self, *path_segments: str) -> List["XmlNode"]:
         raise NotImplementedError
+
+    def query_first_node(self, path: XmlPath) -> Optional["XmlNode"]:
+        nodes: List[XmlNode] = self.query_all_nodes(path)
+        if len(nodes) < 1:
+            return None
+
+        return nodes[0]
+
+    def query_all_nodes(self, path: XmlPath) -> List["XmlNode"]:
+        result: List[XmlNode] = [self]
+        descendants: bool = False
+        for path_segment in path.segments:
+            if path_segment == XmlPath.DESCENDANTS:
+                descendants = True
+                continue
+
+            matching_nodes: Dict[int, XmlNode] = {}
+            for node in result:
+                candidates: Iterator[XmlNode] = (
+                    node._iter_descendants() if descendants else iter(node.nodes)
+                )
+                for candidate in candidates:
+                    if (
+                        path_segment != XmlPath.WILDCARD
+                        and candidate.name != path_segment
+                    ):
+                        continue
+
+                    if (
+                        path.namespace is not None
+                        and candidate.namespace != path.namespace
+                    ):
+                        continue
+
+                    matching_nodes.setdefault(id(candidate), candidate)
+
+            result = list(matching_nodes.values())
+            descendants = False
+
+        return result
+
+    def _iter_descendants(self) -> Iterator["XmlNode"]:
+        for node in self.nodes:
+            yield node
+            yield from node._iter_descendants()
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _split_qualified_name(qualified_name: str) -> Tuple[str, str]:
+        # the parts are interned, so that all nodes share one copy of e.g. the Maven namespace
+        if not qualified_name.startswith("{"):
+            return "", sys.intern(qualified_name)
+
+        namespace, _, name = qualified_name[1:].partition("}")
+        return sys.intern(namespace), sys.intern(name)
@@ -0,0 +1,98 @@
+import re
+from functools import lru_cache
+from re import Pattern
+from typing import ClassVar, Dict, List, Optional, Tuple
+
+
+class XmlPath:
+    WILDCARD: ClassVar[str] = "*"
+    DESCENDANTS: ClassVar[str] = "**"
+    SEGMENT_PATTERN: ClassVar[Pattern] = re.compile(r"^[^/\[\](){}@!=:'\"\s]+$")
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def compile(*path_segments: str, namespace: Optional[str] = None) -> "XmlPath":
+        return XmlPath(path_segments, namespace)
+
+    def __init__(self, path_segments: Tuple[str, ...], namespace: Optional[str] = None):
+        for path_segment in path_segments:
+            if XmlPath.SEGMENT_PATTERN.match(path_segment) is None:
+                raise AssertionError(f"Invalid XML path segment '{path_segment}'.")
+
+        if len(path_segments) > 0 and path_segments[-1] == XmlPath.DESCENDANTS:
+            raise AssertionError(
+                f"XML path must not end with '{XmlPath.DESCENDANTS}': {path_segments}."
+            )
+
+        self._segments: Tuple[str, ...] = path_segments
+        self._namespace: Optional[str] = namespace
+
+        # unqualified names match any namespace, unless an explicit namespace is given
+        self._namespaces: Dict[str, str] = {
+            "": namespace if namespace is not None else "*"
+        }
+        self._expression: str = XmlPath._to_expression(path_segments)
+
+    @property
+    def segments(self) -> Tuple[str, ...]:
+        return self._segments
+
+    @property
+    def namespace(self) -> Optional[str]:
+        return self._namespace
+
+    @property
+    def namespaces(self) -> Dict[str, str]:
+        return self._namespaces
+
+    @property
+    def expression(self) -> str:
+        return self._expression
+
+    def is_empty(self) -> bool:
+        return len(self._segments) < 1
+
+    def tail(self) -> "XmlPath":
+        return XmlPath.compile(*self._segments[1:], namespace=self._namespace)
+
+    def matches_first_segment(self, name: str, namespace: str = "") -> bool:
+        if self.is_empty():
+            return False
+
+        if self._namespace is not None and self._namespace != namespace:
+            return False
+
+        return self._segments[0] in (XmlPath.WILDCARD, XmlPath.DESCENDANTS, name)
+
+    @staticmethod
+    def _to_expression(path_segments: Tuple[str, ...]) -> str:
+        parts: List[str] = []
+        descendants: bool = False
+        for path_segment in path_segments:
+            if path_segment == XmlPath.DESCENDANTS:
+                descendants = True
+                continue
+
+            if descendants:
+                parts.append(
+                    f"/{path_segment}" if len(parts) > 0 else f".//{path_segment}"
+                )
+
+            else:
+                parts.append(path_segment)
+
+            descendants = False
+
+        return "/".join(parts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, XmlPath):
+            return False
+
+        return self._segments == other._segments and self._namespace == other._namespace
+
+    def __hash__(self) -> int:
+        return hash((self._segments, self._namespace))
+
+    def __str__(self) -> str:
+        return "/".join(self._segments)
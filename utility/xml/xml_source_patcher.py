@@ -0,0 +1,124 @@
+import re
+from re import Match, Pattern
+from typing import ClassVar, Dict, List, Optional, Tuple
+from xml.parsers import expat
+from xml.parsers.expat import XMLParserType
+from xml.sax.saxutils import escape
+
+
+class XmlSourcePatcher:
+    ENCODING_PATTERN: ClassVar[Pattern] = re.compile(
+        rb"^\s*<\?xml[^>]*?\sencoding\s*=\s*[\"']([^\"']+)[\"']"
+    )
+
+    class _StartsFound(Exception):
+        pass
+
+    def __init__(self, source: bytes):
+        self._source: bytes = source
+
+        match: Optional[Match] = XmlSourcePatcher.ENCODING_PATTERN.match(source)
+        self._encoding: str = (
+            match.group(1).decode("ascii") if match is not None else "UTF-8"
+        )
+
+    @property
+    def source(self) -> bytes:
+        return self._source
+
+    def patch(self, changes: List[Tuple[int, Optional[str]]]) -> bytes:
+        # every change replaces the text of the leaf element that starts at the given byte
+        result: List[bytes] = []
+        position: int = 0
+        for start, text in sorted(changes, key=lambda x: x[0]):
+            patch_start, patch_end, replacement = self._create_patch(start, text)
+            result.append(self._source[position:patch_start])
+            result.append(replacement)
+            position = patch_end
+
+        result.append(self._source[position:])
+
+        return b"".join(result)
+
+    def _create_patch(self, start: int, text: Optional[str]) -> Tuple[int, int, bytes]:
+        start_tag_end: int = self._find_start_tag_end(start)
+        content: bytes = escape(text if text is not None else "").encode(self._encoding)
+
+        if self._source[start_tag_end - 2 : start_tag_end] != b"/>":
+            return start_tag_end, self._find_end_tag_start(start_tag_end), content
+
+        # self-closing elements (e.g. '<version/>') need to be expanded
+        start_tag: bytes = self._source[start : start_tag_end - 2].rstrip()
+        name: bytes = start_tag[1:].split(maxsplit=1)[0]
+
+        return (
+            start,
+            start_tag_end,
+            b"".join([start_tag, b">", content, b"</", name, b">"]),
+        )
+
+    def _find_start_tag_end(self, start: int) -> int:
+        quote: Optional[int] = None
+        for index in range(start, len(self._source)):
+            character: int = self._source[index]
+            if quote is not None:
+                if character == quote:
+                    quote = None
+
+            elif character in b"\"'":
+                quote = character
+
+            elif character == ord(">"):
+                return index + 1
+
+        raise AssertionError(f"Unable to find end of XML tag starting at byte {start}.")
+
+    def _find_end_tag_start(self, start: int) -> int:
+        # leaf elements only contain text, CDATA sections, comments and processing instructions
+        index: int = start
+        while True:
+            index = self._source.index(b"<", index)
+            if self._source.startswith(b"<![CDATA[", index):
+                index = self._source.index(b"]]>", index) + 3
+
+            elif self._source.startswith(b"<?", index):
+                index = self._source.index(b"?>", index) + 2
+
+            else:
+                return index
+
+    def find_starts(
+        self, last_index: int, include_comments: bool = True
+    ) -> Optional[List[int]]:
+        # the start byte of every element (and comment) in document order, up to the given index
+        starts: List[int] = []
+        parser: XMLParserType = expat.ParserCreate()
+
+        def on_start(name: str, attributes: Dict[str, str]) -> None:
+            if len(starts) > last_index:
+                raise XmlSourcePatcher._StartsFound()
+
+            starts.append(parser.CurrentByteIndex)
+
+        def on_comment(data: str) -> None:
+            # just like the TreeBuilder, only comments within the root element are part of the tree
+            if len(starts) > 0:
+                on_start(data, {})
+
+        parser.StartElementHandler = on_start
+        if include_comments:
+            parser.CommentHandler = on_comment
+
+        try:
+            parser.Parse(self._source, True)
+
+        except XmlSourcePatcher._StartsFound:
+            pass
+
+        except expat.ExpatError:
+            return None
+
+        if len(starts) <= last_index:
+            return None
+
+        return starts